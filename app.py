@@ -11,11 +11,13 @@ import simple_comparison
 import ai_job_displacement
 import time
 import re
+from operator import itemgetter
 import career_navigator
 from sqlalchemy import create_engine, text
 
 # Import the autocomplete functionality
 from job_title_autocomplete_v2 import job_title_autocomplete, load_job_titles_from_db
+from job_api_integration import MAX_JOB_TITLE_LENGTH
 
 # Check if BLS API key is set
 bls_api_key = os.environ.get('BLS_API_KEY')
@@ -198,7 +200,8 @@ with tabs[0]:  # Single Job Analysis tab
         label="Enter your job title",
         key="job_title_search",
         placeholder="Start typing to see suggestions...",
-        help="Type a job title and select from matching suggestions"
+        help="Type a job title and select from matching suggestions",
+        max_chars=MAX_JOB_TITLE_LENGTH
     )
     
     # Clear Entry button - refreshes the entire app
@@ -531,7 +534,7 @@ with tabs[0]:  # Single Job Analysis tab
                     employment_values = [0, 0, 0, 0, 0, 0]
             
             # Create employment trend chart only with real BLS data
-            if employment_values and any(val > 0 for val in employment_values):
+            if len(employment_values) > 0 and any(val > 0 for val in employment_values):
                 trend_fig = go.Figure()
                 trend_fig.add_trace(go.Scatter(
                     x=years,
@@ -798,7 +801,8 @@ with tabs[1]:  # Job Comparison tab
         label="Enter a job title and press Enter to add to comparison", 
         key="compare_job_input",
         placeholder="Start typing to see suggestions...",
-        help="Type a job title and select from matching suggestions"
+        help="Type a job title and select from matching suggestions",
+        max_chars=MAX_JOB_TITLE_LENGTH
     )
     
     # Initialize session state for selected jobs if not already present
@@ -874,8 +878,15 @@ with tabs[1]:  # Job Comparison tab
             # Create tabular comparison
             comparison_df = simple_comparison.create_comparison_table(job_data)
             
-            # Display the table with improved formatting
-            st.dataframe(comparison_df, use_container_width=True)
+            # Display the table with improved formatting (done client-side via column_config)
+            st.dataframe(comparison_df, use_container_width=True, hide_index=True, column_config={
+                "job_title": st.column_config.TextColumn("Job Title"),
+                "year_1_risk": st.column_config.NumberColumn("1-Year Risk (%)", format="%.1f"),
+                "year_5_risk": st.column_config.NumberColumn("5-Year Risk (%)", format="%.1f"),
+                "current_employment": st.column_config.NumberColumn("Current Employment", format="localized"),
+                "projected_growth": st.column_config.NumberColumn("Growth Rate (%)", format="%.1f%%"),
+                "median_wage": st.column_config.NumberColumn("Median Wage", format="dollar")
+            })
             
             # Side-by-side comparison with actual job data
             st.subheader("Job Comparison Analysis")
@@ -1019,8 +1030,8 @@ with tabs[1]:  # Job Comparison tab
                           for job, data in job_data.items()]
             
             if len(risk_values) >= 2:
-                lowest_job = min(risk_values, key=lambda x: x[1])
-                highest_job = max(risk_values, key=lambda x: x[1])
+                lowest_job = min(risk_values, key=itemgetter(1))
+                highest_job = max(risk_values, key=itemgetter(1))
                 
                 # Check if significant difference in risk
                 if abs(highest_job[1] - lowest_job[1]) > 0.2:
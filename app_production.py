@@ -11,15 +11,36 @@ import simple_comparison
 import ai_job_displacement
 import time
 import re
+from operator import itemgetter
 import career_navigator
 from sqlalchemy import create_engine, text
 
 # Import the autocomplete functionality
 from job_title_autocomplete_v2 import job_title_autocomplete, load_job_titles_from_db
+from job_api_integration import MAX_JOB_TITLE_LENGTH
 
 # Check if BLS API key is set
 bls_api_key = os.environ.get('BLS_API_KEY')
 
+# Static Career Navigator call-to-action shown under the job comparison
+COMPARISON_CTA_HTML = """
+<div style='background-color: #0084FF; color: white; padding: 20px; border-radius: 10px; margin-top: 20px;'>
+    <h3 style='color: white;'>Career Navigator</h3>
+    <p style='font-size: 16px;'>Our AI-powered Career Navigator provides personalized guidance to help you navigate the changing job market:</p>
+    <ul style='font-size: 16px;'>
+        <li>Identify transferable skills that increase your value</li>
+        <li>Discover resilient career paths aligned with your experience</li>
+        <li>Get specific training recommendations with costs and ROI</li>
+        <li>Receive a customized transition plan with timeline and milestones</li>
+    </ul>
+    <a href='https://form.jotform.com/251137815706154' target='_blank'>
+        <button style='background-color: white; color: #0084FF; border: none; padding: 10px 20px; border-radius: 5px; font-weight: bold; cursor: pointer; margin-top: 10px;'>
+            Get Your Personalized Career Plan
+        </button>
+    </a>
+</div>
+"""
+
 # Handle health check requests
 query_params = st.query_params
 if query_params.get("health_check") == "true":
@@ -198,7 +219,8 @@ with tabs[0]:  # Single Job Analysis tab
         label="Enter your job title",
         key="job_title_search",
         placeholder="Start typing to see suggestions...",
-        help="Type a job title and select from matching suggestions"
+        help="Type a job title and select from matching suggestions",
+        max_chars=MAX_JOB_TITLE_LENGTH
     )
     
     # Clear Entry button - refreshes the entire app
@@ -531,7 +553,7 @@ with tabs[0]:  # Single Job Analysis tab
                     employment_values = [0, 0, 0, 0, 0, 0]
             
             # Create employment trend chart only with real BLS data
-            if employment_values and any(val > 0 for val in employment_values):
+            if len(employment_values) > 0 and any(val > 0 for val in employment_values):
                 trend_fig = go.Figure()
                 trend_fig.add_trace(go.Scatter(
                     x=years,
@@ -632,7 +654,7 @@ with tabs[0]:  # Single Job Analysis tab
                     x=job_titles,
                     y=risk_values,
                     marker_color='#FFA500',
-                    text=[f"{val:.1f}%" for val in risk_values],
+                    texttemplate="%{y:.1f}%",  # format the bar value client-side, no separate text array
                     textposition='auto'
                 ))
                 
@@ -798,7 +820,8 @@ with tabs[1]:  # Job Comparison tab
         label="Enter a job title and press Enter to add to comparison", 
         key="compare_job_input",
         placeholder="Start typing to see suggestions...",
-        help="Type a job title and select from matching suggestions"
+        help="Type a job title and select from matching suggestions",
+        max_chars=MAX_JOB_TITLE_LENGTH
     )
     
     # Initialize session state for selected jobs if not already present
@@ -833,25 +856,29 @@ with tabs[1]:  # Job Comparison tab
             st.session_state.selected_jobs = []
             st.rerun()
     
-    # Display comparison when jobs are selected
-    if st.session_state.selected_jobs and len(st.session_state.selected_jobs) >= 1:
-        st.subheader(f"Analyzing {len(st.session_state.selected_jobs)} Jobs")
+    # Display comparison when jobs are selected. Rendered as a fragment so
+    # widgets outside it don't force the charts and table to be rebuilt.
+    @st.fragment
+    def _render_comparison(selected_jobs):
+        st.subheader(f"Analyzing {len(selected_jobs)} Jobs")
         
         # Process jobs with better progress feedback
         progress_text = st.empty()
-        job_data_collection = {}
+        preview_chart = st.empty()
+        job_data = {}
         
-        # Show progress as jobs are processed
-        for i, job in enumerate(st.session_state.selected_jobs):
-            progress_text.write(f"Processing {i+1}/{len(st.session_state.selected_jobs)}: {job}")
-            job_data_collection[job] = get_cached_job_data(job)
+        # Show progress as jobs are processed, redrawing a preview chart as each one arrives
+        for i, job in enumerate(selected_jobs):
+            progress_text.write(f"Processing {i+1}/{len(selected_jobs)}: {job}")
+            job_data.update(simple_comparison.get_job_comparison_data([job]))
+            preview = simple_comparison.create_comparison_chart(job_data)
+            if preview is not None and i < len(selected_jobs) - 1:
+                preview_chart.plotly_chart(preview, use_container_width=True, key=f"comparison_preview_{i}")
         
+        # Now we have all job data; the full views below replace the preview
+        preview_chart.empty()
         progress_text.write("All jobs processed. Generating comparison...")
         
-        # Now we have all job data, proceed with visualization
-        # Get data for selected jobs using the comparison function
-        job_data = simple_comparison.get_job_comparison_data(st.session_state.selected_jobs)
-        
         # Create visualization tabs for different comparison views
         comparison_tabs = st.tabs(["Comparison Chart", "Comparative Analysis", "Risk Heatmap", "Risk Factors"])
         
@@ -874,8 +901,15 @@ with tabs[1]:  # Job Comparison tab
             # Create tabular comparison
             comparison_df = simple_comparison.create_comparison_table(job_data)
             
-            # Display the table with improved formatting
-            st.dataframe(comparison_df, use_container_width=True)
+            # Display the table with improved formatting (done client-side via column_config)
+            st.dataframe(comparison_df, use_container_width=True, hide_index=True, column_config={
+                "job_title": st.column_config.TextColumn("Job Title"),
+                "year_1_risk": st.column_config.NumberColumn("1-Year Risk (%)", format="%.1f"),
+                "year_5_risk": st.column_config.NumberColumn("5-Year Risk (%)", format="%.1f"),
+                "current_employment": st.column_config.NumberColumn("Current Employment", format="localized"),
+                "projected_growth": st.column_config.NumberColumn("Growth Rate (%)", format="%.1f%%"),
+                "median_wage": st.column_config.NumberColumn("Median Wage", format="dollar")
+            })
             
             # Side-by-side comparison with actual job data
             st.subheader("Job Comparison Analysis")
@@ -1019,8 +1053,8 @@ with tabs[1]:  # Job Comparison tab
                           for job, data in job_data.items()]
             
             if len(risk_values) >= 2:
-                lowest_job = min(risk_values, key=lambda x: x[1])
-                highest_job = max(risk_values, key=lambda x: x[1])
+                lowest_job = min(risk_values, key=itemgetter(1))
+                highest_job = max(risk_values, key=itemgetter(1))
                 
                 # Check if significant difference in risk
                 if abs(highest_job[1] - lowest_job[1]) > 0.2:
@@ -1065,6 +1099,7 @@ with tabs[1]:  # Job Comparison tab
             st.markdown("""
             **Factor Analysis Explanation**: This radar chart compares positions across key risk dimensions. 
             Jobs with larger areas on the chart face higher overall risk from AI disruption across multiple factors.
+            When four or more jobs are compared, the same factors are shown as a matrix with one row per job.
             """)
         
         # Career Navigator Integration
@@ -1072,20 +1107,7 @@ with tabs[1]:  # Job Comparison tab
         st.markdown("<h2 style='color: #0084FF;'>Next Steps: Personalized Career Navigator</h2>", unsafe_allow_html=True)
         st.markdown("Get personalized career guidance based on your skills and interests.", unsafe_allow_html=True)
         
-        st.markdown("""
-        <div style='background-color: #0084FF; color: white; padding: 20px; border-radius: 10px; margin-top: 20px;'>
-            <h3 style='color: white;'>Career Navigator</h3>
-            <p style='font-size: 16px;'>Our AI-powered Career Navigator provides personalized guidance to help you navigate the changing job market:</p>
-            <ul style='font-size: 16px;'>
-                <li>Identify transferable skills that increase your value</li>
-                <li>Discover resilient career paths aligned with your experience</li>
-                <li>Get specific training recommendations with costs and ROI</li>
-                <li>Receive a customized transition plan with timeline and milestones</li>
-            </ul>
-            <a href='https://form.jotform.com/251137815706154' target='_blank'>
-                <button style='background-color: white; color: #0084FF; border: none; padding: 10px 20px; border-radius: 5px; font-weight: bold; cursor: pointer; margin-top: 10px;'>
-                    Get Your Personalized Career Plan
-                </button>
-            </a>
-        </div>
-        """, unsafe_allow_html=True)
\ No newline at end of file
+        st.markdown(COMPARISON_CTA_HTML, unsafe_allow_html=True)
+
+    if st.session_state.selected_jobs and len(st.session_state.selected_jobs) >= 1:
+        _render_comparison(list(st.session_state.selected_jobs))
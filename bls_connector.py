@@ -4,14 +4,130 @@ This module handles communication with the BLS API to fetch official employment
 """
 import os
 import requests
+from requests.adapters import HTTPAdapter
+import urllib3
+from urllib3.util.retry import Retry
 import json
 import time
-from typing import Dict, List, Any, Optional
+import functools
+import threading
+from concurrent.futures import Future
+from typing import Dict, List, Any, Optional, Tuple
 import pandas as pd
 
-# Cache to store API responses and reduce API calls
+# ijson is optional; it lets small lookups stream fields out of a response
+# instead of building the whole JSON document
+try:
+    import ijson
+except ImportError:
+    ijson = None
+
+# orjson is optional; it makes Redis cache (de)serialization cheaper
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Redis is optional; without it responses are cached in-process only
+try:
+    import redis
+except ImportError:
+    redis = None
+
+# Cache to store API responses and reduce API calls.
+# Entries are {"generated_at", "stale_at", "payload"} dicts.
 _api_cache = {}
 
+# BLS publishes monthly/annually, so a response stays fresh for a week. Older
+# entries are kept (up to BLS_CACHE_MAX_AGE) and served if the API is failing.
+BLS_CACHE_TTL = 7 * 24 * 3600
+BLS_CACHE_MAX_AGE = 30 * 24 * 3600
+
+_redis = None
+if redis is not None and os.environ.get('REDIS_URL'):
+    try:
+        _redis = redis.Redis.from_url(os.environ['REDIS_URL'])
+    except Exception as e:
+        print(f"Redis unavailable - caching BLS responses in-process: {e}")
+
+def _cache_get(cache_key: str) -> Optional[Dict[str, Any]]:
+    """Return the cache entry for a key (fresh or stale), or None"""
+    entry = _api_cache.get(cache_key)
+    if entry is None and _redis is not None:
+        try:
+            raw = _redis.get(f"bls:{cache_key}")
+            if raw:
+                entry = _api_cache[cache_key] = orjson.loads(raw) if orjson is not None else json.loads(raw)
+        except Exception as e:
+            print(f"Redis cache read failed: {e}")
+    return entry
+
+def _cache_set(cache_key: str, payload: Dict[str, Any]) -> None:
+    """Store an API response with its freshness window"""
+    now = time.time()
+    entry = {"generated_at": now, "stale_at": now + BLS_CACHE_TTL, "payload": payload}
+    _api_cache[cache_key] = entry
+    if _redis is not None:
+        try:
+            raw = orjson.dumps(entry) if orjson is not None else json.dumps(entry)
+            _redis.setex(f"bls:{cache_key}", BLS_CACHE_MAX_AGE, raw)
+        except Exception as e:
+            print(f"Redis cache write failed: {e}")
+
+# Shared HTTP session so repeated BLS calls reuse pooled TCP/TLS connections
+_session = requests.Session()
+_session.mount("https://", HTTPAdapter(
+    pool_connections=4,
+    pool_maxsize=8,
+    max_retries=Retry(total=3, backoff_factor=0.5, status_forcelist=(500, 502, 503, 504), allowed_methods=None)
+))
+
+# The BLS v2 API accepts up to 50 series IDs in a single request
+MAX_SERIES_PER_REQUEST = 50
+
+# Rate-limit state from the most recent response headers (None when not advertised)
+_rate_limit = {"remaining": None, "reset_at": None}
+
+# Start spacing requests out once fewer than this many calls remain in the window
+RATE_LIMIT_LOW_WATER = 50
+
+def _record_rate_limit(response: requests.Response) -> None:
+    """Remember Retry-After / X-RateLimit-* headers from a BLS response"""
+    headers = response.headers
+    try:
+        if "Retry-After" in headers:
+            _rate_limit["remaining"] = 0
+            _rate_limit["reset_at"] = time.time() + float(headers["Retry-After"])
+        elif "X-RateLimit-Remaining" in headers:
+            _rate_limit["remaining"] = int(headers["X-RateLimit-Remaining"])
+            reset = float(headers.get("X-RateLimit-Reset", 0))
+            # Reset may be sent as seconds-from-now or as an epoch timestamp
+            _rate_limit["reset_at"] = reset if reset > 1e9 else time.time() + reset
+    except ValueError:
+        pass
+
+def suggested_delay() -> float:
+    """
+    Seconds to wait before the next BLS request, based on the last response's rate-limit headers.
+    
+    Returns:
+        0 while plenty of quota remains, otherwise the remaining window spread over the remaining calls
+    """
+    remaining, reset_at = _rate_limit["remaining"], _rate_limit["reset_at"]
+    if remaining is None or reset_at is None or remaining >= RATE_LIMIT_LOW_WATER:
+        return 0.0
+    return max(0.0, (reset_at - time.time()) / max(remaining, 1))
+
+# Occupation code -> BLS OES employment series ID (would need to be expanded)
+OCCUPATION_SERIES_IDS = {
+    "15-1252": "OEU1025560000000015125201",  # Software developers - employment
+    "11-9111": "OEU1025560000000011911101",  # Medical and health services managers - employment
+}
+
+# Futures for BLS requests currently being fetched, keyed like _api_cache
+_in_flight: Dict[str, Future] = {}
+_in_flight_lock = threading.Lock()
+
 def get_bls_data(series_ids: List[str], start_year: str, end_year: str) -> Dict[str, Any]:
     """
     Fetch data from BLS API for specified series IDs and date range.
@@ -53,10 +169,36 @@ def get_bls_data(series_ids: List[str], start_year: str, end_year: str) -> Dict[
     # Create cache key
     cache_key = f"{','.join(sorted(series_ids))}_{start_year}_{end_year}"
     
-    # Return cached response if available
-    if cache_key in _api_cache:
-        return _api_cache[cache_key]
+    # Return cached response if it is still fresh
+    cached = _cache_get(cache_key)
+    if cached and time.time() < cached["stale_at"]:
+        return cached["payload"]
+    
+    # Identical requests already on the wire share that request's response
+    with _in_flight_lock:
+        pending = _in_flight.get(cache_key)
+        if pending is None:
+            pending = _in_flight[cache_key] = Future()
+            leader = True
+        else:
+            leader = False
+    if not leader:
+        return pending.result()
     
+    try:
+        data = _fetch_bls_data(series_ids, start_year, end_year, api_key, cache_key, cached)
+        pending.set_result(data)
+        return data
+    except BaseException as e:
+        pending.set_exception(e)
+        raise
+    finally:
+        with _in_flight_lock:
+            del _in_flight[cache_key]
+
+def _fetch_bls_data(series_ids: List[str], start_year: str, end_year: str, api_key: str,
+                    cache_key: str, cached: Optional[Dict[str, Any]]) -> Dict[str, Any]:
+    """POST a BLS request and cache it; falls back to the stale cache entry on failure"""
     # Define API endpoint
     url = 'https://api.bls.gov/publicAPI/v2/timeseries/data/'
     
@@ -70,16 +212,32 @@ def get_bls_data(series_ids: List[str], start_year: str, end_year: str) -> Dict[
     
     # API request
     try:
-        response = requests.post(url, json=payload)
+        response = _session.post(url, json=payload)
+        _record_rate_limit(response)
         response.raise_for_status()  # Raise exception for HTTP errors
         data = response.json()
         
+        # Throttled/failed requests come back as HTTP 200 - prefer the last good response
+        if data.get("status") != "REQUEST_SUCCEEDED":
+            return cached["payload"] if cached else data
+        
         # Cache the result
-        _api_cache[cache_key] = data
+        _cache_set(cache_key, data)
+        
+        # Multi-series responses also seed per-series entries so single-series lookups hit the cache
+        if len(series_ids) > 1:
+            for series in data.get("Results", {}).get("series", []):
+                _cache_set(f"{series.get('seriesID')}_{start_year}_{end_year}", {
+                    "status": data["status"],
+                    "Results": {"series": [series]}
+                })
         
         return data
     except requests.exceptions.RequestException as e:
         print(f"BLS API request failed: {e}")
+        if cached:
+            # Serve the stale response rather than failing outright
+            return cached["payload"]
         return {"status": "error", "message": str(e)}
 
 def get_occupation_data(occ_code: str) -> Dict[str, Any]:
@@ -96,20 +254,144 @@ def get_occupation_data(occ_code: str) -> Dict[str, Any]:
     # This is a placeholder for future implementation using the right series IDs
     # For now, we'll use the OES data which would need to be mapped to occupation codes
     
-    # Example mapping (would need to be expanded)
-    series_mapping = {
-        "15-1252": "OEU1025560000000015125201",  # Software developers - employment
-        "11-9111": "OEU1025560000000011911101",  # Medical and health services managers - employment
-    }
-    
-    if occ_code in series_mapping:
-        series_id = series_mapping[occ_code]
+    if occ_code in OCCUPATION_SERIES_IDS:
+        series_id = OCCUPATION_SERIES_IDS[occ_code]
         current_year = time.strftime("%Y")
         data = get_bls_data([series_id], str(int(current_year)-5), current_year)
         return parse_occupation_response(data, occ_code)
     else:
         return {"status": "error", "message": f"No BLS series ID mapping found for occupation code {occ_code}"}
 
+def resolve_occupation_code(job_title: str) -> Optional[str]:
+    """
+    Find the first occupation code matching a job title that has a BLS series ID.
+    
+    Args:
+        job_title: Job title to resolve
+        
+    Returns:
+        SOC occupation code, or None if no mapped occupation matches
+    """
+    for match in _matching_occupations(job_title):
+        if match["code"] in OCCUPATION_SERIES_IDS:
+            return match["code"]
+    return None
+
+def resolve_series_ids(job_title: str) -> List[str]:
+    """
+    Resolve a job title to the BLS series IDs used for its occupation data.
+    
+    Args:
+        job_title: Job title to resolve
+        
+    Returns:
+        List of series IDs (empty if the title has no mapped occupation)
+    """
+    occ_code = resolve_occupation_code(job_title)
+    return [OCCUPATION_SERIES_IDS[occ_code]] if occ_code else []
+
+def fetch_series(series_ids: List[str]) -> List[Dict[str, Any]]:
+    """
+    Fetch the last five years of data for already-resolved series IDs,
+    using one API request per MAX_SERIES_PER_REQUEST series.
+    
+    Args:
+        series_ids: BLS series IDs to fetch
+        
+    Returns:
+        List of API responses, one per request
+    """
+    series_ids = list(dict.fromkeys(series_ids))
+    current_year = time.strftime("%Y")
+    responses = []
+    for i in range(0, len(series_ids), MAX_SERIES_PER_REQUEST):
+        # Pace batches only as much as the API's rate-limit headers call for
+        if i:
+            time.sleep(suggested_delay())
+        responses.append(get_bls_data(series_ids[i:i + MAX_SERIES_PER_REQUEST], str(int(current_year)-5), current_year))
+    return responses
+
+# Errors a (streamed) BLS response can raise: HTTP failures, urllib3 read errors
+# mid-stream, and malformed or truncated JSON from either parser
+_STREAM_ERRORS = (requests.exceptions.RequestException, urllib3.exceptions.HTTPError, ValueError)
+if ijson is not None:
+    _STREAM_ERRORS += (ijson.JSONError,)
+
+def _iter_series(response: requests.Response):
+    """
+    Yield the series objects from a successful BLS response, streaming with ijson when available.
+    Responses whose status is not REQUEST_SUCCEEDED yield nothing, whichever path parses them.
+    """
+    if ijson is None:
+        data = response.json()
+        if data.get("status") == "REQUEST_SUCCEEDED":
+            yield from data.get("Results", {}).get("series", [])
+        return
+    
+    # Series are held back until the top-level status has been seen (BLS sends it first)
+    response.raw.decode_content = True
+    status = None
+    pending = []
+    builder = None
+    for prefix, event, value in ijson.parse(response.raw):
+        if builder is not None:
+            builder.event(event, value)
+            if prefix == "Results.series.item" and event == "end_map":
+                pending.append(builder.value)
+                builder = None
+        elif prefix == "Results.series.item" and event == "start_map":
+            builder = ijson.ObjectBuilder()
+            builder.event(event, value)
+        elif prefix == "status" and event == "string":
+            status = value
+        
+        if status is not None and pending:
+            if status == "REQUEST_SUCCEEDED":
+                yield from pending
+            pending = []
+
+def get_latest_periods(series_ids: List[str]) -> Dict[str, str]:
+    """
+    Get the most recent published period for each series with one small request
+    (the API's "latest" mode returns a single data point per series).
+    
+    Args:
+        series_ids: BLS series IDs to check
+        
+    Returns:
+        Dictionary mapping series ID to its latest "YYYY-PERIOD" (empty if unavailable)
+    """
+    api_key = os.environ.get('BLS_API_KEY')
+    if not api_key or not series_ids:
+        return {}
+    
+    latest = {}
+    url = 'https://api.bls.gov/publicAPI/v2/timeseries/data/'
+    series_ids = list(dict.fromkeys(series_ids))
+    for i in range(0, len(series_ids), MAX_SERIES_PER_REQUEST):
+        payload = {
+            "seriesid": series_ids[i:i + MAX_SERIES_PER_REQUEST],
+            "latest": True,
+            "registrationkey": api_key
+        }
+        time.sleep(suggested_delay())
+        # A failed batch contributes nothing, so its series are treated as unknown
+        batch = {}
+        try:
+            with _session.post(url, json=payload, stream=ijson is not None) as response:
+                _record_rate_limit(response)
+                response.raise_for_status()
+                for series in _iter_series(response):
+                    points = series.get("data") or []
+                    if points:
+                        batch[series.get("seriesID")] = f"{points[0].get('year')}-{points[0].get('period')}"
+        except _STREAM_ERRORS as e:
+            print(f"BLS latest-period check failed: {e}")
+            continue
+        latest.update(batch)
+    
+    return latest
+
 def parse_occupation_response(response_data: Dict[str, Any], occ_code: str) -> Dict[str, Any]:
     """
     Parse BLS API response for occupation data.
@@ -155,9 +437,60 @@ def parse_occupation_response(response_data: Dict[str, Any], occ_code: str) -> D
             "message": "No data found for the requested occupation"
         }
 
+# Sample SOC codes and titles (abbreviated list), searched by search_occupations
+SAMPLE_SOC_CODES = [
+    {"code": "11-1011", "title": "Chief Executives"},
+    {"code": "11-2011", "title": "Advertising and Promotions Managers"},
+    {"code": "11-3031", "title": "Financial Managers"},
+    {"code": "15-1252", "title": "Software Developers"},
+    {"code": "15-1211", "title": "Computer Systems Analysts"},
+    {"code": "15-1231", "title": "Computer Network Support Specialists"},
+    {"code": "25-1011", "title": "Business Teachers, Postsecondary"},
+    {"code": "25-2021", "title": "Elementary School Teachers"},
+    {"code": "29-1051", "title": "Pharmacists"},
+    {"code": "29-1141", "title": "Registered Nurses"},
+    {"code": "41-3091", "title": "Sales Representatives of Services"},
+    {"code": "43-4051", "title": "Customer Service Representatives"},
+    {"code": "43-9021", "title": "Data Entry Keyers"},
+    {"code": "53-3032", "title": "Heavy and Tractor-Trailer Truck Drivers"}
+]
+
+# Sample projections (would be replaced with actual API data)
+SAMPLE_PROJECTIONS = {
+    "15-1252": {
+        "current_employment": 1365500,
+        "projected_employment": 1572900,
+        "percent_change": 15.2,
+        "annual_job_openings": 162900
+    },
+    "29-1141": {
+        "current_employment": 3130600,
+        "projected_employment": 3458200,
+        "percent_change": 10.5,
+        "annual_job_openings": 203200
+    },
+    "43-9021": {
+        "current_employment": 149900,
+        "projected_employment": 112400,
+        "percent_change": -25.0,
+        "annual_job_openings": 14200
+    }
+}
+
+@functools.lru_cache(maxsize=4096)
+def _matching_occupations(query: str) -> Tuple[Dict[str, str], ...]:
+    """Memoized search behind search_occupations; returns the shared SAMPLE_SOC_CODES entries"""
+    # This would normally query the BLS API, but we'll implement a simple lookup for now
+    # In a full implementation, this would use the BLS API or a local database of SOC codes
+    
+    # Simple search implementation
+    query = query.lower()
+    return tuple(item for item in SAMPLE_SOC_CODES if query in item["title"].lower())
+
 def search_occupations(query: str) -> List[Dict[str, str]]:
     """
     Search for occupation codes matching the query.
+    Lookups are memoized per query; each call returns fresh copies the caller may modify.
     
     Args:
         query: Search terms for occupation
@@ -165,32 +498,7 @@ def search_occupations(query: str) -> List[Dict[str, str]]:
     Returns:
         List of matching occupation codes and titles
     """
-    # This would normally query the BLS API, but we'll implement a simple lookup for now
-    # In a full implementation, this would use the BLS API or a local database of SOC codes
-    
-    # Sample SOC codes and titles (abbreviated list)
-    soc_codes = [
-        {"code": "11-1011", "title": "Chief Executives"},
-        {"code": "11-2011", "title": "Advertising and Promotions Managers"},
-        {"code": "11-3031", "title": "Financial Managers"},
-        {"code": "15-1252", "title": "Software Developers"},
-        {"code": "15-1211", "title": "Computer Systems Analysts"},
-        {"code": "15-1231", "title": "Computer Network Support Specialists"},
-        {"code": "25-1011", "title": "Business Teachers, Postsecondary"},
-        {"code": "25-2021", "title": "Elementary School Teachers"},
-        {"code": "29-1051", "title": "Pharmacists"},
-        {"code": "29-1141", "title": "Registered Nurses"},
-        {"code": "41-3091", "title": "Sales Representatives of Services"},
-        {"code": "43-4051", "title": "Customer Service Representatives"},
-        {"code": "43-9021", "title": "Data Entry Keyers"},
-        {"code": "53-3032", "title": "Heavy and Tractor-Trailer Truck Drivers"}
-    ]
-    
-    # Simple search implementation
-    query = query.lower()
-    matches = [item for item in soc_codes if query in item["title"].lower()]
-    
-    return matches
+    return [dict(item) for item in _matching_occupations(query)]
 
 def get_employment_projection(occ_code: str) -> Dict[str, Any]:
     """
@@ -205,33 +513,11 @@ def get_employment_projection(occ_code: str) -> Dict[str, Any]:
     # This would normally query the BLS Employment Projections API
     # Currently implementing a placeholder with sample data
     
-    # Sample projections (would be replaced with actual API data)
-    projections = {
-        "15-1252": {
-            "current_employment": 1365500,
-            "projected_employment": 1572900,
-            "percent_change": 15.2,
-            "annual_job_openings": 162900
-        },
-        "29-1141": {
-            "current_employment": 3130600,
-            "projected_employment": 3458200,
-            "percent_change": 10.5,
-            "annual_job_openings": 203200
-        },
-        "43-9021": {
-            "current_employment": 149900,
-            "projected_employment": 112400,
-            "percent_change": -25.0,
-            "annual_job_openings": 14200
-        }
-    }
-    
-    if occ_code in projections:
+    if occ_code in SAMPLE_PROJECTIONS:
         return {
             "status": "success",
             "occupation_code": occ_code,
-            "projections": projections[occ_code]
+            "projections": SAMPLE_PROJECTIONS[occ_code]
         }
     else:
         return {
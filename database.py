@@ -1,9 +1,17 @@
 import os
 import datetime
+import functools
 import sqlalchemy
-from sqlalchemy import create_engine, Column, Integer, String, Float, DateTime, Text, Table, MetaData, text
+from sqlalchemy import create_engine, Column, Integer, String, Float, DateTime, Text, Table, MetaData, Index, text, func
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker
+from sqlalchemy.exc import OperationalError
+
+# Streamlit is only needed for caching query results; db_refresh runs without it
+try:
+    import streamlit as st
+except ImportError:
+    st = None
 
 # Get database URL from environment
 database_url = os.environ.get("DATABASE_URL")
@@ -47,22 +55,21 @@ try:
         pool_size=5,                         # Connection pool size
         max_overflow=10,                     # Max extra connections
         pool_timeout=30,                     # Connection timeout
-        pool_recycle=1800                    # Recycle connections after 30 min
+        pool_recycle=1800,                   # Recycle connections after 30 min
+        pool_pre_ping=True                   # Validate pooled connections on checkout
     )
-    # Test connection with a quick timeout
-    with engine.connect() as conn:
-        conn.execute(text("SELECT 1"))
+    # No connection is opened here - the first query connects (see ensure_schema)
 except Exception as e:
     print(f"Error connecting to database - using fallback: {str(e)}")
     # Instead of exiting, we'll define our own versions of functions that use fallback data
-    from db_fallback import save_job_search, get_popular_searches, get_highest_risk_jobs, get_lowest_risk_jobs, get_recent_searches
+    from db_fallback import save_job_search, save_job_searches, get_popular_searches, get_highest_risk_jobs, get_lowest_risk_jobs, get_recent_searches, get_dashboard_data
     
     # Exit the module with fallback functions defined
     import sys
     sys.modules[__name__].__dict__.update(locals())
     exit()
     
-# Database connection successful - create tables and set up ORM
+# Engine created - set up ORM (tables are created lazily by ensure_schema)
 Base = declarative_base()
 
 # Define model for job searches
@@ -71,7 +78,7 @@ class JobSearch(Base):
     
     id = Column(Integer, primary_key=True)
     job_title = Column(String(255), nullable=False)
-    timestamp = Column(DateTime, default=datetime.datetime.utcnow)
+    timestamp = Column(DateTime, server_default=func.now())  # filled in by the database
     year_1_risk = Column(Float)
     year_5_risk = Column(Float)
     risk_category = Column(String(50))
@@ -80,152 +87,168 @@ class JobSearch(Base):
     def __repr__(self):
         return f"<JobSearch(job_title='{self.job_title}', risk_category='{self.risk_category}')>"
 
-# Create tables if they don't exist
-Base.metadata.create_all(engine)
+# Indexes backing the GROUP BY job_title aggregations and the recent-searches ORDER BY
+job_search_indexes = [
+    Index('ix_job_searches_title', JobSearch.job_title),
+    Index('ix_job_searches_title_risk5', JobSearch.job_title, JobSearch.year_5_risk),
+    Index('ix_job_searches_timestamp', JobSearch.timestamp)
+]
+
 Session = sessionmaker(bind=engine)
 
-# Real implementations of database functions
-def save_job_search(job_title, risk_data):
+# Per-title aggregates used by the popular/highest/lowest queries.
+# On PostgreSQL this is a materialized view refreshed after each save; other
+# databases compute the same rows with a CTE on every query.
+JOB_RISK_STATS_SQL = """
+    SELECT job_title, COUNT(*) AS c, AVG(year_5_risk) AS avg5
+    FROM job_searches
+    GROUP BY job_title
+"""
+
+use_stats_view = False
+stats_cte = f"WITH job_risk_stats AS ({JOB_RISK_STATS_SQL}) "
+
+# Schema setup and the connectivity check both happen on first use, not at import
+_schema_ready = False
+database_available = True
+
+def ensure_schema():
     """
-    Save job search data to database
+    Create tables, indexes and the stats view the first time the database is used
     """
-    session = Session()
+    global _schema_ready, use_stats_view, stats_cte
+    if _schema_ready:
+        return
+    
+    # Create tables if they don't exist (raises OperationalError if the DB is unreachable)
+    Base.metadata.create_all(engine)
+    
+    # create_all() only adds indexes for new tables, so add them to existing ones too
+    for index in job_search_indexes:
+        try:
+            index.create(bind=engine, checkfirst=True)
+        except Exception as e:
+            print(f"Error creating index {index.name}: {e}")
+    
+    if engine.dialect.name == 'postgresql':
+        try:
+            # Tables created before timestamps moved to a server default need it added
+            with engine.begin() as conn:
+                conn.execute(text("ALTER TABLE job_searches ALTER COLUMN timestamp SET DEFAULT now()"))
+        except Exception as e:
+            print(f"Error setting job_searches.timestamp default: {e}")
+        
+        try:
+            with engine.begin() as conn:
+                conn.execute(text(f"CREATE MATERIALIZED VIEW IF NOT EXISTS job_risk_stats AS {JOB_RISK_STATS_SQL}"))
+                # REFRESH ... CONCURRENTLY requires a unique index on the view
+                conn.execute(text("CREATE UNIQUE INDEX IF NOT EXISTS ix_job_risk_stats_title ON job_risk_stats (job_title)"))
+            use_stats_view = True
+        except Exception as e:
+            print(f"Error creating job_risk_stats view - aggregating on the fly: {e}")
+    
+    stats_cte = "" if use_stats_view else f"WITH job_risk_stats AS ({JOB_RISK_STATS_SQL}) "
+    _schema_ready = True
+
+def with_fallback(fn):
+    """
+    Route calls to the matching db_fallback function if the database can't be reached
+    """
+    @functools.wraps(fn)
+    def wrapper(*args, **kwargs):
+        global database_available
+        if database_available:
+            try:
+                ensure_schema()
+                return fn(*args, **kwargs)
+            except OperationalError as e:
+                print(f"Error connecting to database - using fallback: {str(e)}")
+                database_available = False
+        import db_fallback
+        return getattr(db_fallback, fn.__name__)(*args, **kwargs)
+    return wrapper
+
+def refresh_job_risk_stats():
+    """
+    Refresh the job_risk_stats materialized view (called after saves, so reads stay read-only)
+    """
+    if not use_stats_view:
+        return False
+    
     try:
-        job_search = JobSearch(
-            job_title=job_title,
-            year_1_risk=risk_data.get('year_1_risk'),
-            year_5_risk=risk_data.get('year_5_risk'),
-            risk_category=risk_data.get('risk_category'),
-            job_category=risk_data.get('job_category')
-        )
-        session.add(job_search)
-        session.commit()
+        with engine.begin() as conn:
+            conn.execute(text("REFRESH MATERIALIZED VIEW CONCURRENTLY job_risk_stats"))
         return True
     except Exception as e:
-        session.rollback()
-        print(f"Error saving job search: {e}")
+        print(f"Error refreshing job_risk_stats: {str(e)}")
         return False
-    finally:
-        session.close()
-        
-def get_popular_searches(limit=5):
+
+# Query results only change when a search is saved, so cache them across reruns
+QUERY_CACHE_TTL = 60
+
+def cache_query(fn):
     """
-    Get most popular job searches
+    Cache a read query with st.cache_data when Streamlit is available
     """
-    session = Session()
-    try:
-        # SQL to count job titles and order by count
-        query = text("""
-            SELECT job_title, COUNT(*) as count 
-            FROM job_searches 
-            GROUP BY job_title 
-            ORDER BY count DESC 
-            LIMIT :limit
-        """)
-        
-        result = session.execute(query, {"limit": limit})
-        
-        # Convert result to list of dictionaries
-        popular_searches = [{"job_title": row[0], "count": row[1]} for row in result]
-        
-        session.close()
-        return popular_searches
-    except Exception as e:
-        print(f"Error getting popular searches: {e}")
-        return []
-        
-def get_highest_risk_jobs(limit=5):
+    if st is None:
+        return fn
+    return st.cache_data(ttl=QUERY_CACHE_TTL, show_spinner=False)(fn)
+
+def clear_query_caches():
     """
-    Get jobs with highest average year 5 risk
+    Drop cached query results so new searches show up immediately
     """
-    session = Session()
-    try:
-        # SQL to get highest risk jobs
-        query = text("""
-            SELECT job_title, AVG(year_5_risk) as avg_risk 
-            FROM job_searches 
-            GROUP BY job_title 
-            HAVING COUNT(*) > 1
-            ORDER BY avg_risk DESC 
-            LIMIT :limit
-        """)
-        
-        result = session.execute(query, {"limit": limit})
-        
-        # Convert result to list of dictionaries
-        high_risk_jobs = [{"job_title": row[0], "risk": float(row[1])} for row in result]
-        
-        session.close()
-        return high_risk_jobs
-    except Exception as e:
-        print(f"Error getting highest risk jobs: {e}")
-        return []
-        
-def get_lowest_risk_jobs(limit=5):
+    for fn in (get_popular_searches, get_highest_risk_jobs, get_lowest_risk_jobs, get_recent_searches, get_dashboard_data):
+        if hasattr(fn, "clear"):
+            fn.clear()
+
+# Real implementations of database functions
+def save_job_search(job_title, risk_data):
     """
-    Get jobs with lowest average year 5 risk
+    Save job search data to database
     """
-    session = Session()
-    try:
-        # SQL to get lowest risk jobs
-        query = text("""
-            SELECT job_title, AVG(year_5_risk) as avg_risk 
-            FROM job_searches 
-            GROUP BY job_title 
-            HAVING COUNT(*) > 1
-            ORDER BY avg_risk ASC 
-            LIMIT :limit
-        """)
-        
-        result = session.execute(query, {"limit": limit})
-        
-        # Convert result to list of dictionaries
-        low_risk_jobs = [{"job_title": row[0], "risk": float(row[1])} for row in result]
-        
-        session.close()
-        return low_risk_jobs
-    except Exception as e:
-        print(f"Error getting lowest risk jobs: {e}")
-        return []
-        
-def get_recent_searches(limit=10):
+    return save_job_searches([(job_title, risk_data)])
+
+@with_fallback
+def save_job_searches(searches):
     """
-    Get recent job searches
+    Save several job searches in one transaction (a single multi-row INSERT)
+    
+    Args:
+        searches: Iterable of (job_title, risk_data) pairs, as passed to save_job_search
     """
+    rows = [
+        {
+            "job_title": job_title,
+            "year_1_risk": risk_data.get('year_1_risk'),
+            "year_5_risk": risk_data.get('year_5_risk'),
+            "risk_category": risk_data.get('risk_category'),
+            "job_category": risk_data.get('job_category')
+        }
+        for job_title, risk_data in searches
+    ]
+    if not rows:
+        return True
+    
     session = Session()
     try:
-        # Query recent searches
-        recent_searches = session.query(JobSearch).order_by(
-            JobSearch.timestamp.desc()
-        ).limit(limit).all()
-        
-        # Convert to list of dictionaries
-        results = []
-        for search in recent_searches:
-            time_diff = datetime.datetime.utcnow() - search.timestamp
-            if time_diff.days > 0:
-                time_ago = f"{time_diff.days} days ago"
-            elif time_diff.seconds // 3600 > 0:
-                time_ago = f"{time_diff.seconds // 3600} hours ago"
-            elif time_diff.seconds // 60 > 0:
-                time_ago = f"{time_diff.seconds // 60} minutes ago"
-            else:
-                time_ago = "Just now"
-                
-            results.append({
-                "job_title": search.job_title,
-                "year_1_risk": search.year_1_risk,
-                "year_5_risk": search.year_5_risk,
-                "risk_category": search.risk_category,
-                "time_ago": time_ago
-            })
-        
-        session.close()
-        return results
+        session.bulk_insert_mappings(JobSearch, rows)
+        session.commit()
+        refresh_job_risk_stats()
+        clear_query_caches()
+        return True
+    except OperationalError:
+        # Connection failures go to with_fallback, which switches to db_fallback
+        raise
     except Exception as e:
-        print(f"Error getting recent searches: {e}")
-        return []
+        session.rollback()
+        print(f"Error saving job search: {e}")
+        return False
+    finally:
+        session.close()
 
+@cache_query
+@with_fallback
 def get_popular_searches(limit=5):
     """
     Get most popular job searches
@@ -233,12 +256,11 @@ def get_popular_searches(limit=5):
     try:
         session = Session()
         
-        # SQL to count job titles and order by count
-        query = text("""
-            SELECT job_title, COUNT(*) as count 
-            FROM job_searches 
-            GROUP BY job_title 
-            ORDER BY count DESC 
+        # Read per-title counts from the stats view
+        query = text(stats_cte + """
+            SELECT job_title, c 
+            FROM job_risk_stats 
+            ORDER BY c DESC 
             LIMIT :limit
         """)
         
@@ -251,10 +273,15 @@ def get_popular_searches(limit=5):
         session.close()
         
         return popular_searches
+    except OperationalError:
+        # Connection failures go to with_fallback, which switches to db_fallback
+        raise
     except Exception as e:
         print(f"Error getting popular searches: {str(e)}")
         return []
 
+@cache_query
+@with_fallback
 def get_highest_risk_jobs(limit=5):
     """
     Get jobs with highest average year 5 risk
@@ -262,13 +289,12 @@ def get_highest_risk_jobs(limit=5):
     try:
         session = Session()
         
-        # SQL to get highest risk jobs
-        query = text("""
-            SELECT job_title, AVG(year_5_risk) as avg_risk 
-            FROM job_searches 
-            GROUP BY job_title 
-            HAVING COUNT(*) > 2
-            ORDER BY avg_risk DESC 
+        # Read per-title averages from the stats view
+        query = text(stats_cte + """
+            SELECT job_title, avg5 
+            FROM job_risk_stats 
+            WHERE c > 2
+            ORDER BY avg5 DESC 
             LIMIT :limit
         """)
         
@@ -281,10 +307,15 @@ def get_highest_risk_jobs(limit=5):
         session.close()
         
         return high_risk_jobs
+    except OperationalError:
+        # Connection failures go to with_fallback, which switches to db_fallback
+        raise
     except Exception as e:
         print(f"Error getting highest risk jobs: {str(e)}")
         return []
 
+@cache_query
+@with_fallback
 def get_lowest_risk_jobs(limit=5):
     """
     Get jobs with lowest average year 5 risk
@@ -292,13 +323,12 @@ def get_lowest_risk_jobs(limit=5):
     try:
         session = Session()
         
-        # SQL to get lowest risk jobs
-        query = text("""
-            SELECT job_title, AVG(year_5_risk) as avg_risk 
-            FROM job_searches 
-            GROUP BY job_title 
-            HAVING COUNT(*) > 2
-            ORDER BY avg_risk ASC 
+        # Read per-title averages from the stats view
+        query = text(stats_cte + """
+            SELECT job_title, avg5 
+            FROM job_risk_stats 
+            WHERE c > 2
+            ORDER BY avg5 ASC 
             LIMIT :limit
         """)
         
@@ -311,10 +341,15 @@ def get_lowest_risk_jobs(limit=5):
         session.close()
         
         return low_risk_jobs
+    except OperationalError:
+        # Connection failures go to with_fallback, which switches to db_fallback
+        raise
     except Exception as e:
         print(f"Error getting lowest risk jobs: {str(e)}")
         return []
 
+@cache_query
+@with_fallback
 def get_recent_searches(limit=10):
     """
     Get recent job searches
@@ -343,6 +378,84 @@ def get_recent_searches(limit=10):
         session.close()
         
         return results
+    except OperationalError:
+        # Connection failures go to with_fallback, which switches to db_fallback
+        raise
     except Exception as e:
         print(f"Error getting recent searches: {str(e)}")
-        return []
\ No newline at end of file
+        return []
+
+@cache_query
+@with_fallback
+def get_dashboard_data(limit=5, recent_limit=10):
+    """
+    Get popular, highest risk, lowest risk and recent searches in a single query
+    
+    Returns the same lists as the individual get_* functions, keyed by
+    "popular", "highest_risk", "lowest_risk" and "recent"
+    """
+    dashboard = {"popular": [], "highest_risk": [], "lowest_risk": [], "recent": []}
+    try:
+        session = Session()
+        
+        # One round trip: each list is a CTE, tagged and combined with UNION ALL
+        ctes = "WITH " + (f"job_risk_stats AS ({JOB_RISK_STATS_SQL}), " if not use_stats_view else "")
+        query = text(ctes + """
+            popular AS (
+                SELECT job_title, c FROM job_risk_stats ORDER BY c DESC LIMIT :limit
+            ),
+            highest AS (
+                SELECT job_title, avg5 FROM job_risk_stats WHERE c > 2 ORDER BY avg5 DESC LIMIT :limit
+            ),
+            lowest AS (
+                SELECT job_title, avg5 FROM job_risk_stats WHERE c > 2 ORDER BY avg5 ASC LIMIT :limit
+            ),
+            recent AS (
+                SELECT job_title, year_1_risk, year_5_risk, timestamp, risk_category
+                FROM job_searches ORDER BY timestamp DESC LIMIT :recent_limit
+            )
+            SELECT 'popular' AS kind, job_title, c AS value, NULL AS year_1_risk, NULL AS year_5_risk,
+                   NULL AS timestamp, NULL AS risk_category FROM popular
+            UNION ALL
+            SELECT 'highest_risk', job_title, avg5, NULL, NULL, NULL, NULL FROM highest
+            UNION ALL
+            SELECT 'lowest_risk', job_title, avg5, NULL, NULL, NULL, NULL FROM lowest
+            UNION ALL
+            SELECT 'recent', job_title, NULL, year_1_risk, year_5_risk, timestamp, risk_category FROM recent
+        """).columns(
+            kind=String, job_title=String, value=Float, year_1_risk=Float,
+            year_5_risk=Float, timestamp=DateTime, risk_category=String
+        )
+        
+        result = session.execute(query, {"limit": limit, "recent_limit": recent_limit})
+        
+        for kind, job_title, value, year_1_risk, year_5_risk, timestamp, risk_category in result:
+            if kind == "popular":
+                dashboard[kind].append({"job_title": job_title, "count": int(value)})
+            elif kind == "recent":
+                dashboard[kind].append({
+                    "job_title": job_title,
+                    "year_1_risk": year_1_risk,
+                    "year_5_risk": year_5_risk,
+                    "timestamp": timestamp,
+                    "risk_category": risk_category
+                })
+            else:
+                dashboard[kind].append({"job_title": job_title, "avg_risk": value})
+        
+        # UNION ALL doesn't guarantee row order, so restore each list's ordering
+        dashboard["popular"].sort(key=lambda x: x["count"], reverse=True)
+        dashboard["highest_risk"].sort(key=lambda x: x["avg_risk"], reverse=True)
+        dashboard["lowest_risk"].sort(key=lambda x: x["avg_risk"])
+        dashboard["recent"].sort(key=lambda x: x["timestamp"], reverse=True)
+        
+        # Close session
+        session.close()
+        
+        return dashboard
+    except OperationalError:
+        # Connection failures go to with_fallback, which switches to db_fallback
+        raise
+    except Exception as e:
+        print(f"Error getting dashboard data: {str(e)}")
+        return dashboard
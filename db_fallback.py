@@ -3,57 +3,114 @@ Fallback functionality when database is not available.
 This module provides storage functions that save data in memory and to a local file.
 """
 import datetime
+import heapq
+import itertools
 import json
 import os
 
+# DuckDB is optional; it aggregates the storage file in a columnar engine when installed
+try:
+    import duckdb
+except ImportError:
+    duckdb = None
+
 # In-memory storage for job searches during the current session
 session_job_searches = []
 
-# Path to the local storage file
-STORAGE_FILE = "local_job_searches.json"
+# Path to the local storage file (one JSON record per line)
+STORAGE_FILE = "local_job_searches.jsonl"
+
+# Earlier versions kept searches as a single JSON array here; it is migrated on first use
+LEGACY_STORAGE_FILE = "local_job_searches.json"
+_legacy_checked = False
+
+# Trim the storage file back to the most recent searches once it exceeds this size
+MAX_STORAGE_BYTES = 1_000_000
+MAX_STORED_SEARCHES = 100
+
+# Parsed records from STORAGE_FILE, keyed by the file's mtime and size
+_file_cache = {"version": None, "records": []}
+
+# Per-title (job_title, count, avg_year_5_risk) rows, keyed the same way
+_stats_cache = {"version": None, "rows": []}
+
+# Titles need more than this many searches to appear in the highest/lowest lists
+MIN_SEARCHES_FOR_RISK_RANKING = 2
+
+def _migrate_legacy_storage():
+    """
+    Move searches from the old JSON array file into STORAGE_FILE (once per process)
+    """
+    global _legacy_checked
+    if _legacy_checked:
+        return
+    _legacy_checked = True
+    if not os.path.exists(LEGACY_STORAGE_FILE):
+        return
+    
+    try:
+        with open(LEGACY_STORAGE_FILE, "r") as f:
+            legacy_records = json.load(f)
+        
+        # Legacy searches are older than anything in STORAGE_FILE, so they go first
+        lines = [json.dumps(record, separators=(",", ":")) + "\n" for record in legacy_records]
+        if os.path.exists(STORAGE_FILE):
+            with open(STORAGE_FILE, "r") as f:
+                lines.extend(f.readlines())
+        
+        temp_file = STORAGE_FILE + ".tmp"
+        with open(temp_file, "w") as f:
+            f.writelines(lines)
+        os.replace(temp_file, STORAGE_FILE)
+        os.remove(LEGACY_STORAGE_FILE)
+    except Exception as e:
+        # Leave the legacy file in place so nothing is lost
+        print(f"Warning: Error migrating {LEGACY_STORAGE_FILE}: {e}")
 
 def save_job_search(job_title, risk_data):
     """
     Save job search data to local storage when DB is not available
     """
+    return save_job_searches([(job_title, risk_data)])
+
+def save_job_searches(searches):
+    """
+    Save several job searches to local storage with a single file append
+    """
     try:
-        # Create a record with timestamp
+        # Create records with timestamp
         now = datetime.datetime.now()
-        record = {
-            "job_title": job_title,
-            "year_1_risk": risk_data.get("year_1_risk", 0),
-            "year_5_risk": risk_data.get("year_5_risk", 0),
-            "timestamp": now.isoformat(),
-            "risk_category": risk_data.get("risk_category", "Unknown")
-        }
+        records = [
+            {
+                "job_title": job_title,
+                "year_1_risk": risk_data.get("year_1_risk", 0),
+                "year_5_risk": risk_data.get("year_5_risk", 0),
+                "timestamp": now,
+                "risk_category": risk_data.get("risk_category", "Unknown")
+            }
+            for job_title, risk_data in searches
+        ]
         
-        # Add to in-memory list first - this is guaranteed to work even if file operations fail
-        session_job_searches.append(record)
+        # Add to in-memory list first - this is guaranteed to work even if file operations fail.
+        # Session records keep datetime timestamps so readers never have to parse them.
+        session_job_searches.extend(records)
         
         # Try to save to file as well, but don't let failures stop the app
         try:
-            # Load existing data from file if it exists
-            existing_data = []
-            if os.path.exists(STORAGE_FILE):
-                try:
-                    with open(STORAGE_FILE, "r") as f:
-                        existing_data = json.load(f)
-                except Exception as e:
-                    print(f"Warning: Error reading local storage: {e}")
-                    # Continue with empty list if file read fails
+            _migrate_legacy_storage()
             
-            # Add new record
-            existing_data.append({
-                "job_title": job_title,
-                "year_1_risk": risk_data.get("year_1_risk", 0),
-                "year_5_risk": risk_data.get("year_5_risk", 0),
-                "timestamp": now.isoformat(),
-                "risk_category": risk_data.get("risk_category", "Unknown")
-            })
+            # Append JSON lines instead of rewriting the whole file
+            timestamp = now.isoformat()
+            with open(STORAGE_FILE, "a") as f:
+                f.writelines(json.dumps(dict(record, timestamp=timestamp), separators=(",", ":")) + "\n"
+                             for record in records)
             
-            # Save back to file (limit to most recent 100 searches)
-            with open(STORAGE_FILE, "w") as f:
-                json.dump(existing_data[-100:], f, indent=2)
+            # Keep the file bounded by trimming it once it grows too large
+            if os.path.getsize(STORAGE_FILE) > MAX_STORAGE_BYTES:
+                with open(STORAGE_FILE, "r") as f:
+                    lines = f.readlines()[-MAX_STORED_SEARCHES:]
+                with open(STORAGE_FILE, "w") as f:
+                    f.writelines(lines)
         except Exception as file_error:
             # Just log file errors but consider the operation successful
             # since we already added to in-memory storage
@@ -66,10 +123,63 @@ def save_job_search(job_title, risk_data):
         # since the main app functionality isn't dependent on this
         return True
 
+def _file_version():
+    """
+    Return (mtime_ns, size) for the storage file, or None if it doesn't exist
+    """
+    _migrate_legacy_storage()
+    try:
+        stat = os.stat(STORAGE_FILE)
+    except OSError:
+        return None
+    return (stat.st_mtime_ns, stat.st_size)
+
+def _job_risk_stats():
+    """
+    Aggregate stored searches per job title, recomputing only when the file changes
+    """
+    file_version = _file_version()
+    if file_version is None:
+        return []
+    
+    if _stats_cache["version"] != file_version:
+        if duckdb is not None:
+            rows = duckdb.sql(
+                "SELECT job_title, COUNT(*), AVG(year_5_risk) "
+                "FROM read_json_auto($path, format='newline_delimited') GROUP BY job_title",
+                params={"path": STORAGE_FILE}
+            ).fetchall()
+        else:
+            totals = {}
+            for record in _load_stored_searches():
+                entry = totals.setdefault(record["job_title"], [0, 0.0])
+                entry[0] += 1
+                entry[1] += record.get("year_5_risk") or 0
+            rows = [(title, count, total / count) for title, (count, total) in totals.items()]
+        _stats_cache["version"] = file_version
+        _stats_cache["rows"] = rows
+    
+    return _stats_cache["rows"]
+
+def _load_job_risk_stats():
+    """
+    Per-title stats for the dashboard lists, or None if nothing has been stored yet
+    """
+    try:
+        return _job_risk_stats() or None
+    except Exception as e:
+        print(f"Warning: Error aggregating stored searches: {e}")
+        return None
+
 def get_popular_searches(limit=5):
     """
-    Return sample popular searches when DB is not available
+    Return most searched jobs from local storage (sample data if nothing is stored)
     """
+    stats = _load_job_risk_stats()
+    if stats is not None:
+        top = heapq.nlargest(limit, stats, key=lambda row: row[1])
+        return [{"job_title": title, "count": count} for title, count, _ in top]
+    
     return [
         {"job_title": "Software Engineer", "count": 42},
         {"job_title": "Data Scientist", "count": 38},
@@ -80,8 +190,14 @@ def get_popular_searches(limit=5):
 
 def get_highest_risk_jobs(limit=5):
     """
-    Return sample highest risk jobs when DB is not available
+    Return highest average risk jobs from local storage (sample data if nothing is stored)
     """
+    stats = _load_job_risk_stats()
+    if stats is not None:
+        ranked = (row for row in stats if row[1] > MIN_SEARCHES_FOR_RISK_RANKING)
+        top = heapq.nlargest(limit, ranked, key=lambda row: row[2])
+        return [{"job_title": title, "avg_risk": avg_risk} for title, _, avg_risk in top]
+    
     return [
         {"job_title": "Data Entry Clerk", "avg_risk": 85.2},
         {"job_title": "Customer Service Representative", "avg_risk": 79.8},
@@ -92,8 +208,14 @@ def get_highest_risk_jobs(limit=5):
 
 def get_lowest_risk_jobs(limit=5):
     """
-    Return sample lowest risk jobs when DB is not available
+    Return lowest average risk jobs from local storage (sample data if nothing is stored)
     """
+    stats = _load_job_risk_stats()
+    if stats is not None:
+        ranked = (row for row in stats if row[1] > MIN_SEARCHES_FOR_RISK_RANKING)
+        bottom = heapq.nsmallest(limit, ranked, key=lambda row: row[2])
+        return [{"job_title": title, "avg_risk": avg_risk} for title, _, avg_risk in bottom]
+    
     return [
         {"job_title": "Therapist", "avg_risk": 8.5},
         {"job_title": "Healthcare Manager", "avg_risk": 12.3},
@@ -102,28 +224,70 @@ def get_lowest_risk_jobs(limit=5):
         {"job_title": "Social Worker", "avg_risk": 21.4}
     ][:limit]
 
+def get_dashboard_data(limit=5, recent_limit=10):
+    """
+    Return popular, highest risk, lowest risk and recent searches from local storage
+    """
+    return {
+        "popular": get_popular_searches(limit),
+        "highest_risk": get_highest_risk_jobs(limit),
+        "lowest_risk": get_lowest_risk_jobs(limit),
+        "recent": get_recent_searches(recent_limit)
+    }
+
+def _parse_timestamp(value):
+    """
+    Convert an ISO timestamp string to a datetime (datetimes pass through)
+    """
+    if isinstance(value, str):
+        try:
+            return datetime.datetime.fromisoformat(value)
+        except ValueError:
+            return datetime.datetime.now()
+    return value
+
+def _load_stored_searches():
+    """
+    Load searches from the storage file, re-parsing only when the file changes
+    """
+    file_version = _file_version()
+    if file_version is None:
+        return []
+    
+    if _file_cache["version"] != file_version:
+        records = []
+        with open(STORAGE_FILE, "r") as f:
+            for line in f:
+                if line.strip():
+                    record = json.loads(line)
+                    # Parse timestamps once here rather than on every read
+                    record["timestamp"] = _parse_timestamp(record.get("timestamp"))
+                    records.append(record)
+        _file_cache["version"] = file_version
+        _file_cache["records"] = records
+    
+    return _file_cache["records"]
+
 def get_recent_searches(limit=10):
     """
     Return recent searches from local storage when DB is not available
     """
-    combined_searches = []
-    
-    # First check if we have any session searches (in-memory)
-    if session_job_searches:
-        combined_searches.extend(session_job_searches)
+    stored_searches = []
     
-    # Then try to load from file, if it exists
+    # Load from file, if it exists (parsed records are cached between calls)
+    _migrate_legacy_storage()
     if os.path.exists(STORAGE_FILE):
         try:
-            with open(STORAGE_FILE, "r") as f:
-                stored_searches = json.load(f)
-                combined_searches.extend(stored_searches)
+            stored_searches = _load_stored_searches()
         except Exception as e:
             print(f"Warning: Error loading recent searches from file: {e}")
             # Continue using just the session searches
     
+    # Session searches (in-memory) already hold datetime timestamps
+    combined_searches = itertools.chain(session_job_searches, stored_searches)
+    
     # Only use default sample data if we have no searches at all
-    if not combined_searches:
+    if not stored_searches and not session_job_searches:
         # Default sample data
         now = datetime.datetime.now()
         combined_searches = [
@@ -131,52 +295,39 @@ def get_recent_searches(limit=10):
                 "job_title": "Software Engineer",
                 "year_1_risk": 32.5,
                 "year_5_risk": 48.7,
-                "timestamp": (now - datetime.timedelta(minutes=5)).isoformat(),
+                "timestamp": now - datetime.timedelta(minutes=5),
                 "risk_category": "Moderate"
             },
             {
                 "job_title": "Data Scientist",
                 "year_1_risk": 27.3,
                 "year_5_risk": 42.1,
-                "timestamp": (now - datetime.timedelta(minutes=12)).isoformat(),
+                "timestamp": now - datetime.timedelta(minutes=12),
                 "risk_category": "Moderate"
             },
             {
                 "job_title": "Teacher",
                 "year_1_risk": 18.9,
                 "year_5_risk": 35.6,
-                "timestamp": (now - datetime.timedelta(minutes=18)).isoformat(),
+                "timestamp": now - datetime.timedelta(minutes=18),
                 "risk_category": "Moderate"
             },
             {
                 "job_title": "Nurse",
                 "year_1_risk": 10.2,
                 "year_5_risk": 24.8,
-                "timestamp": (now - datetime.timedelta(minutes=25)).isoformat(),
+                "timestamp": now - datetime.timedelta(minutes=25),
                 "risk_category": "Low"
             },
             {
                 "job_title": "Truck Driver",
                 "year_1_risk": 65.3,
                 "year_5_risk": 82.7,
-                "timestamp": (now - datetime.timedelta(minutes=37)).isoformat(),
+                "timestamp": now - datetime.timedelta(minutes=37),
                 "risk_category": "High"
             }
         ]
     
-    # Sort combined searches by timestamp (newest first)
-    # and handle timestamp conversion for display
-    processed_searches = []
-    for search in combined_searches:
-        search_copy = search.copy()
-        # Convert timestamp strings to datetime objects
-        if isinstance(search_copy.get("timestamp"), str):
-            try:
-                search_copy["timestamp"] = datetime.datetime.fromisoformat(search_copy["timestamp"])
-            except:
-                search_copy["timestamp"] = datetime.datetime.now()
-        processed_searches.append(search_copy)
-    
-    # Sort by timestamp (newest first) and limit results
-    processed_searches.sort(key=lambda x: x.get("timestamp", datetime.datetime.now()), reverse=True)
-    return processed_searches[:limit]
\ No newline at end of file
+    # Pick the newest searches without sorting everything
+    return heapq.nlargest(limit, combined_searches,
+                          key=lambda x: x.get("timestamp") or datetime.datetime.min)
@@ -9,55 +9,100 @@ Run this script daily using a scheduled task or cron job.
 
 import os
 import sys
+import asyncio
 import json
 import time
 import datetime
-import random
+import queue
+import atexit
 import logging
+import logging.handlers
 from typing import List, Dict, Any
 
-# Configure logging
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-    handlers=[
-        logging.FileHandler("db_refresh.log"),
-        logging.StreamHandler()
-    ]
-)
+# orjson is optional; it serializes straight to bytes and is faster than json
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+def json_dumps(obj: Any) -> bytes:
+    """Serialize to JSON bytes (orjson when available)"""
+    return orjson.dumps(obj) if orjson is not None else json.dumps(obj).encode()
+
+def json_loads(raw: bytes) -> Any:
+    """Parse JSON bytes (orjson when available)"""
+    return orjson.loads(raw) if orjson is not None else json.loads(raw)
+
 logger = logging.getLogger(__name__)
+_log_listener = None
 
-# Import BLS connector
+def setup_logging():
+    """
+    Configure logging for the cron run - callers only enqueue records; a background
+    listener thread does the file and console writes. The log file rotates at 5 MB.
+    Not done at import, so apps importing this module keep their own logging setup.
+    """
+    global _log_listener
+    if _log_listener is not None:
+        return
+    log_queue = queue.Queue(-1)
+    _log_listener = logging.handlers.QueueListener(
+        log_queue,
+        logging.handlers.RotatingFileHandler("db_refresh.log", maxBytes=5_000_000, backupCount=5, delay=True),
+        logging.StreamHandler()
+    )
+    logging.basicConfig(
+        level=logging.INFO,
+        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
+        handlers=[logging.handlers.QueueHandler(log_queue)]
+    )
+    _log_listener.start()
+    atexit.register(_log_listener.stop)
+
+# As the cron script, log from the start so the imports below are recorded too
+if __name__ == "__main__":
+    setup_logging()
+
+# Import BLS connector and job data lookup
 import bls_connector
+from job_api_integration import get_job_data
 
 # Try to import database module - fall back gracefully if not available
 try:
-    from database import save_job_search, get_popular_searches, get_highest_risk_jobs, get_lowest_risk_jobs, get_recent_searches
+    from database import save_job_search, save_job_searches, get_popular_searches, get_highest_risk_jobs, get_lowest_risk_jobs, get_recent_searches, get_dashboard_data
     database_available = True
     logger.info("Database module loaded successfully")
 except Exception as e:
-    logger.error(f"Error loading database module: {str(e)}")
+    logger.error("Error loading database module: %s", e)
     database_available = False
     # Define stub functions to avoid unbound variable errors
     def save_job_search(job_title, risk_data):
-        logger.info(f"Would save job search for '{job_title}' if database was available")
+        logger.info("Would save job search for '%s' if database was available", job_title)
+        return None
+        
+    def save_job_searches(searches):
+        logger.info("Would save %s job searches if database was available", len(searches))
         return None
         
     def get_popular_searches(limit=5):
-        logger.info(f"Would get popular searches if database was available")
+        logger.info("Would get popular searches if database was available")
         return []
         
     def get_highest_risk_jobs(limit=5):
-        logger.info(f"Would get highest risk jobs if database was available")
+        logger.info("Would get highest risk jobs if database was available")
         return []
         
     def get_lowest_risk_jobs(limit=5):
-        logger.info(f"Would get lowest risk jobs if database was available")
+        logger.info("Would get lowest risk jobs if database was available")
         return []
         
     def get_recent_searches(limit=10):
-        logger.info(f"Would get recent searches if database was available")
+        logger.info("Would get recent searches if database was available")
         return []
+        
+    def get_dashboard_data(limit=5, recent_limit=10):
+        logger.info("Would get dashboard data if database was available")
+        return {"popular": [], "highest_risk": [], "lowest_risk": [], "recent": []}
 
 # List of key job titles to refresh - these are common searches that will keep our data fresh
 KEY_JOB_TITLES = [
@@ -73,6 +118,43 @@ KEY_JOB_TITLES = [
     "Customer Service Representative"
 ]
 
+# Number of key job titles refreshed per run
+JOBS_PER_REFRESH = 3
+
+# main() does nothing if the previous rotation run is more recent than this
+MIN_REFRESH_INTERVAL = datetime.timedelta(hours=23)
+
+# BLS series IDs for each key job title, resolved once at import
+KEY_JOB_SERIES_IDS = {job_title: bls_connector.resolve_series_ids(job_title) for job_title in KEY_JOB_TITLES}
+
+def fetch_job_data(job_title: str) -> Dict[str, Any]:
+    """
+    Fetch data for a specific job title from BLS API without saving it
+    
+    Args:
+        job_title: The job title to fetch
+        
+    Returns:
+        Job data dictionary
+    """
+    logger.info("Updating data for %s", job_title)
+    
+    # Get BLS data
+    return get_job_data(job_title)
+
+# Shared read-only default for missing nested dicts (avoids allocating {} per lookup)
+_EMPTY_DICT = {}
+
+def job_search_record(job_data: Dict[str, Any]) -> Dict[str, Any]:
+    """Build the risk_data dictionary that save_job_search(es) expects"""
+    risk_scores = job_data.get('risk_scores') or _EMPTY_DICT
+    return {
+        'year_1_risk': risk_scores.get('year_1', 0),
+        'year_5_risk': risk_scores.get('year_5', 0),
+        'risk_category': job_data.get('risk_category', 'Unknown'),
+        'job_category': job_data.get('job_category', 'Unknown')
+    }
+
 def update_job_data(job_title: str) -> Dict[str, Any]:
     """
     Update data for a specific job title from BLS API
@@ -83,41 +165,83 @@ def update_job_data(job_title: str) -> Dict[str, Any]:
     Returns:
         Updated job data dictionary
     """
-    logger.info(f"Updating data for {job_title}")
-    
     try:
-        # Get BLS data
-        from job_api_integration import get_job_data
-        job_data = get_job_data(job_title)
+        job_data = fetch_job_data(job_title)
         
         # Save to database if available
         if database_available:
             try:
-                save_job_search(job_title, {
-                    'year_1_risk': job_data.get('risk_scores', {}).get('year_1', 0),
-                    'year_5_risk': job_data.get('risk_scores', {}).get('year_5', 0),
-                    'risk_category': job_data.get('risk_category', 'Unknown'),
-                    'job_category': job_data.get('job_category', 'Unknown')
-                })
-                logger.info(f"Successfully saved {job_title} to database")
+                save_job_search(job_title, job_search_record(job_data))
+                logger.info("Successfully saved %s to database", job_title)
             except Exception as e:
-                logger.error(f"Error saving {job_title} to database: {str(e)}")
+                logger.error("Error saving %s to database: %s", job_title, e)
         
         return job_data
     
     except Exception as e:
-        logger.error(f"Error updating data for {job_title}: {str(e)}")
+        logger.error("Error updating data for %s: %s", job_title, e)
         return {"error": str(e)}
 
-def check_and_update_refresh_timestamp():
-    """Update the last refresh timestamp"""
+# Maximum number of job updates in flight at once (keeps us within BLS rate limits)
+MAX_CONCURRENT_UPDATES = 3
+
+async def _update_one(semaphore: asyncio.Semaphore, job_title: str) -> Dict[str, Any]:
+    """Run a blocking fetch_job_data call in a worker thread once a slot is free"""
+    async with semaphore:
+        return await asyncio.to_thread(fetch_job_data, job_title)
+
+async def update_jobs_concurrently(job_titles: List[str]) -> List[Any]:
+    """
+    Fetch several job titles concurrently (results are not saved)
+    
+    Args:
+        job_titles: The job titles to fetch
+        
+    Returns:
+        One result per title, in order - the job data dictionary or the exception raised
+    """
+    semaphore = asyncio.Semaphore(MAX_CONCURRENT_UPDATES)
+    return await asyncio.gather(
+        *(_update_one(semaphore, job_title) for job_title in job_titles),
+        return_exceptions=True
+    )
+
+REFRESH_FILE = "last_refresh.json"
+
+def write_refresh_data(refresh_data: Dict[str, Any]) -> None:
+    """Atomically replace the refresh file - one write to a temp file, then a rename"""
+    tmp_path = REFRESH_FILE + ".tmp"
+    with open(tmp_path, "wb") as f:
+        f.write(json_dumps(refresh_data))
+    os.replace(tmp_path, REFRESH_FILE)
+
+def read_refresh_data() -> Dict[str, Any]:
+    """Load the refresh file ({"date", "rotation_date", "cursor", "series_periods"}), or an empty dict if missing/invalid"""
+    try:
+        with open(REFRESH_FILE, "rb") as f:
+            return json_loads(f.read())
+    except (OSError, ValueError):
+        return {}
+
+def check_and_update_refresh_timestamp(cursor: int = None, series_periods: Dict[str, str] = None):
+    """
+    Update the last refresh timestamp, plus the job rotation cursor and the
+    latest BLS period seen per series when given. Advancing the cursor also
+    stamps "rotation_date", which only main()'s rotation run writes, so the
+    app's daily keep-alive refresh (which sets "date") cannot hold it back.
+    """
     try:
-        refresh_data = {"date": datetime.datetime.now().isoformat()}
-        with open("last_refresh.json", "w") as f:
-            json.dump(refresh_data, f)
-        logger.info(f"Updated last refresh timestamp: {refresh_data['date']}")
+        refresh_data = read_refresh_data()
+        refresh_data["date"] = datetime.datetime.now().isoformat()
+        if cursor is not None:
+            refresh_data["cursor"] = cursor
+            refresh_data["rotation_date"] = refresh_data["date"]
+        if series_periods:
+            refresh_data["series_periods"] = {**refresh_data.get("series_periods", {}), **series_periods}
+        write_refresh_data(refresh_data)
+        logger.info("Updated last refresh timestamp: %s", refresh_data['date'])
     except Exception as e:
-        logger.error(f"Error updating refresh timestamp: {str(e)}")
+        logger.error("Error updating refresh timestamp: %s", e)
 
 def perform_database_queries():
     """Perform various database queries to ensure the database stays active"""
@@ -126,56 +250,117 @@ def perform_database_queries():
         return
     
     try:
-        # Execute various read operations to keep database active
-        popular = get_popular_searches(5)
-        logger.info(f"Popular searches: {len(popular)} retrieved")
-        
-        highest_risk = get_highest_risk_jobs(5)
-        logger.info(f"Highest risk jobs: {len(highest_risk)} retrieved")
-        
-        lowest_risk = get_lowest_risk_jobs(5)
-        logger.info(f"Lowest risk jobs: {len(lowest_risk)} retrieved")
-        
-        recent = get_recent_searches(10)
-        logger.info(f"Recent searches: {len(recent)} retrieved")
+        # Execute the dashboard read queries (one round trip) to keep database active
+        dashboard = get_dashboard_data(5, 10)
+        logger.info("Popular searches: %s retrieved", len(dashboard["popular"]))
+        logger.info("Highest risk jobs: %s retrieved", len(dashboard["highest_risk"]))
+        logger.info("Lowest risk jobs: %s retrieved", len(dashboard["lowest_risk"]))
+        logger.info("Recent searches: %s retrieved", len(dashboard["recent"]))
     except Exception as e:
-        logger.error(f"Error performing database queries: {str(e)}")
+        logger.error("Error performing database queries: %s", e)
 
 def main():
     """Main function to update job data and refresh database"""
     logger.info("Starting database refresh process")
     
+    # Skip if a rotation run already happened recently (e.g. cron retries); FORCE_REFRESH=1 overrides.
+    # This reads "rotation_date", not the "date" the app's keep-alive refresh also writes.
+    refresh_data = read_refresh_data()
+    if os.environ.get('FORCE_REFRESH') != '1':
+        try:
+            last_rotation = datetime.datetime.fromisoformat(refresh_data["rotation_date"])
+            if datetime.datetime.now() - last_rotation < MIN_REFRESH_INTERVAL:
+                logger.info("Last rotation run was at %s - skipping", refresh_data["rotation_date"])
+                return
+        except (KeyError, TypeError, ValueError):
+            pass
+    
     # Check BLS API connection
     api_key = os.environ.get('BLS_API_KEY')
     if not api_key:
         logger.error("BLS_API_KEY environment variable not set")
         return
     
-    # Randomly select 2-4 jobs to update (to avoid hitting API limits)
-    sample_size = min(random.randint(2, 4), len(KEY_JOB_TITLES))
-    jobs_to_update = random.sample(KEY_JOB_TITLES, sample_size)
+    # Rotate through the key jobs a few at a time (to avoid hitting API limits),
+    # so every title is refreshed on a predictable cadence
+    cursor = int(refresh_data.get("cursor", 0)) % len(KEY_JOB_TITLES)
+    sample_size = min(JOBS_PER_REFRESH, len(KEY_JOB_TITLES))
+    jobs_to_update = [KEY_JOB_TITLES[(cursor + i) % len(KEY_JOB_TITLES)] for i in range(sample_size)]
+    
+    logger.info("Selected %s jobs to update: %s", len(jobs_to_update), ', '.join(jobs_to_update))
     
-    logger.info(f"Selected {len(jobs_to_update)} jobs to update: {', '.join(jobs_to_update)}")
+    # Skip jobs whose BLS series haven't published a new period since the last refresh
+    seen_periods = refresh_data.get("series_periods", {})
+    latest_periods = bls_connector.get_latest_periods([
+        series_id for job_title in jobs_to_update for series_id in KEY_JOB_SERIES_IDS[job_title]
+    ])
+    unchanged_jobs = [
+        job_title for job_title in jobs_to_update
+        if KEY_JOB_SERIES_IDS[job_title] and all(
+            series_id in latest_periods and latest_periods[series_id] == seen_periods.get(series_id)
+            for series_id in KEY_JOB_SERIES_IDS[job_title]
+        )
+    ]
+    if unchanged_jobs:
+        logger.info("No new BLS data for: %s - skipping", ', '.join(unchanged_jobs))
+        jobs_to_update = [job_title for job_title in jobs_to_update if job_title not in unchanged_jobs]
     
-    # Update each selected job
+    # Fetch BLS series for all selected jobs in one batched request; the per-job
+    # updates below are then served from bls_connector's cache. Wait only if the
+    # latest-period check left us close to the API's rate limit.
+    series_fetched = True
+    try:
+        time.sleep(bls_connector.suggested_delay())
+        bls_connector.fetch_series([
+            series_id for job_title in jobs_to_update for series_id in KEY_JOB_SERIES_IDS[job_title]
+        ])
+    except Exception as e:
+        series_fetched = False
+        logger.error("Batched BLS fetch failed: %s", e)
+    
+    # Fetch the selected jobs concurrently, then save them all in one transaction
     updated_jobs = []
-    for job_title in jobs_to_update:
-        try:
-            job_data = update_job_data(job_title)
+    bls_jobs = []  # Jobs whose data came from BLS rather than a fallback
+    searches = []
+    failures = []
+    results = asyncio.run(update_jobs_concurrently(jobs_to_update))
+    for job_title, result in zip(jobs_to_update, results):
+        if isinstance(result, Exception):
+            failures.append((job_title, result))
+        else:
             updated_jobs.append(job_title)
-        except Exception as e:
-            logger.error(f"Failed to update {job_title}: {str(e)}")
-        
-        # Sleep briefly between API calls
-        time.sleep(1)
+            searches.append((job_title, job_search_record(result)))
+            if "error" not in result and result.get("source") != "internal_database":
+                bls_jobs.append(job_title)
+    
+    for job_title, error in failures:
+        logger.error("Failed to update %s: %s", job_title, error)
+    
+    saved = False
+    if database_available and searches:
+        saved = save_job_searches(searches)
+        if saved:
+            logger.info("Successfully saved %s jobs to database", len(searches))
+        else:
+            logger.error("Error saving %s jobs to database", len(searches))
+    
+    # Only jobs refreshed from BLS and saved count as having seen their latest period;
+    # anything else is retried on the next run instead of being skipped as "unchanged"
+    refreshed_periods = {}
+    if saved and series_fetched:
+        refreshed_periods = {
+            series_id: latest_periods[series_id]
+            for job_title in bls_jobs for series_id in KEY_JOB_SERIES_IDS[job_title]
+            if series_id in latest_periods
+        }
     
     # Perform database queries
     perform_database_queries()
     
-    # Update refresh timestamp
-    check_and_update_refresh_timestamp()
+    # Update refresh timestamp and advance the rotation
+    check_and_update_refresh_timestamp((cursor + sample_size) % len(KEY_JOB_TITLES), refreshed_periods)
     
-    logger.info(f"Database refresh completed. Updated {len(updated_jobs)} jobs: {', '.join(updated_jobs)}")
+    logger.info("Database refresh completed. Updated %s jobs: %s", len(updated_jobs), ', '.join(updated_jobs))
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
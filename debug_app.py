@@ -1,6 +1,8 @@
 import streamlit as st
 import os
 import sys
+import importlib.util
+from concurrent.futures import ThreadPoolExecutor
 
 # Basic page setup
 st.set_page_config(
@@ -11,11 +13,30 @@ st.set_page_config(
 
 st.title("iThriveAI Job Risk Analyzer - Debug Mode")
 
+def check_secrets():
+    """Return {secret name: configured?}, or the error raised while reading secrets"""
+    try:
+        return {name: bool(st.secrets.get(name)) for name in ("BLS_API_KEY", "DATABASE_URL")}
+    except Exception as e:
+        return str(e)
+
+@st.cache_resource(ttl=60)
+def gather_debug_info():
+    """Collect environment and secrets info, refreshed at most once a minute"""
+    return {
+        "python": sys.version,
+        "cwd": os.getcwd(),
+        "files": os.listdir(),
+        "secrets": check_secrets()
+    }
+
+debug_info = gather_debug_info()
+
 # Display environment info
 st.subheader("Environment Information")
-st.write(f"Python version: {sys.version}")
-st.write(f"Working directory: {os.getcwd()}")
-st.write(f"Directory contents: {os.listdir()}")
+st.write(f"Python version: {debug_info['python']}")
+st.write(f"Working directory: {debug_info['cwd']}")
+st.write(f"Directory contents: {debug_info['files']}")
 
 # Try to import each module and report success/failure
 st.subheader("Module Import Test")
@@ -28,24 +49,52 @@ modules_to_test = [
     "bls_employment_data"
 ]
 
-for module in modules_to_test:
+@st.cache_data
+def find_modules(modules):
+    """Locate each module without executing it - returns {module: error or None}"""
+    results = {}
+    for module in modules:
+        try:
+            found = importlib.util.find_spec(module) is not None
+            results[module] = None if found else "module not found"
+        except (ImportError, ValueError) as e:
+            results[module] = str(e)
+    return results
+
+# Finding specs doesn't run module code (DB connections, API calls); use the
+# button below to actually import everything
+for module, error in find_modules(tuple(modules_to_test)).items():
+    if error is None:
+        st.success(f"✅ Found {module}")
+    else:
+        st.error(f"❌ Failed to find {module}: {error}")
+
+def try_import(module):
+    """Import a module, returning (module, error or None)"""
     try:
         __import__(module)
-        st.success(f"✅ Successfully imported {module}")
+        return module, None
     except Exception as e:
-        st.error(f"❌ Failed to import {module}: {str(e)}")
+        return module, str(e)
+
+if st.button("Run full import test"):
+    # Imports run in worker threads; results are rendered from the main thread
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        import_results = list(executor.map(try_import, modules_to_test))
+    for module, error in import_results:
+        if error is None:
+            st.success(f"✅ Successfully imported {module}")
+        else:
+            st.error(f"❌ Failed to import {module}: {error}")
 
 # Check for secrets
 st.subheader("Secret Configuration")
-try:
-    if st.secrets.get("BLS_API_KEY"):
-        st.success("✅ BLS_API_KEY is configured")
-    else:
-        st.warning("⚠️ BLS_API_KEY is not configured")
-        
-    if st.secrets.get("DATABASE_URL"):
-        st.success("✅ DATABASE_URL is configured")
-    else:
-        st.warning("⚠️ DATABASE_URL is not configured")
-except Exception as e:
-    st.error(f"❌ Error checking secrets: {str(e)}")
+secrets = debug_info["secrets"]
+if isinstance(secrets, str):
+    st.error(f"❌ Error checking secrets: {secrets}")
+else:
+    for name, configured in secrets.items():
+        if configured:
+            st.success(f"✅ {name} is configured")
+        else:
+            st.warning(f"⚠️ {name} is not configured")
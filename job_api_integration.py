@@ -3,15 +3,85 @@ Job API Integration Module
 This module combines BLS employment data with AI displacement risk analysis.
 """
 import bls_connector
-from typing import Dict, Any, List, Optional
-import time
-import pandas as pd
+from typing import Dict, Any, List, Optional, NamedTuple, Tuple
+import numpy as np
 import os
+import sys
+import json
 import datetime
+import functools
+import asyncio
+import itertools
+import copy
+import bisect
 from sqlalchemy import create_engine, text, Table, Column, Integer, String, Float, MetaData, insert, select
+from new_nurse_data import get_updated_nurse_data
 
-# Cache for storing processed job data to minimize redundant processing
-_job_cache = {}
+# orjson is optional; it serializes straight to bytes and handles NumPy arrays natively
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Bound for the get_job_data memo cache
+JOB_DATA_CACHE_SIZE = 1024
+
+# Shared year axis for the static trend_data payloads (read-only, shared by every 2020-2025 trend)
+_TREND_DTYPE = np.int32
+_TREND_YEARS = np.arange(2020, 2026, dtype=_TREND_DTYPE)
+_TREND_YEARS.flags.writeable = False
+
+def _intern_strings(value):
+    """
+    Recursively intern the strings in a static payload so repeated labels and
+    skill phrases share one object across jobs. Lists are frozen into tuples
+    (named tuples keep their type) and NumPy arrays are made read-only, so a
+    payload shared between callers has no list or array to mutate.
+    """
+    if isinstance(value, str):
+        return sys.intern(value)
+    if isinstance(value, dict):
+        return {_intern_strings(k): _intern_strings(v) for k, v in value.items()}
+    if isinstance(value, list):
+        return tuple(_intern_strings(v) for v in value)
+    if isinstance(value, tuple):
+        items = [_intern_strings(v) for v in value]
+        return type(value)(*items) if hasattr(value, "_fields") else tuple(items)
+    if isinstance(value, np.ndarray):
+        value.flags.writeable = False
+    return value
+
+def _static_payload(builder):
+    """
+    Run a zero-argument builder once at import and freeze its payload with
+    _intern_strings. The getter returns that shared payload, or a private deep
+    copy when called with mutable=True.
+    """
+    payload = _intern_strings(builder())
+    @functools.wraps(builder)
+    def getter(mutable: bool = False):
+        return copy.deepcopy(payload) if mutable else payload
+    return getter
+
+def _payload_json(payload: Dict[str, Any]) -> bytes:
+    """Serialize a static payload to JSON bytes once, for handlers that send it as-is."""
+    if orjson is not None:
+        return orjson.dumps(payload, option=orjson.OPT_SERIALIZE_NUMPY)
+    return json.dumps(payload, default=lambda o: o.tolist()).encode()
+
+def similar_jobs_columns(similar_jobs: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """
+    Convert a similar_jobs list of dicts into parallel columns, so ranking or
+    filtering by risk is a vectorized NumPy operation instead of a per-row dict lookup.
+    Missing risk values become NaN.
+    """
+    return {
+        "titles": [job.get("job_title", job.get("title")) for job in similar_jobs],
+        "codes": [job.get("occupation_code") for job in similar_jobs],
+        "year_1_risk": np.array([job.get("year_1_risk", np.nan) for job in similar_jobs], dtype=np.float32),
+        "year_5_risk": np.array([job.get("year_5_risk", np.nan) for job in similar_jobs], dtype=np.float32),
+        "categories": [job.get("risk_category", job.get("risk_level")) for job in similar_jobs]
+    }
 
 # Job title to SOC code mapping
 # This is a starting point - the system will build this mapping over time
@@ -75,6 +145,7 @@ SOC_TO_CATEGORY = {
     "53-": "Transportation and Material Moving"
 }
 
+@_static_payload
 def get_court_reporter_data():
     """Get Court Reporter data with proper SOC code."""
     return {
@@ -96,1451 +167,410 @@ def get_court_reporter_data():
         ]
     }
 
-def get_project_manager_data():
-    """
-    Get comprehensive data for Project Manager role.
-    This is a custom implementation to ensure complete data for this common search.
+# Longest job title accepted; longer input is rejected before any string copies or lookups
+MAX_JOB_TITLE_LENGTH = 128
+
+# Template result for empty or oversized job titles; get_job_data hands out copies
+_INVALID_TITLE_RESULT = {
+    "error": "invalid_job_title",
+    "message": f"Job title must be between 1 and {MAX_JOB_TITLE_LENGTH} characters"
+}
+
+def get_job_data(job_title: str) -> Dict[str, Any]:
     """
-    # Define rich data for Project Managers
-    occ_code = "11-3021"  # SOC code for Project Management Specialists
-    standardized_title = "Project Manager"
-    
-    # Occupation data with employment figures
-    occupation_data = {
-        "status": "success",
-        "latest_value": "571300"  # Current employment from BLS stats
-    }
+    Get comprehensive job data including BLS statistics and AI risk analysis.
+    Results are memoized per job title; get_job_data.cache_clear() resets them.
     
-    # Projection data
-    projection_data = {
-        "projections": {
-            "current_employment": 571300,
-            "projected_employment": 627430,
-            "percent_change": 9.8,
-            "annual_job_openings": 47500
-        }
-    }
+    Args:
+        job_title: The job title to analyze
+        
+    Returns:
+        Dictionary with combined job data
+    """
+    if not job_title or len(job_title) > MAX_JOB_TITLE_LENGTH:
+        return dict(_INVALID_TITLE_RESULT)
+    job_title = job_title.strip()
+    if not job_title:
+        return dict(_INVALID_TITLE_RESULT)
+    return _get_job_data_cached(job_title)
+
+@functools.lru_cache(maxsize=JOB_DATA_CACHE_SIZE)
+def _get_job_data_cached(job_title: str) -> Dict[str, Any]:
+    """Build job data for a validated, stripped job title (memoized)."""
+    # Special handling for specific job titles with enhanced data (one dict lookup)
+    builder = JOB_DATA_BUILDERS.get(job_title.casefold())
+    if builder is not None:
+        return builder()
+        
+    # Step 1: Check if job title exists in database with SOC code
+    database_url = os.environ.get('DATABASE_URL')
+    if database_url:
+        try:
+            from sqlalchemy import create_engine, text
+            engine = create_engine(database_url)
+            with engine.connect() as conn:
+                query = text("SELECT soc_code FROM job_titles WHERE LOWER(title) = LOWER(:job_title) LIMIT 1")
+                result = conn.execute(query, {"job_title": job_title})
+                row = result.fetchone()
+                if row and row[0] and row[0] != '00-0000':
+                    occ_code = row[0]
+                    standardized_title = job_title
+                else:
+                    # Try BLS API search as fallback
+                    occupation_matches = bls_connector.search_occupations(job_title)
+                    if not occupation_matches:
+                        return get_internal_job_data(job_title)
+                    best_match = occupation_matches[0]
+                    occ_code = best_match["code"]
+                    standardized_title = best_match["title"]
+        except Exception as e:
+            print(f"Database lookup failed: {e}")
+            # Fallback to BLS API
+            occupation_matches = bls_connector.search_occupations(job_title)
+            if not occupation_matches:
+                return get_internal_job_data(job_title)
+            best_match = occupation_matches[0]
+            occ_code = best_match["code"]
+            standardized_title = best_match["title"]
+    else:
+        # No database, use BLS API
+        occupation_matches = bls_connector.search_occupations(job_title)
+        if not occupation_matches:
+            return get_internal_job_data(job_title)
+        best_match = occupation_matches[0]
+        occ_code = best_match["code"]
+        standardized_title = best_match["title"]
     
-    # Calculate risk data with enhanced project manager details
-    risk_data = {
-        "year_1_risk": 35.0,
-        "year_5_risk": 60.0,
-        "risk_category": "Moderate to High",
-        "risk_factors": [
-            "Project management software increasingly automates routine tasks",
-            "AI tools can handle resource allocation and scheduling",
-            "Reporting and documentation can be automated",
-            "Basic project tracking requires less human oversight"
-        ],
-        "protective_factors": [
-            "Complex stakeholder management requires human relationships",
-            "Strategic decision-making needs human judgment",
-            "Team leadership and motivation remain human-centered",
-            "Crisis management and problem-solving benefit from human experience"
-        ],
-        "analysis": "Project Managers face moderate to high displacement risk as AI tools advance. While routine project tracking and documentation are increasingly automated, roles requiring complex stakeholder management, strategic thinking, and leadership will remain valuable. Project managers who develop skills in AI oversight, strategic leadership, and change management will be more resilient to automation.",
-        "projected_growth": {
-            "percent_change": 9.8,
-            "analysis": "Moderate growth projected"
-        },
-        "automation_probability": 0.45,
-        "wage_trend": "Stable to increasing for specialized roles",
-        "evolving_skills": [
-            "AI tools implementation and oversight", 
-            "Data-driven decision making",
-            "Agile and adaptive methodologies",
-            "Cross-functional leadership",
-            "Change management expertise",
-            "Strategic resource optimization"
-        ],
-        "skill_areas": {
-            "technical_skills": [
-                "AI/ML oversight and integration",
-                "Data analytics and interpretation",
-                "Advanced project management platforms",
-                "Business intelligence tools",
-                "Automation workflow design"
-            ],
-            "soft_skills": [
-                "Strategic leadership",
-                "Cross-functional team management",
-                "Complex negotiation",
-                "Emotional intelligence",
-                "Crisis management",
-                "Stakeholder communication"
-            ],
-            "transferable_skills": [
-                "Systems thinking",
-                "Process optimization",
-                "Resource allocation",
-                "Change management",
-                "Decision-making under uncertainty",
-                "Risk assessment"
-            ]
-        }
-    }
+    # Step 2: Get occupation data from BLS
+    occupation_data = bls_connector.get_occupation_data(occ_code)
     
-    # Sample employment trend data
-    trend_years = list(range(2020, 2026))
-    trend_employment = [525000, 538000, 550000, 571300, 585000, 599000]
+    # Step 3: Get employment projections
+    projection_data = bls_connector.get_employment_projection(occ_code)
     
-    # Sample similar jobs data
-    similar_jobs = [
-        {
-            "job_title": "Program Manager",
-            "occupation_code": "11-3021",
-            "year_1_risk": 30.0,
-            "year_5_risk": 55.0,
-            "risk_category": "Moderate"
-        },
-        {
-            "job_title": "Product Manager",
-            "occupation_code": "11-2021",
-            "year_1_risk": 25.0,
-            "year_5_risk": 45.0,
-            "risk_category": "Moderate"
-        },
-        {
-            "job_title": "Construction Manager",
-            "occupation_code": "11-9021",
-            "year_1_risk": 20.0,
-            "year_5_risk": 40.0,
-            "risk_category": "Moderate"
-        },
-        {
-            "job_title": "Operations Manager",
-            "occupation_code": "11-1021",
-            "year_1_risk": 40.0,
-            "year_5_risk": 65.0,
-            "risk_category": "High"
-        }
-    ]
+    # Step 4: Calculate AI displacement risk based on BLS data and internal models
+    risk_data = calculate_displacement_risk(
+        job_title=standardized_title,
+        occ_code=occ_code,
+        occupation_data=occupation_data,
+        projection_data=projection_data
+    )
     
     # Combine all data
     result = {
         "job_title": standardized_title,
         "occupation_code": occ_code,
-        "source": "enhanced_data",
-        "employment_data": [],  # Not needed for display
-        "latest_employment": occupation_data["latest_value"],
-        "projections": projection_data["projections"],
-        "risk_analysis": risk_data,
-        "trend_data": {
-            "years": trend_years,
-            "employment": trend_employment
-        },
-        "similar_jobs": similar_jobs
+        "source": "bls_api",
+        "employment_data": occupation_data.get("data", []),
+        "latest_employment": occupation_data.get("latest_value"),
+        "projections": projection_data.get("projections", {}),
+        "risk_analysis": risk_data
     }
     
     return result
 
-def get_nurse_data():
-    """
-    Get comprehensive data for Nurse role.
-    """
-    occ_code = "29-1141"  # SOC code for Registered Nurses
-    standardized_title = "Registered Nurse"
-    
-    # Occupation data with employment figures
-    occupation_data = {
-        "status": "success",
-        "latest_value": "3130600"  # Current employment from BLS stats
-    }
-    
-    # Projection data with strong growth (BLS projections)
-    projection_data = {
-        "projections": {
-            "current_employment": 3130600,
-            "projected_employment": 3458200,
-            "percent_change": 10.5,
-            "annual_job_openings": 203200
-        }
-    }
-    
-    # Calculate risk data with nurse-specific details
-    risk_data = {
-        "year_1_risk": 15.0,
-        "year_5_risk": 30.0,
-        "risk_category": "Low to Moderate",
-        "risk_factors": [
-            "Administrative tasks can be automated",
-            "AI diagnostic support tools are increasingly sophisticated",
-            "Remote monitoring reduces need for some in-person care",
-            "Predictive analytics may reduce staffing requirements"
-        ],
-        "protective_factors": [
-            "Direct patient care requires human empathy and dexterity",
-            "Complex decision-making in emergency situations",
-            "Patient education and emotional support remain human-centered",
-            "Physical assessment and intervention skills are difficult to automate"
-        ],
-        "analysis": "Nurses face relatively low displacement risk from AI. While administrative tasks and some monitoring functions may be automated, the core nursing role of direct patient care requires human empathy, physical skills, and clinical judgment that AI cannot replace. Nurses who develop technical skills to work alongside AI tools will be most resilient to technological change.",
-        "projected_growth": {
-            "percent_change": 10.5,
-            "analysis": "Strong growth projected"
-        },
-        "automation_probability": 0.20,
-        "wage_trend": "Increasing, especially for specialized roles",
-        "evolving_skills": [
-            "Digital health technology proficiency", 
-            "Data interpretation for patient monitoring",
-            "Telehealth service delivery",
-            "Advanced clinical assessment",
-            "Complex care coordination",
-            "AI-assisted diagnostics"
-        ],
-        "skill_areas": {
-            "technical_skills": [
-                "Digital health record systems",
-                "Remote monitoring technology",
-                "Telehealth platforms",
-                "Medical device integration",
-                "Clinical decision support systems"
-            ],
-            "soft_skills": [
-                "Complex communication",
-                "Empathetic care",
-                "Crisis management",
-                "Interdisciplinary collaboration",
-                "Patient advocacy",
-                "Ethical decision-making"
-            ],
-            "transferable_skills": [
-                "Assessment and diagnosis",
-                "Critical thinking",
-                "Care coordination",
-                "Patient education",
-                "Resource management",
-                "Quality improvement"
-            ]
-        }
-    }
-    
-    # Sample employment trend data
-    trend_years = list(range(2020, 2026))
-    trend_employment = [2990000, 3080000, 3130600, 3198000, 3268000, 3340000]
-    
-    # Sample similar jobs data
-    similar_jobs = [
-        {
-            "job_title": "Nurse Practitioner",
-            "occupation_code": "29-1171",
-            "year_1_risk": 10.0,
-            "year_5_risk": 20.0,
-            "risk_category": "Low"
-        },
-        {
-            "job_title": "Licensed Practical Nurse",
-            "occupation_code": "29-2061",
-            "year_1_risk": 20.0,
-            "year_5_risk": 40.0,
-            "risk_category": "Moderate"
-        },
-        {
-            "job_title": "Physician Assistant",
-            "occupation_code": "29-1071",
-            "year_1_risk": 15.0,
-            "year_5_risk": 25.0,
-            "risk_category": "Low"
-        },
-        {
-            "job_title": "Nursing Assistant",
-            "occupation_code": "31-1131",
-            "year_1_risk": 25.0,
-            "year_5_risk": 45.0,
-            "risk_category": "Moderate"
-        }
-    ]
-    
-    # Combine all data
-    result = {
-        "job_title": standardized_title,
+# Expose the memo cache controls on the public entry point
+get_job_data.cache_clear = _get_job_data_cached.cache_clear
+get_job_data.cache_info = _get_job_data_cached.cache_info
+
+def _make_result(job_title, occ_code, latest_employment, projections, risk_analysis,
+                 trend_years, trend_employment, similar_jobs):
+    """Assemble an enhanced-data payload; every static job shares this key layout."""
+    return {
+        "job_title": job_title,
         "occupation_code": occ_code,
         "source": "enhanced_data",
         "employment_data": [],  # Not needed for display
-        "latest_employment": occupation_data["latest_value"],
-        "projections": projection_data["projections"],
-        "risk_analysis": risk_data,
+        "latest_employment": latest_employment,
+        "projections": projections,
+        "risk_analysis": risk_analysis,
         "trend_data": {
             "years": trend_years,
             "employment": trend_employment
         },
         "similar_jobs": similar_jobs
     }
+
+# Static enhanced-data profiles, keyed by canonical job title
+JOB_PROFILES_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "job_profiles.json")
+
+def _load_job_profiles() -> Dict[str, Any]:
+    """Read the static job profiles once at import."""
+    with open(JOB_PROFILES_PATH, "rb") as f:
+        raw = f.read()
+    return orjson.loads(raw) if orjson is not None else json.loads(raw)
+
+_JOB_PROFILES_FILE = _load_job_profiles()
+_JOB_PROFILES = _JOB_PROFILES_FILE["profiles"]
+
+class SimilarJob(NamedTuple):
+    """One similar-job entry from the shared catalog."""
+    job_title: str
+    occupation_code: str
+    year_1_risk: float
+    year_5_risk: float
+    risk_category: str
+
+# One similar-job record per occupation code; profiles list codes and share these records
+_JOB_CATALOG = {
+    code: SimilarJob(**_intern_strings(row))
+    for code, row in _JOB_PROFILES_FILE["similar_job_catalog"].items()
+}
+
+def get_similar_job(occ_code: str) -> Optional[SimilarJob]:
+    """Get the catalog record for an occupation code, or None."""
+    return _JOB_CATALOG.get(occ_code)
+
+@functools.cache
+def _similar_job_row(occ_code: str) -> Dict[str, Any]:
+    """The dict form of a catalog record that payloads carry, built once per code."""
+    return _JOB_CATALOG[occ_code]._asdict()
+
+def _resolve_similar_jobs(occ_codes: List[str]) -> tuple:
+    """Look up the shared catalog rows for a profile's similar job codes."""
+    return tuple(_similar_job_row(code) for code in occ_codes)
+
+# Catalog risks as sorted-code columns for batch lookups; risks are stored in
+# half-point steps as uint8 (0-100% fits in 0-200) and decoded on read
+_RISK_STEPS_PER_POINT = 2
+
+def _quantize_risks(values: List[float]) -> np.ndarray:
+    """Encode risk percentages as uint8 half-points, refusing values that would lose precision."""
+    scaled = np.asarray(values, dtype=float) * _RISK_STEPS_PER_POINT
+    encoded = np.rint(scaled).astype(np.uint8)
+    if not np.array_equal(encoded, scaled):
+        raise ValueError("Catalog risks must be between 0 and 100 in steps of 0.5")
+    encoded.flags.writeable = False
+    return encoded
+
+_CATALOG_CODES = np.array(sorted(_JOB_CATALOG))
+_CATALOG_CODES.flags.writeable = False
+_CATALOG_YEAR_1_RISK = _quantize_risks([_JOB_CATALOG[code].year_1_risk for code in _CATALOG_CODES])
+_CATALOG_YEAR_5_RISK = _quantize_risks([_JOB_CATALOG[code].year_5_risk for code in _CATALOG_CODES])
+
+def get_catalog_risks(occ_codes: List[str]) -> Dict[str, np.ndarray]:
+    """
+    Get catalog risks for many occupation codes at once.
     
+    Args:
+        occ_codes: Sequence of SOC occupation codes
+        
+    Returns:
+        Dictionary of float arrays aligned with occ_codes (year_1_risk, year_5_risk);
+        codes missing from the catalog are NaN
+    """
+    codes = np.asarray(occ_codes, dtype=_CATALOG_CODES.dtype)
+    rows = np.minimum(np.searchsorted(_CATALOG_CODES, codes), len(_CATALOG_CODES) - 1)
+    found = _CATALOG_CODES[rows] == codes
+    return {
+        "year_1_risk": np.where(found, _CATALOG_YEAR_1_RISK[rows] / _RISK_STEPS_PER_POINT, np.nan),
+        "year_5_risk": np.where(found, _CATALOG_YEAR_5_RISK[rows] / _RISK_STEPS_PER_POINT, np.nan)
+    }
+
+def _profile_result(job_title: str) -> Dict[str, Any]:
+    """
+    Build the frozen payload for one entry of job_profiles.json.
+    latest_employment is derived from the projections so the two cannot diverge.
+    """
+    profile = _JOB_PROFILES[job_title]
+    result = _make_result(
+        job_title, profile["occupation_code"], str(profile["projections"]["current_employment"]),
+        profile["projections"], profile["risk_analysis"], _TREND_YEARS,
+        np.array(profile["trend_employment"], dtype=_TREND_DTYPE), None)
+    if "skills" in profile:
+        result["skills"] = profile["skills"]
+    result = _intern_strings(result)
+    # Resolved after interning, which would otherwise copy the shared rows
+    result["similar_jobs"] = _resolve_similar_jobs(profile["similar_jobs"])
     return result
 
+# Static payloads and their JSON encodings, built once at import and keyed by canonical job title
+_STATIC_JOBS = {job_title: _profile_result(job_title) for job_title in _JOB_PROFILES}
+_STATIC_JOBS_JSON = {job_title: _payload_json(result) for job_title, result in _STATIC_JOBS.items()}
+
+def get_static_job(job_title: str) -> Optional[Dict[str, Any]]:
+    """Get the static payload for a canonical job title (e.g. "Restaurant Cook"), or None."""
+    return _STATIC_JOBS.get(job_title)
+
+def get_static_job_json(job_title: str) -> Optional[bytes]:
+    """Get the pre-serialized JSON for a canonical job title, or None."""
+    return _STATIC_JOBS_JSON.get(job_title)
+
+def get_project_manager_data():
+    """
+    Get comprehensive data for Project Manager role.
+    This is a custom implementation to ensure complete data for this common search.
+    """
+    return _STATIC_JOBS["Project Manager"]
+
+def get_project_manager_json() -> bytes:
+    """Return get_project_manager_data() pre-serialized as JSON bytes."""
+    return _STATIC_JOBS_JSON["Project Manager"]
+
+def get_nurse_data():
+    """
+    Get comprehensive data for Nurse role.
+    """
+    return _STATIC_JOBS["Registered Nurse"]
+
+def get_nurse_json() -> bytes:
+    """Return get_nurse_data() pre-serialized as JSON bytes."""
+    return _STATIC_JOBS_JSON["Registered Nurse"]
+
 def get_retail_sales_data():
     """
     Get comprehensive data for Retail Sales role.
     """
-    occ_code = "41-2031"  # SOC code for Retail Salespersons
-    standardized_title = "Retail Salesperson"
-    
-    # Occupation data with employment figures
-    occupation_data = {
-        "status": "success",
-        "latest_value": "3625500"  # Current employment from BLS stats
-    }
-    
-    # Projection data with decline (BLS projections)
-    projection_data = {
-        "projections": {
-            "current_employment": 3625500,
-            "projected_employment": 3464000,
-            "percent_change": -4.5,
-            "annual_job_openings": 606000  # High turnover despite decline
-        }
-    }
-    
-    # Calculate risk data with retail-specific details
-    risk_data = {
-        "year_1_risk": 55.0,
-        "year_5_risk": 75.0,
-        "risk_category": "High",
-        "risk_factors": [
-            "Self-checkout and automated payment systems replace cashiers",
-            "E-commerce continues to grow at expense of physical retail",
-            "Inventory management increasingly automated",
-            "AI-powered recommendation systems replace product knowledge",
-            "Automated customer service chatbots handle basic inquiries"
-        ],
-        "protective_factors": [
-            "Complex customer service scenarios require human judgment",
-            "High-end or specialized product sales need human expertise",
-            "In-person sales psychology and relationship building",
-            "Visual merchandising and store experience design"
-        ],
-        "analysis": "Retail sales positions face high displacement risk from automation and AI. The combination of e-commerce growth, self-checkout technology, and automated inventory systems threatens many traditional retail jobs. The most resilient roles will be in high-end or specialized retail where product expertise, personalized service, and relationship building remain valuable human skills.",
-        "projected_growth": {
-            "percent_change": -4.5,
-            "analysis": "Moderate decline projected"
-        },
-        "automation_probability": 0.70,
-        "wage_trend": "Declining for general positions, stable for specialized sales",
-        "evolving_skills": [
-            "Omnichannel customer service", 
-            "Digital sales platforms",
-            "Personalized shopping experience design",
-            "Product expertise beyond online information",
-            "Complex problem-solving for customers",
-            "Experience-based selling"
-        ],
-        "skill_areas": {
-            "technical_skills": [
-                "E-commerce platform knowledge",
-                "Digital payment systems",
-                "CRM software proficiency",
-                "Inventory management systems",
-                "Social media selling"
-            ],
-            "soft_skills": [
-                "Consultative selling",
-                "Relationship building",
-                "Conflict resolution",
-                "Product storytelling",
-                "Emotional intelligence",
-                "Active listening"
-            ],
-            "transferable_skills": [
-                "Customer needs assessment",
-                "Solution development",
-                "Negotiation",
-                "Visual presentation",
-                "Persuasive communication",
-                "Performance under pressure"
-            ]
-        }
-    }
-    
-    # Sample employment trend data
-    trend_years = list(range(2020, 2026))
-    trend_employment = [3835000, 3710000, 3625500, 3580000, 3520000, 3464000]
-    
-    # Sample similar jobs data
-    similar_jobs = [
-        {
-            "job_title": "Customer Service Representative",
-            "occupation_code": "43-4051",
-            "year_1_risk": 60.0,
-            "year_5_risk": 80.0,
-            "risk_category": "High"
-        },
-        {
-            "job_title": "Sales Manager",
-            "occupation_code": "11-2022",
-            "year_1_risk": 25.0,
-            "year_5_risk": 45.0,
-            "risk_category": "Moderate"
-        },
-        {
-            "job_title": "Cashier",
-            "occupation_code": "41-2011",
-            "year_1_risk": 70.0,
-            "year_5_risk": 90.0,
-            "risk_category": "Very High"
-        },
-        {
-            "job_title": "Sales Representative",
-            "occupation_code": "41-4012",
-            "year_1_risk": 40.0,
-            "year_5_risk": 60.0,
-            "risk_category": "High"
-        }
-    ]
-    
-    # Combine all data
-    result = {
-        "job_title": standardized_title,
-        "occupation_code": occ_code,
-        "source": "enhanced_data",
-        "employment_data": [],  # Not needed for display
-        "latest_employment": occupation_data["latest_value"],
-        "projections": projection_data["projections"],
-        "risk_analysis": risk_data,
-        "trend_data": {
-            "years": trend_years,
-            "employment": trend_employment
-        },
-        "similar_jobs": similar_jobs
-    }
-    
-    return result
-
-def get_cook_data():
-    """
-    Get comprehensive data for Cook role.
-    """
-    occ_code = "35-2014"  # SOC code for Cooks, Restaurant
-    standardized_title = "Restaurant Cook"
-    
-    # Occupation data with employment figures
-    occupation_data = {
-        "status": "success",
-        "latest_value": "1235800"  # Current employment from BLS stats
-    }
-    
-    # Projection data
-    projection_data = {
-        "projections": {
-            "current_employment": 1235800,
-            "projected_employment": 1334600,
-            "percent_change": 8.0,
-            "annual_job_openings": 178800
-        }
-    }
-    
-    # Calculate risk data
-    risk_data = {
-        "year_1_risk": 40.0,
-        "year_5_risk": 65.0,
-        "risk_category": "Moderate to High",
-        "risk_factors": [
-            "Food preparation robots are being deployed in fast food",
-            "Automated cooking systems can handle basic dishes",
-            "Recipe standardization reduces need for culinary judgment",
-            "Kitchen management software optimizes staffing and inventory",
-            "Delivery and takeout growth reduces in-restaurant dining"
-        ],
-        "protective_factors": [
-            "Creative culinary development requires human taste and judgment",
-            "Complex dishes need advanced cooking techniques",
-            "Fine dining experience depends on human execution",
-            "Menu development and food innovation remain human-centered",
-            "Food quality control requires human senses"
-        ],
-        "analysis": "Cooks face moderate to high displacement risk, with significant differences based on restaurant type. Fast food and chain restaurants are implementing automation for basic food preparation, while creative roles in upscale restaurants remain more protected. Cooks who develop specialized skills, culinary creativity, and management abilities will be more resilient to automation.",
-        "projected_growth": {
-            "percent_change": 8.0,
-            "analysis": "Moderate growth projected"
-        },
-        "automation_probability": 0.60,
-        "wage_trend": "Stable to increasing for specialized culinary skills",
-        "evolving_skills": [
-            "Culinary innovation and creativity", 
-            "Advanced cooking techniques",
-            "Menu development",
-            "Food science knowledge",
-            "Specialized cuisine expertise",
-            "Technology integration in kitchen operations"
-        ],
-        "skill_areas": {
-            "technical_skills": [
-                "Advanced cooking methods",
-                "Menu engineering",
-                "Food safety systems",
-                "Kitchen technology operations",
-                "Inventory management platforms"
-            ],
-            "soft_skills": [
-                "Team leadership",
-                "Time management under pressure",
-                "Creative problem-solving",
-                "Quality control",
-                "Sensory evaluation",
-                "Communication in dynamic environments"
-            ],
-            "transferable_skills": [
-                "Process optimization",
-                "Resource management",
-                "Team coordination",
-                "Multitasking",
-                "Quality assessment",
-                "Critical decision-making"
-            ]
-        }
-    }
-    
-    # Sample employment trend data
-    trend_years = list(range(2020, 2026))
-    trend_employment = [1100000, 1152000, 1235800, 1270000, 1305000, 1334600]
-    
-    # Sample similar jobs data
-    similar_jobs = [
-        {
-            "job_title": "Chef",
-            "occupation_code": "35-1011",
-            "year_1_risk": 30.0,
-            "year_5_risk": 50.0,
-            "risk_category": "Moderate"
-        },
-        {
-            "job_title": "Food Preparation Worker",
-            "occupation_code": "35-2021",
-            "year_1_risk": 65.0,
-            "year_5_risk": 85.0,
-            "risk_category": "Very High"
-        },
-        {
-            "job_title": "Baker",
-            "occupation_code": "51-3011",
-            "year_1_risk": 45.0,
-            "year_5_risk": 70.0,
-            "risk_category": "High"
-        },
-        {
-            "job_title": "Restaurant Manager",
-            "occupation_code": "11-9051",
-            "year_1_risk": 25.0,
-            "year_5_risk": 45.0,
-            "risk_category": "Moderate"
-        }
-    ]
-    
-    # Combine all data
-    result = {
-        "job_title": standardized_title,
-        "occupation_code": occ_code,
-        "source": "enhanced_data",
-        "employment_data": [],  # Not needed for display
-        "latest_employment": occupation_data["latest_value"],
-        "projections": projection_data["projections"],
-        "risk_analysis": risk_data,
-        "trend_data": {
-            "years": trend_years,
-            "employment": trend_employment
-        },
-        "similar_jobs": similar_jobs
-    }
-    
-    return result
-
-def get_job_data(job_title: str) -> Dict[str, Any]:
-    """
-    Get comprehensive job data including BLS statistics and AI risk analysis.
-    
-    Args:
-        job_title: The job title to analyze
-        
-    Returns:
-        Dictionary with combined job data
-    """
-    # Check cache first
-    if job_title.lower() in _job_cache:
-        return _job_cache[job_title.lower()]
-    
-    # Special handling for specific job titles with enhanced data
-    job_title_lower = job_title.lower()
-    if job_title_lower == "project manager":
-        return get_project_manager_data()
-    elif job_title_lower == "nurse" or job_title_lower == "registered nurse":
-        # Include nurse data directly here instead of importing from another file
-        return {
-            "job_title": "Registered Nurse",
-            "occupation_code": "29-1141",  # SOC code for Registered Nurses
-            "job_category": "Healthcare",
-            "source": "enhanced_data",
-            "latest_employment": "3130600",
-            "projections": {
-                "current_employment": 3130600,
-                "projected_employment": 3458200,
-                "percent_change": 10.5,
-                "annual_job_openings": 203200
-            },
-            "automation_probability": 20.0,  # Convert to percentage
-            "risk_scores": {
-                "year_1": 15.0,
-                "year_5": 30.0
-            },
-            "risk_category": "Low to Moderate",
-            "risk_factors": [
-                "Administrative tasks can be automated",
-                "AI diagnostic support tools are increasingly sophisticated",
-                "Remote monitoring reduces need for some in-person care",
-                "Predictive analytics may reduce staffing requirements"
-            ],
-            "protective_factors": [
-                "Direct patient care requires human empathy and dexterity",
-                "Complex decision-making in emergency situations",
-                "Patient education and emotional support remain human-centered",
-                "Physical assessment and intervention skills are difficult to automate"
-            ],
-            "trend_data": {
-                "years": list(range(2020, 2026)),
-                "employment": [2990000, 3080000, 3130600, 3198000, 3268000, 3340000]
-            },
-            "similar_jobs": [
-                {
-                    "job_title": "Nurse Practitioner",
-                    "occupation_code": "29-1171",
-                    "year_1_risk": 10.0,
-                    "year_5_risk": 20.0,
-                    "risk_category": "Low"
-                },
-                {
-                    "job_title": "Licensed Practical Nurse",
-                    "occupation_code": "29-2061",
-                    "year_1_risk": 20.0,
-                    "year_5_risk": 40.0,
-                    "risk_category": "Moderate"
-                },
-                {
-                    "job_title": "Physician Assistant",
-                    "occupation_code": "29-1071",
-                    "year_1_risk": 15.0,
-                    "year_5_risk": 25.0,
-                    "risk_category": "Low"
-                },
-                {
-                    "job_title": "Nursing Assistant",
-                    "occupation_code": "31-1131",
-                    "year_1_risk": 25.0,
-                    "year_5_risk": 45.0,
-                    "risk_category": "Moderate"
-                }
-            ],
-            "skills": {
-                "future_proof_skills": [
-                    "Digital health technology proficiency", 
-                    "Data interpretation for patient monitoring",
-                    "Telehealth service delivery",
-                    "Advanced clinical assessment",
-                    "Complex care coordination",
-                    "AI-assisted diagnostics"
-                ],
-                "skill_areas": {
-                    "technical_skills": [
-                        "Digital health record systems",
-                        "Remote monitoring technology",
-                        "Telehealth platforms",
-                        "Medical device integration",
-                        "Clinical decision support systems"
-                    ],
-                    "soft_skills": [
-                        "Complex communication",
-                        "Empathetic care",
-                        "Crisis management",
-                        "Interdisciplinary collaboration",
-                        "Patient advocacy",
-                        "Ethical decision-making"
-                    ],
-                    "transferable_skills": [
-                        "Assessment and diagnosis",
-                        "Critical thinking",
-                        "Care coordination",
-                        "Patient education",
-                        "Resource management",
-                        "Quality improvement"
-                    ]
-                }
-            }
-        }
-    elif job_title_lower == "retail sales" or job_title_lower == "retail salesperson" or job_title_lower == "sales associate":
-        return get_retail_sales_data()
-    elif job_title_lower == "cook" or job_title_lower == "chef" or job_title_lower == "food preparation":
-        return get_cook_data()
-    elif job_title_lower == "business analyst" or job_title_lower == "business systems analyst":
-        return get_business_analyst_data()
-    elif job_title_lower == "diagnosician" or job_title_lower == "diagnoscian" or job_title_lower == "medical diagnostician":
-        return get_diagnosician_data()
-    elif job_title_lower == "ui developer" or job_title_lower == "ui designer" or job_title_lower == "user interface developer":
-        return get_ui_developer_data()
-    elif job_title_lower == "web developer" or job_title_lower == "web programmer" or job_title_lower == "website developer":
-        return get_web_developer_data()
-    elif job_title_lower == "teacher" or job_title_lower == "educator" or job_title_lower == "instructor" or job_title_lower == "elementary school teachers" or job_title_lower == "elementary teacher" or job_title_lower == "middle school teachers" or job_title_lower == "middle school teacher":
-        return get_teacher_data(job_title)
-    elif job_title_lower == "court reporter" or job_title_lower == "digital court reporter" or job_title_lower == "stenographer":
-        return get_court_reporter_data()
-        
-    # Step 1: Check if job title exists in database with SOC code
-    database_url = os.environ.get('DATABASE_URL')
-    if database_url:
-        try:
-            from sqlalchemy import create_engine, text
-            engine = create_engine(database_url)
-            with engine.connect() as conn:
-                query = text("SELECT soc_code FROM job_titles WHERE LOWER(title) = LOWER(:job_title) LIMIT 1")
-                result = conn.execute(query, {"job_title": job_title})
-                row = result.fetchone()
-                if row and row[0] and row[0] != '00-0000':
-                    occ_code = row[0]
-                    standardized_title = job_title
-                else:
-                    # Try BLS API search as fallback
-                    occupation_matches = bls_connector.search_occupations(job_title)
-                    if not occupation_matches:
-                        return get_internal_job_data(job_title)
-                    best_match = occupation_matches[0]
-                    occ_code = best_match["code"]
-                    standardized_title = best_match["title"]
-        except Exception as e:
-            print(f"Database lookup failed: {e}")
-            # Fallback to BLS API
-            occupation_matches = bls_connector.search_occupations(job_title)
-            if not occupation_matches:
-                return get_internal_job_data(job_title)
-            best_match = occupation_matches[0]
-            occ_code = best_match["code"]
-            standardized_title = best_match["title"]
-    else:
-        # No database, use BLS API
-        occupation_matches = bls_connector.search_occupations(job_title)
-        if not occupation_matches:
-            return get_internal_job_data(job_title)
-        best_match = occupation_matches[0]
-        occ_code = best_match["code"]
-        standardized_title = best_match["title"]
-    
-    # Step 2: Get occupation data from BLS
-    occupation_data = bls_connector.get_occupation_data(occ_code)
-    
-    # Step 3: Get employment projections
-    projection_data = bls_connector.get_employment_projection(occ_code)
-    
-    # Step 4: Calculate AI displacement risk based on BLS data and internal models
-    risk_data = calculate_displacement_risk(
-        job_title=standardized_title,
-        occ_code=occ_code,
-        occupation_data=occupation_data,
-        projection_data=projection_data
-    )
-    
-    # Combine all data
-    result = {
-        "job_title": standardized_title,
-        "occupation_code": occ_code,
-        "source": "bls_api",
-        "employment_data": occupation_data.get("data", []),
-        "latest_employment": occupation_data.get("latest_value"),
-        "projections": projection_data.get("projections", {}),
-        "risk_analysis": risk_data
-    }
-    
-    # Cache the result
-    _job_cache[job_title.lower()] = result
-    
-    return result
-
-def get_project_manager_data():
-    """
-    Get comprehensive data for Project Manager role.
-    This is a custom implementation to ensure complete data for this common search.
-    """
-    # Define rich data for Project Managers
-    occ_code = "11-3021"  # SOC code for Project Management Specialists
-    standardized_title = "Project Manager"
-    
-    # Occupation data with employment figures
-    occupation_data = {
-        "status": "success",
-        "latest_value": "571300"  # Current employment from BLS stats
-    }
-    
-    # Projection data
-    projection_data = {
-        "projections": {
-            "current_employment": 571300,
-            "projected_employment": 627430,
-            "percent_change": 9.8,
-            "annual_job_openings": 47500
-        }
-    }
-    
-    # Calculate risk data with enhanced project manager details
-    risk_data = {
-        "year_1_risk": 35.0,
-        "year_5_risk": 60.0,
-        "risk_category": "Moderate to High",
-        "risk_factors": [
-            "Project management software increasingly automates routine tasks",
-            "AI tools can handle resource allocation and scheduling",
-            "Reporting and documentation can be automated",
-            "Basic project tracking requires less human oversight"
-        ],
-        "protective_factors": [
-            "Complex stakeholder management requires human relationships",
-            "Strategic decision-making needs human judgment",
-            "Team leadership and motivation remain human-centered",
-            "Crisis management and problem-solving benefit from human experience"
-        ],
-        "analysis": "Project Managers face moderate to high displacement risk as AI tools advance. While routine project tracking and documentation are increasingly automated, roles requiring complex stakeholder management, strategic thinking, and leadership will remain valuable. Project managers who develop skills in AI oversight, strategic leadership, and change management will be more resilient to automation.",
-        "projected_growth": {
-            "percent_change": 9.8,
-            "analysis": "Moderate growth projected"
-        },
-        "automation_probability": 0.45,
-        "wage_trend": "Stable to increasing for specialized roles",
-        "evolving_skills": [
-            "AI tools implementation and oversight", 
-            "Data-driven decision making",
-            "Agile and adaptive methodologies",
-            "Cross-functional leadership",
-            "Change management expertise",
-            "Strategic resource optimization"
-        ],
-        "skill_areas": {
-            "technical_skills": [
-                "AI/ML oversight and integration",
-                "Data analytics and interpretation",
-                "Advanced project management platforms",
-                "Business intelligence tools",
-                "Automation workflow design"
-            ],
-            "soft_skills": [
-                "Strategic leadership",
-                "Cross-functional team management",
-                "Complex negotiation",
-                "Emotional intelligence",
-                "Crisis management",
-                "Stakeholder communication"
-            ],
-            "transferable_skills": [
-                "Systems thinking",
-                "Process optimization",
-                "Resource allocation",
-                "Change management",
-                "Decision-making under uncertainty",
-                "Risk assessment"
-            ]
-        }
-    }
-    
-    # Sample employment trend data
-    trend_years = list(range(2020, 2026))
-    trend_employment = [525000, 538000, 550000, 571300, 585000, 599000]
-    
-    # Sample similar jobs data
-    similar_jobs = [
-        {
-            "job_title": "Program Manager",
-            "occupation_code": "11-3021",
-            "year_1_risk": 30.0,
-            "year_5_risk": 55.0,
-            "risk_category": "Moderate"
-        },
-        {
-            "job_title": "Product Manager",
-            "occupation_code": "11-2021",
-            "year_1_risk": 25.0,
-            "year_5_risk": 45.0,
-            "risk_category": "Moderate"
-        },
-        {
-            "job_title": "Construction Manager",
-            "occupation_code": "11-9021",
-            "year_1_risk": 20.0,
-            "year_5_risk": 40.0,
-            "risk_category": "Moderate"
-        },
-        {
-            "job_title": "Operations Manager",
-            "occupation_code": "11-1021",
-            "year_1_risk": 40.0,
-            "year_5_risk": 65.0,
-            "risk_category": "High"
-        }
-    ]
-    
-    # Combine all data
-    result = {
-        "job_title": standardized_title,
-        "occupation_code": occ_code,
-        "source": "enhanced_data",
-        "employment_data": [],  # Not needed for display
-        "latest_employment": occupation_data["latest_value"],
-        "projections": projection_data["projections"],
-        "risk_analysis": risk_data,
-        "trend_data": {
-            "years": trend_years,
-            "employment": trend_employment
-        },
-        "similar_jobs": similar_jobs
-    }
-    
-    return result
+    return _STATIC_JOBS["Retail Salesperson"]
 
-def get_nurse_data():
+def get_retail_sales_json() -> bytes:
+    """Return get_retail_sales_data() pre-serialized as JSON bytes."""
+    return _STATIC_JOBS_JSON["Retail Salesperson"]
+
+def get_cook_data():
     """
-    Get comprehensive data for Nurse role.
+    Get comprehensive data for Cook role.
     """
-    occ_code = "29-1141"  # SOC code for Registered Nurses
-    standardized_title = "Registered Nurse"
-    
-    # Occupation data with employment figures
-    occupation_data = {
-        "status": "success",
-        "latest_value": "3130600"  # Current employment from BLS stats
-    }
-    
-    # Projection data with strong growth (BLS projections)
-    projection_data = {
-        "projections": {
-            "current_employment": 3130600,
-            "projected_employment": 3458200,
-            "percent_change": 10.5,
-            "annual_job_openings": 203200
-        }
-    }
-    
-    # Calculate risk data with nurse-specific details
-    risk_data = {
-        "year_1_risk": 15.0,
-        "year_5_risk": 30.0,
-        "risk_category": "Low to Moderate",
-        "risk_factors": [
-            "Administrative tasks can be automated",
-            "AI diagnostic support tools are increasingly sophisticated",
-            "Remote monitoring reduces need for some in-person care",
-            "Predictive analytics may reduce staffing requirements"
-        ],
-        "protective_factors": [
-            "Direct patient care requires human empathy and dexterity",
-            "Complex decision-making in emergency situations",
-            "Patient education and emotional support remain human-centered",
-            "Physical assessment and intervention skills are difficult to automate"
-        ],
-        "analysis": "Nurses face relatively low displacement risk from AI. While administrative tasks and some monitoring functions may be automated, the core nursing role of direct patient care requires human empathy, physical skills, and clinical judgment that AI cannot replace. Nurses who develop technical skills to work alongside AI tools will be most resilient to technological change.",
-        "projected_growth": {
-            "percent_change": 10.5,
-            "analysis": "Strong growth projected"
-        },
-        "automation_probability": 0.20,
-        "wage_trend": "Increasing, especially for specialized roles",
-        "evolving_skills": [
-            "Digital health technology proficiency", 
-            "Data interpretation for patient monitoring",
-            "Telehealth service delivery",
-            "Advanced clinical assessment",
-            "Complex care coordination",
-            "AI-assisted diagnostics"
-        ],
-        "skill_areas": {
-            "technical_skills": [
-                "Digital health record systems",
-                "Remote monitoring technology",
-                "Telehealth platforms",
-                "Medical device integration",
-                "Clinical decision support systems"
-            ],
-            "soft_skills": [
-                "Complex communication",
-                "Empathetic care",
-                "Crisis management",
-                "Interdisciplinary collaboration",
-                "Patient advocacy",
-                "Ethical decision-making"
-            ],
-            "transferable_skills": [
-                "Assessment and diagnosis",
-                "Critical thinking",
-                "Care coordination",
-                "Patient education",
-                "Resource management",
-                "Quality improvement"
-            ]
-        }
-    }
-    
-    # Sample employment trend data
-    trend_years = list(range(2020, 2026))
-    trend_employment = [2990000, 3080000, 3130600, 3198000, 3268000, 3340000]
-    
-    # Sample similar jobs data
-    similar_jobs = [
-        {
-            "job_title": "Nurse Practitioner",
-            "occupation_code": "29-1171",
-            "year_1_risk": 10.0,
-            "year_5_risk": 20.0,
-            "risk_category": "Low"
-        },
-        {
-            "job_title": "Licensed Practical Nurse",
-            "occupation_code": "29-2061",
-            "year_1_risk": 20.0,
-            "year_5_risk": 40.0,
-            "risk_category": "Moderate"
-        },
-        {
-            "job_title": "Physician Assistant",
-            "occupation_code": "29-1071",
-            "year_1_risk": 15.0,
-            "year_5_risk": 25.0,
-            "risk_category": "Low"
-        },
-        {
-            "job_title": "Nursing Assistant",
-            "occupation_code": "31-1131",
-            "year_1_risk": 25.0,
-            "year_5_risk": 45.0,
-            "risk_category": "Moderate"
-        }
-    ]
-    
-    # Combine all data
-    result = {
-        "job_title": standardized_title,
-        "occupation_code": occ_code,
-        "source": "enhanced_data",
-        "employment_data": [],  # Not needed for display
-        "latest_employment": occupation_data["latest_value"],
-        "projections": projection_data["projections"],
-        "risk_analysis": risk_data,
-        "trend_data": {
-            "years": trend_years,
-            "employment": trend_employment
-        },
-        "similar_jobs": similar_jobs
-    }
-    
-    return result
+    return _STATIC_JOBS["Restaurant Cook"]
 
-def get_retail_sales_data():
+def get_cook_json() -> bytes:
+    """Return get_cook_data() pre-serialized as JSON bytes."""
+    return _STATIC_JOBS_JSON["Restaurant Cook"]
+
+@functools.lru_cache(maxsize=JOB_DATA_CACHE_SIZE)
+def get_job_json(job_title: str) -> bytes:
     """
-    Get comprehensive data for Retail Sales role.
+    Get get_job_data(job_title) as JSON bytes, encoded at most once per title.
+    Static jobs reuse the blob encoded at import.
     """
-    occ_code = "41-2031"  # SOC code for Retail Salespersons
-    standardized_title = "Retail Salesperson"
-    
-    # Occupation data with employment figures
-    occupation_data = {
-        "status": "success",
-        "latest_value": "3625500"  # Current employment from BLS stats
-    }
-    
-    # Projection data with decline (BLS projections)
-    projection_data = {
-        "projections": {
-            "current_employment": 3625500,
-            "projected_employment": 3464000,
-            "percent_change": -4.5,
-            "annual_job_openings": 606000  # High turnover despite decline
-        }
-    }
-    
-    # Calculate risk data with retail-specific details
-    risk_data = {
-        "year_1_risk": 55.0,
-        "year_5_risk": 75.0,
-        "risk_category": "High",
-        "risk_factors": [
-            "Self-checkout and automated payment systems replace cashiers",
-            "E-commerce continues to grow at expense of physical retail",
-            "Inventory management increasingly automated",
-            "AI-powered recommendation systems replace product knowledge",
-            "Automated customer service chatbots handle basic inquiries"
-        ],
-        "protective_factors": [
-            "Complex customer service scenarios require human judgment",
-            "High-end or specialized product sales need human expertise",
-            "In-person sales psychology and relationship building",
-            "Visual merchandising and store experience design"
-        ],
-        "analysis": "Retail sales positions face high displacement risk from automation and AI. The combination of e-commerce growth, self-checkout technology, and automated inventory systems threatens many traditional retail jobs. The most resilient roles will be in high-end or specialized retail where product expertise, personalized service, and relationship building remain valuable human skills.",
-        "projected_growth": {
-            "percent_change": -4.5,
-            "analysis": "Moderate decline projected"
-        },
-        "automation_probability": 0.70,
-        "wage_trend": "Declining for general positions, stable for specialized sales",
-        "evolving_skills": [
-            "Omnichannel customer service", 
-            "Digital sales platforms",
-            "Personalized shopping experience design",
-            "Product expertise beyond online information",
-            "Complex problem-solving for customers",
-            "Experience-based selling"
-        ],
-        "skill_areas": {
-            "technical_skills": [
-                "E-commerce platform knowledge",
-                "Digital payment systems",
-                "CRM software proficiency",
-                "Inventory management systems",
-                "Social media selling"
-            ],
-            "soft_skills": [
-                "Consultative selling",
-                "Relationship building",
-                "Conflict resolution",
-                "Product storytelling",
-                "Emotional intelligence",
-                "Active listening"
-            ],
-            "transferable_skills": [
-                "Customer needs assessment",
-                "Solution development",
-                "Negotiation",
-                "Visual presentation",
-                "Persuasive communication",
-                "Performance under pressure"
-            ]
-        }
-    }
-    
-    # Sample employment trend data
-    trend_years = list(range(2020, 2026))
-    trend_employment = [3835000, 3710000, 3625500, 3580000, 3520000, 3464000]
-    
-    # Sample similar jobs data
-    similar_jobs = [
-        {
-            "job_title": "Customer Service Representative",
-            "occupation_code": "43-4051",
-            "year_1_risk": 60.0,
-            "year_5_risk": 80.0,
-            "risk_category": "High"
-        },
-        {
-            "job_title": "Sales Manager",
-            "occupation_code": "11-2022",
-            "year_1_risk": 25.0,
-            "year_5_risk": 45.0,
-            "risk_category": "Moderate"
-        },
-        {
-            "job_title": "Cashier",
-            "occupation_code": "41-2011",
-            "year_1_risk": 70.0,
-            "year_5_risk": 90.0,
-            "risk_category": "Very High"
-        },
-        {
-            "job_title": "Sales Representative",
-            "occupation_code": "41-4012",
-            "year_1_risk": 40.0,
-            "year_5_risk": 60.0,
-            "risk_category": "High"
-        }
-    ]
-    
-    # Combine all data
-    result = {
-        "job_title": standardized_title,
-        "occupation_code": occ_code,
-        "source": "enhanced_data",
-        "employment_data": [],  # Not needed for display
-        "latest_employment": occupation_data["latest_value"],
-        "projections": projection_data["projections"],
-        "risk_analysis": risk_data,
-        "trend_data": {
-            "years": trend_years,
-            "employment": trend_employment
-        },
-        "similar_jobs": similar_jobs
-    }
-    
-    return result
+    job_data = get_job_data(job_title)
+    canonical_title = job_data.get("job_title")
+    if job_data is _STATIC_JOBS.get(canonical_title):
+        return _STATIC_JOBS_JSON[canonical_title]
+    return _payload_json(job_data)
 
-def get_cook_data():
+def _trend_csv(trend_data: Dict[str, Any]) -> bytes:
+    """Render trend_data as "year,employment" CSV rows, the shape chart clients load directly."""
+    return "".join(f"{year},{employment}\n"
+                   for year, employment in zip(trend_data["years"], trend_data["employment"])).encode()
+
+@functools.lru_cache(maxsize=JOB_DATA_CACHE_SIZE)
+def get_trend_csv(job_title: str) -> Optional[bytes]:
     """
-    Get comprehensive data for Cook role.
+    Get a job's employment trend as CSV bytes, or None when it has no trend data.
+    Rendered once per job title and memoized like get_job_data.
     """
-    occ_code = "35-2014"  # SOC code for Cooks, Restaurant
-    standardized_title = "Restaurant Cook"
-    
-    # Occupation data with employment figures
-    occupation_data = {
-        "status": "success",
-        "latest_value": "1235800"  # Current employment from BLS stats
-    }
-    
-    # Projection data
-    projection_data = {
-        "projections": {
-            "current_employment": 1235800,
-            "projected_employment": 1334600,
-            "percent_change": 8.0,
-            "annual_job_openings": 178800
-        }
-    }
-    
-    # Calculate risk data
-    risk_data = {
-        "year_1_risk": 40.0,
-        "year_5_risk": 65.0,
-        "risk_category": "Moderate to High",
-        "risk_factors": [
-            "Food preparation robots are being deployed in fast food",
-            "Automated cooking systems can handle basic dishes",
-            "Recipe standardization reduces need for culinary judgment",
-            "Kitchen management software optimizes staffing and inventory",
-            "Delivery and takeout growth reduces in-restaurant dining"
-        ],
-        "protective_factors": [
-            "Creative culinary development requires human taste and judgment",
-            "Complex dishes need advanced cooking techniques",
-            "Fine dining experience depends on human execution",
-            "Menu development and food innovation remain human-centered",
-            "Food quality control requires human senses"
-        ],
-        "analysis": "Cooks face moderate to high displacement risk, with significant differences based on restaurant type. Fast food and chain restaurants are implementing automation for basic food preparation, while creative roles in upscale restaurants remain more protected. Cooks who develop specialized skills, culinary creativity, and management abilities will be more resilient to automation.",
-        "projected_growth": {
-            "percent_change": 8.0,
-            "analysis": "Moderate growth projected"
-        },
-        "automation_probability": 0.60,
-        "wage_trend": "Stable to increasing for specialized culinary skills",
-        "evolving_skills": [
-            "Culinary innovation and creativity", 
-            "Advanced cooking techniques",
-            "Menu development",
-            "Food science knowledge",
-            "Specialized cuisine expertise",
-            "Technology integration in kitchen operations"
-        ],
-        "skill_areas": {
-            "technical_skills": [
-                "Advanced cooking methods",
-                "Menu engineering",
-                "Food safety systems",
-                "Kitchen technology operations",
-                "Inventory management platforms"
-            ],
-            "soft_skills": [
-                "Team leadership",
-                "Time management under pressure",
-                "Creative problem-solving",
-                "Quality control",
-                "Sensory evaluation",
-                "Communication in dynamic environments"
-            ],
-            "transferable_skills": [
-                "Process optimization",
-                "Resource management",
-                "Team coordination",
-                "Multitasking",
-                "Quality assessment",
-                "Critical decision-making"
-            ]
-        }
-    }
-    
-    # Sample employment trend data
-    trend_years = list(range(2020, 2026))
-    trend_employment = [1100000, 1152000, 1235800, 1270000, 1305000, 1334600]
-    
-    # Sample similar jobs data
-    similar_jobs = [
-        {
-            "job_title": "Chef",
-            "occupation_code": "35-1011",
-            "year_1_risk": 30.0,
-            "year_5_risk": 50.0,
-            "risk_category": "Moderate"
-        },
-        {
-            "job_title": "Food Preparation Worker",
-            "occupation_code": "35-2021",
-            "year_1_risk": 65.0,
-            "year_5_risk": 85.0,
-            "risk_category": "Very High"
-        },
-        {
-            "job_title": "Baker",
-            "occupation_code": "51-3011",
-            "year_1_risk": 45.0,
-            "year_5_risk": 70.0,
-            "risk_category": "High"
-        },
-        {
-            "job_title": "Restaurant Manager",
-            "occupation_code": "11-9051",
-            "year_1_risk": 25.0,
-            "year_5_risk": 45.0,
-            "risk_category": "Moderate"
-        }
-    ]
-    
-    # Combine all data
-    result = {
-        "job_title": standardized_title,
-        "occupation_code": occ_code,
-        "source": "enhanced_data",
-        "employment_data": [],  # Not needed for display
-        "latest_employment": occupation_data["latest_value"],
-        "projections": projection_data["projections"],
-        "risk_analysis": risk_data,
-        "trend_data": {
-            "years": trend_years,
-            "employment": trend_employment
-        },
-        "similar_jobs": similar_jobs
-    }
-    
-    return result
+    trend_data = get_job_data(job_title).get("trend_data") or {}
+    if "years" not in trend_data or "employment" not in trend_data:
+        return None
+    return _trend_csv(trend_data)
 
 def get_teacher_data(job_title="Elementary School Teachers"):
     """
     Get comprehensive data for Teacher role.
     """
-    # Define rich data for Teachers
-    occ_code = "25-2021"  # SOC code for Elementary School Teachers
-    # Determine the correct title based on input
     if "middle" in job_title.lower():
-        standardized_title = "Middle School Teachers"
-        occ_code = "25-2022"  # SOC code for Middle School Teachers
-    else:
-        standardized_title = "Elementary School Teachers"
-    
-    # Occupation data with employment figures
-    occupation_data = {
-        "status": "success",
-        "latest_value": "1430000"  # Current employment from BLS stats
-    }
-    
-    # Projection data
-    projection_data = {
-        "projections": {
-            "current_employment": 1430000,
-            "projected_employment": 1515000,
-            "percent_change": 6.0,
-            "annual_job_openings": 124300
-        }
-    }
-    
-    # Calculate risk data with enhanced teacher details
-    risk_data = {
-        "year_1_risk": 15.0,
-        "year_5_risk": 30.0,
-        "risk_category": "Low",
-        "risk_factors": [
-            "AI tools can generate lesson plans and educational materials",
-            "Automated grading systems reduce administrative workload",
-            "Educational software can deliver standardized content",
-            "Virtual teaching platforms may reduce demand for in-person instruction"
-        ],
-        "protective_factors": [
-            "Building student relationships requires human empathy",
-            "Classroom management demands human judgment and adaptability",
-            "Personalized instruction requires understanding individual students",
-            "Mentoring and social-emotional support remain human-centered"
+        return _STATIC_JOBS["Middle School Teachers"]
+    return _STATIC_JOBS["Elementary School Teachers"]
+
+def get_teacher_json(job_title="Elementary School Teachers") -> bytes:
+    """Return get_teacher_data(job_title) pre-serialized as JSON bytes."""
+    return _STATIC_JOBS_JSON[get_teacher_data(job_title)["job_title"]]
+
+def _internal_category_risks(year_1_risk: float, year_5_risk: float) -> Dict[str, Any]:
+    """Risk scores and placeholder similar jobs for one get_internal_job_data category."""
+    return {
+        "risk_scores": {
+            "year_1": year_1_risk,
+            "year_5": year_5_risk
+        },
+        "similar_jobs": [
+            {
+                "job_title": "Related Position 1",
+                "occupation_code": "00-0001",
+                "year_1_risk": max(10, year_1_risk - 10),
+                "year_5_risk": max(20, year_5_risk - 10),
+                "risk_category": "Low to Moderate"
+            },
+            {
+                "job_title": "Related Position 2",
+                "occupation_code": "00-0002",
+                "year_1_risk": min(35, year_1_risk + 5),
+                "year_5_risk": min(60, year_5_risk + 10),
+                "risk_category": "Moderate to High"
+            }
         ]
     }
-    
-    # Provide skill recommendations
-    skill_data = {
+
+# Risk levels based on general industry trends, adjusted per job category
+_INTERNAL_CATEGORY_RISKS = {
+    "Technology": _internal_category_risks(15.0, 35.0),
+    "Healthcare": _internal_category_risks(15.0, 30.0),
+    "Education": _internal_category_risks(20.0, 35.0),
+    "General": _internal_category_risks(25.0, 45.0)
+}
+
+# Shared fields of every get_internal_job_data result, in response key order.
+# Per-call fields (title, category, risks, similar jobs, trend) are filled in by the caller.
+_INTERNAL_TEMPLATE = _intern_strings({
+    "job_title": None,
+    "occupation_code": "00-0000",  # Generic occupation code
+    "job_category": None,
+    "source": "internal_database",
+    "latest_employment": "Unknown",
+    "automation_probability": 45.0,
+    "risk_scores": None,
+    "risk_category": "Moderate",
+    "risk_factors": [
+        "AI and automation technologies continue to advance",
+        "Routine aspects of many jobs are becoming automated",
+        "Digital transformation is changing skill requirements",
+        "Task-specific AI tools are becoming more specialized"
+    ],
+    "protective_factors": [
+        "Complex problem-solving requires human judgment",
+        "Creative thinking and innovation are hard to automate",
+        "Human relationship management remains valuable",
+        "Strategic decision-making benefits from human experience"
+    ],
+    "projections": {
+        "percent_change": "Unknown",
+        "annual_job_openings": "Unknown"
+    },
+    "trend_data": None,
+    "similar_jobs": None,
+    "skills": {
         "future_proof_skills": [
-            "Personalized learning approaches",
-            "Technology integration in classroom",
-            "Social-emotional learning facilitation",
-            "Cross-disciplinary teaching methods",
-            "Adaptive learning techniques"
+            "Continuous learning",
+            "AI collaboration", 
+            "Complex problem solving",
+            "Digital literacy",
+            "Human-centered service"
         ],
         "skill_areas": {
             "technical_skills": [
-                "Educational technology platforms",
-                "Data-informed instruction",
-                "Digital content creation",
-                "Learning management systems",
-                "Assistive technology implementation"
+                "Digital literacy",
+                "Data analysis",
+                "Technology adaptation",
+                "Software proficiency",
+                "Process improvement"
             ],
             "soft_skills": [
-                "Empathetic communication",
-                "Crisis management",
-                "Cultural responsiveness",
-                "Collaborative leadership",
-                "Conflict resolution",
+                "Critical thinking",
+                "Adaptive problem solving",
+                "Communication",
+                "Collaboration",
                 "Emotional intelligence"
             ],
             "transferable_skills": [
-                "Curriculum development",
-                "Needs assessment",
-                "Performance evaluation",
-                "Group facilitation",
-                "Project-based learning design",
-                "Mentoring"
+                "Project management",
+                "Cross-functional collaboration",
+                "Research and analysis",
+                "Strategic planning",
+                "Stakeholder management"
             ]
         }
     }
-    
-    # Employment trend data will come from database now that we added teacher records
-    trend_years = list(range(2020, 2026))
-    if "middle" in job_title.lower():
-        trend_employment = [650000, 662000, 675000, 680000, 685000, 690000]
-    else:
-        trend_employment = [1370000, 1395000, 1410000, 1430000, 1470000, 1515000]
-    
-    # Sample similar jobs data
-    similar_jobs = [
-        {
-            "job_title": "School Counselor",
-            "occupation_code": "21-1012",
-            "year_1_risk": 12.0,
-            "year_5_risk": 25.0,
-            "risk_category": "Low"
-        },
-        {
-            "job_title": "Special Education Teacher",
-            "occupation_code": "25-2050",
-            "year_1_risk": 10.0,
-            "year_5_risk": 20.0,
-            "risk_category": "Low"
-        },
-        {
-            "job_title": "Educational Administrator",
-            "occupation_code": "11-9032",
-            "year_1_risk": 20.0,
-            "year_5_risk": 35.0,
-            "risk_category": "Moderate"
-        },
-        {
-            "job_title": "Instructional Coordinator",
-            "occupation_code": "25-9031",
-            "year_1_risk": 18.0,
-            "year_5_risk": 32.0,
-            "risk_category": "Moderate"
-        }
-    ]
-    
-    # Combine all data
-    result = {
-        "job_title": standardized_title,
-        "occupation_code": occ_code,
-        "source": "enhanced_data",
-        "employment_data": [],  # Not needed for display
-        "latest_employment": occupation_data["latest_value"],
-        "projections": projection_data["projections"],
-        "risk_analysis": risk_data,
-        "trend_data": {
-            "years": trend_years,
-            "employment": trend_employment
-        },
-        "similar_jobs": similar_jobs,
-        "skills": skill_data
-    }
-    
-    return result
+})
 
 def get_internal_job_data(job_title: str) -> Dict[str, Any]:
     """
@@ -1567,313 +597,264 @@ def get_internal_job_data(job_title: str) -> Dict[str, Any]:
     elif any(keyword in job_title.lower() for keyword in ["health", "medic", "nurs", "doctor", "care"]):
         job_category = "Healthcare"
     
-    # Set appropriate risk levels based on general industry trends
-    year_1_risk = 25.0
-    year_5_risk = 45.0
-    risk_category = "Moderate"
-    
-    # Adjust risk levels based on job category
-    if job_category == "Technology":
-        year_1_risk = 15.0
-        year_5_risk = 35.0
-    elif job_category == "Healthcare":
-        year_1_risk = 15.0
-        year_5_risk = 30.0
-    elif job_category == "Education":
-        year_1_risk = 20.0
-        year_5_risk = 35.0
-    
-    # Define risk factors based on job category
-    risk_factors = [
-        "AI and automation technologies continue to advance",
-        "Routine aspects of many jobs are becoming automated",
-        "Digital transformation is changing skill requirements",
-        "Task-specific AI tools are becoming more specialized"
-    ]
-    
-    # Define protective factors based on job category
-    protective_factors = [
-        "Complex problem-solving requires human judgment",
-        "Creative thinking and innovation are hard to automate",
-        "Human relationship management remains valuable",
-        "Strategic decision-making benefits from human experience"
-    ]
-    
-    # Define skill areas based on job category
-    skill_areas = {
-        "technical_skills": [
-            "Digital literacy",
-            "Data analysis",
-            "Technology adaptation",
-            "Software proficiency",
-            "Process improvement"
-        ],
-        "soft_skills": [
-            "Critical thinking",
-            "Adaptive problem solving",
-            "Communication",
-            "Collaboration",
-            "Emotional intelligence"
-        ],
-        "transferable_skills": [
-            "Project management",
-            "Cross-functional collaboration",
-            "Research and analysis",
-            "Strategic planning",
-            "Stakeholder management"
-        ]
-    }
-    
     # Return data in the format that app_production.py expects
     return {
+        **_INTERNAL_TEMPLATE,
         "job_title": job_title,
-        "occupation_code": "00-0000",  # Generic occupation code
         "job_category": job_category,
-        "source": "internal_database",
-        "latest_employment": "Unknown",
-        "automation_probability": 45.0,
-        "risk_scores": {
-            "year_1": year_1_risk,
-            "year_5": year_5_risk
-        },
-        "risk_category": risk_category,
-        "risk_factors": risk_factors,
-        "protective_factors": protective_factors,
-        "projections": {
-            "percent_change": "Unknown",
-            "annual_job_openings": "Unknown"
-        },
-        "trend_data": get_employment_trend(job_title),
-        "similar_jobs": [
-            {
-                "job_title": "Related Position 1",
-                "occupation_code": "00-0001",
-                "year_1_risk": max(10, year_1_risk - 10),
-                "year_5_risk": max(20, year_5_risk - 10),
-                "risk_category": "Low to Moderate"
-            },
-            {
-                "job_title": "Related Position 2",
-                "occupation_code": "00-0002",
-                "year_1_risk": min(35, year_1_risk + 5),
-                "year_5_risk": min(60, year_5_risk + 10),
-                "risk_category": "Moderate to High"
-            }
-        ],
-        "skills": {
-            "future_proof_skills": [
-                "Continuous learning",
-                "AI collaboration", 
-                "Complex problem solving",
-                "Digital literacy",
-                "Human-centered service"
-            ],
-            "skill_areas": skill_areas
-        }
+        **_INTERNAL_CATEGORY_RISKS.get(job_category, _INTERNAL_CATEGORY_RISKS["General"]),
+        "trend_data": get_employment_trend(job_title)
     }
 
-def calculate_displacement_risk(job_title: str, occ_code: str, 
-                               occupation_data: Dict[str, Any], 
-                               projection_data: Dict[str, Any]) -> Dict[str, Any]:
+# Projection-based starting point for calculate_displacement_risk: percent_change values up to and
+# including each threshold fall in the matching bucket, anything above the last one in the final bucket.
+# Each bucket is (year_1_risk, year_5_risk, risk_category, risk_factors, protective_factors, growth_analysis).
+_GROWTH_THRESHOLDS = (-20, -10, 0, 10)
+_GROWTH_BUCKETS = _intern_strings((
+    (60.0, 90.0, "Very High", ("BLS projects significant employment decline for this occupation",), (),
+     "Significant decline projected"),
+    (40.0, 75.0, "High", ("BLS projects moderate employment decline for this occupation",), (),
+     "Moderate decline projected"),
+    (25.0, 50.0, "Moderate", ("BLS projects slight employment decline for this occupation",), (),
+     "Slight decline projected"),
+    (15.0, 35.0, "Moderate", (), ("BLS projects slight employment growth for this occupation",),
+     "Slight growth projected"),
+    (10.0, 25.0, "Low", (), ("BLS projects significant employment growth for this occupation",),
+     "Strong growth projected")
+))
+
+class _SocGroupRule(NamedTuple):
     """
-    Calculate AI displacement risk based on BLS data and internal risk models.
-    
-    Args:
-        job_title: Standardized job title
-        occ_code: SOC occupation code
-        occupation_data: BLS occupation data
-        projection_data: BLS employment projections
-        
-    Returns:
-        Dictionary with risk analysis
+    Occupation-specific adjustment applied by calculate_displacement_risk.
+    delta1/delta5 shift the projection-based risks; risk_override, when set, replaces them.
     """
-    # Risk calculation would normally involve complex analysis of multiple factors
-    # This is a simplified implementation based on BLS projections and predefined risk factors
-    
-    risk_factors = []
-    protective_factors = []
-    
-    # Extract projections
-    projections = projection_data.get("projections", {})
-    percent_change = projections.get("percent_change", 0)
-    
-    # Base risk assessment on employment projections
-    if percent_change <= -20:
-        year_1_risk = 60.0
-        year_5_risk = 90.0
-        risk_category = "Very High"
-        risk_factors.append("BLS projects significant employment decline for this occupation")
-        growth_analysis = "Significant decline projected"
-    elif percent_change <= -10:
-        year_1_risk = 40.0
-        year_5_risk = 75.0
-        risk_category = "High"
-        risk_factors.append("BLS projects moderate employment decline for this occupation")
-        growth_analysis = "Moderate decline projected"
-    elif percent_change <= 0:
-        year_1_risk = 25.0
-        year_5_risk = 50.0
-        risk_category = "Moderate"
-        risk_factors.append("BLS projects slight employment decline for this occupation")
-        growth_analysis = "Slight decline projected"
-    elif percent_change <= 10:
-        year_1_risk = 15.0
-        year_5_risk = 35.0
-        risk_category = "Moderate"
-        protective_factors.append("BLS projects slight employment growth for this occupation")
-        growth_analysis = "Slight growth projected"
-    else:
-        year_1_risk = 10.0
-        year_5_risk = 25.0
-        risk_category = "Low"
-        protective_factors.append("BLS projects significant employment growth for this occupation")
-        growth_analysis = "Strong growth projected"
-    
-    # Add occupation-specific risk factors based on SOC code groups
-    soc_major_group = occ_code.split('-')[0]
-    
-    # Initialize new metrics
-    wage_trend = "Stable"
-    automation_probability = 0.0
-    evolving_skills = []
-    
+    risk_factors: tuple
+    protective_factors: tuple
+    delta1: float
+    delta5: float
+    automation_probability: float
+    wage_trend: str
+    evolving_skills: tuple
+    risk_override: Optional[tuple] = None
+
+# Rules keyed by SOC major group
+_SOC_GROUP_RULES = _intern_strings({
     # Administrative support occupations (43-XXXX)
-    if soc_major_group == "43":
-        risk_factors.append("Administrative tasks are highly susceptible to automation")
-        risk_factors.append("Document processing can be handled by AI systems")
-        year_1_risk += 10.0
-        year_5_risk += 15.0
-        automation_probability = 0.75
-        wage_trend = "Declining"
-        evolving_skills = [
+    "43": _SocGroupRule(
+        risk_factors=(
+            "Administrative tasks are highly susceptible to automation",
+            "Document processing can be handled by AI systems"
+        ),
+        protective_factors=(),
+        delta1=10.0, delta5=15.0,
+        automation_probability=0.75,
+        wage_trend="Declining",
+        evolving_skills=(
             "Advanced data analysis", 
             "Digital process management",
             "Client relationship management"
-        ]
-    
+        )
+    ),
     # Computer occupations (15-XXXX)
-    elif soc_major_group == "15":
-        risk_factors.append("Automated code generation is improving rapidly")
-        protective_factors.append("Complex problem-solving still requires human insight")
-        automation_probability = 0.35
-        wage_trend = "Increasing"
-        evolving_skills = [
+    "15": _SocGroupRule(
+        risk_factors=("Automated code generation is improving rapidly",),
+        protective_factors=("Complex problem-solving still requires human insight",),
+        delta1=0.0, delta5=0.0,
+        automation_probability=0.35,
+        wage_trend="Increasing",
+        evolving_skills=(
             "AI/ML engineering", 
             "Cloud architecture",
             "Cybersecurity expertise"
-        ]
-    
+        )
+    ),
     # Healthcare practitioners (29-XXXX)
-    elif soc_major_group == "29":
-        protective_factors.append("Direct patient care requires human empathy and dexterity")
-        year_1_risk -= 5.0
-        year_5_risk -= 10.0
-        automation_probability = 0.20
-        wage_trend = "Increasing"
-        evolving_skills = [
+    "29": _SocGroupRule(
+        risk_factors=(),
+        protective_factors=("Direct patient care requires human empathy and dexterity",),
+        delta1=-5.0, delta5=-10.0,
+        automation_probability=0.20,
+        wage_trend="Increasing",
+        evolving_skills=(
             "Telemedicine competence", 
             "Medical technology operation",
             "Patient data interpretation"
-        ]
-    
+        )
+    ),
     # Transportation occupations (53-XXXX)
-    elif soc_major_group == "53":
-        risk_factors.append("Autonomous vehicle technology is developing rapidly")
-        year_1_risk += 5.0
-        year_5_risk += 10.0
-        automation_probability = 0.65
-        wage_trend = "Stable to declining"
-        evolving_skills = [
+    "53": _SocGroupRule(
+        risk_factors=("Autonomous vehicle technology is developing rapidly",),
+        protective_factors=(),
+        delta1=5.0, delta5=10.0,
+        automation_probability=0.65,
+        wage_trend="Stable to declining",
+        evolving_skills=(
             "Advanced vehicle systems", 
             "Logistics optimization",
             "Remote monitoring"
-        ]
-    
+        )
+    ),
     # Management occupations (11-XXXX)
-    elif soc_major_group == "11":
-        protective_factors.append("Strategic decision-making requires human judgment")
-        protective_factors.append("Complex stakeholder management requires human relationships")
-        risk_factors.append("Project management software becoming increasingly automated")
-        year_1_risk = 35.0
-        year_5_risk = 60.0
-        automation_probability = 0.45
-        wage_trend = "Stable to increasing, depending on specialization"
-        evolving_skills = [
+    "11": _SocGroupRule(
+        risk_factors=("Project management software becoming increasingly automated",),
+        protective_factors=(
+            "Strategic decision-making requires human judgment",
+            "Complex stakeholder management requires human relationships"
+        ),
+        delta1=0.0, delta5=0.0,
+        risk_override=(35.0, 60.0),
+        automation_probability=0.45,
+        wage_trend="Stable to increasing, depending on specialization",
+        evolving_skills=(
             "AI tools implementation and oversight", 
             "Data-driven decision making",
             "Agile management practices",
             "Cross-functional leadership",
             "Change management expertise"
-        ]
-    
+        )
+    ),
     # Education occupations (25-XXXX)
-    elif soc_major_group == "25":
-        protective_factors.append("Teaching requires adaptability and emotional intelligence")
-        year_1_risk -= 3.0
-        year_5_risk -= 7.0
-        automation_probability = 0.30
-        wage_trend = "Stable"
-        evolving_skills = [
+    "25": _SocGroupRule(
+        risk_factors=(),
+        protective_factors=("Teaching requires adaptability and emotional intelligence",),
+        delta1=-3.0, delta5=-7.0,
+        automation_probability=0.30,
+        wage_trend="Stable",
+        evolving_skills=(
             "Educational technology proficiency", 
             "Personalized learning approaches",
             "Digital content creation"
-        ]
-    
+        )
+    ),
     # Sales occupations (41-XXXX)
-    elif soc_major_group == "41":
-        risk_factors.append("Online shopping and self-service technologies reduce demand")
-        year_1_risk += 8.0
-        year_5_risk += 12.0
-        automation_probability = 0.55
-        wage_trend = "Declining for basic roles, increasing for consultative sales"
-        evolving_skills = [
+    "41": _SocGroupRule(
+        risk_factors=("Online shopping and self-service technologies reduce demand",),
+        protective_factors=(),
+        delta1=8.0, delta5=12.0,
+        automation_probability=0.55,
+        wage_trend="Declining for basic roles, increasing for consultative sales",
+        evolving_skills=(
             "Consultative selling", 
             "Customer experience design",
             "Digital marketing"
-        ]
-    
+        )
+    ),
     # Food preparation (35-XXXX)
-    elif soc_major_group == "35":
-        risk_factors.append("Food preparation and service seeing increased automation")
-        year_1_risk += 7.0
-        year_5_risk += 14.0
-        automation_probability = 0.60
-        wage_trend = "Stable to declining"
-        evolving_skills = [
+    "35": _SocGroupRule(
+        risk_factors=("Food preparation and service seeing increased automation",),
+        protective_factors=(),
+        delta1=7.0, delta5=14.0,
+        automation_probability=0.60,
+        wage_trend="Stable to declining",
+        evolving_skills=(
             "Culinary specialization", 
             "Customer experience",
             "Food safety and quality management"
-        ]
-    
+        )
+    ),
     # Production occupations (51-XXXX)
-    elif soc_major_group == "51":
-        risk_factors.append("Manufacturing processes increasingly automated")
-        year_1_risk += 12.0
-        year_5_risk += 18.0
-        automation_probability = 0.80
-        wage_trend = "Declining"
-        evolving_skills = [
+    "51": _SocGroupRule(
+        risk_factors=("Manufacturing processes increasingly automated",),
+        protective_factors=(),
+        delta1=12.0, delta5=18.0,
+        automation_probability=0.80,
+        wage_trend="Declining",
+        evolving_skills=(
             "Advanced manufacturing tech", 
             "Quality control systems",
             "Process optimization"
-        ]
+        )
+    )
+})
+
+# Default values for other occupations
+_DEFAULT_SOC_GROUP_RULE = _intern_strings(_SocGroupRule(
+    risk_factors=(),
+    protective_factors=(),
+    delta1=0.0, delta5=0.0,
+    automation_probability=0.40,  # Average
+    wage_trend="Varies by specialization",
+    evolving_skills=(
+        "Digital literacy", 
+        "Data analysis",
+        "Adaptability and continuous learning"
+    )
+))
+
+# Shared read-only fallback for missing projections, so lookups don't allocate a dict per call
+_EMPTY: Dict[str, Any] = {}
+
+def calculate_displacement_risk(job_title: str, occ_code: str, 
+                               occupation_data: Dict[str, Any], 
+                               projection_data: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Calculate AI displacement risk based on BLS data and internal risk models.
+    
+    Args:
+        job_title: Standardized job title
+        occ_code: SOC occupation code
+        occupation_data: BLS occupation data
+        projection_data: BLS employment projections
+        
+    Returns:
+        Dictionary with risk analysis
+    """
+    # Extract projections
+    projections = projection_data.get("projections") or _EMPTY
+    percent_change = projections.get("percent_change", 0)
     
-    # Default values for other occupations
+    return _calculate_displacement_risk_cached(job_title, occ_code, percent_change)
+
+@functools.lru_cache(maxsize=2048)
+def _risk_scores(occ_code: str, percent_change: float) -> Tuple[float, float, str]:
+    """
+    The (year_1_risk, year_5_risk, risk_category) part of the risk analysis.
+    Neither the job title nor the analysis text is needed for it.
+    """
+    # Base risk assessment on employment projections
+    year_1_risk, year_5_risk, risk_category = \
+        _GROWTH_BUCKETS[bisect.bisect_left(_GROWTH_THRESHOLDS, percent_change)][:3]
+    
+    # Occupation-specific adjustment based on SOC code groups
+    soc_major_group = occ_code[:2]  # SOC codes are fixed-width NN-NNNN
+    rule = _SOC_GROUP_RULES.get(soc_major_group, _DEFAULT_SOC_GROUP_RULE)
+    if rule.risk_override is not None:
+        year_1_risk, year_5_risk = rule.risk_override
     else:
-        automation_probability = 0.40  # Average
-        wage_trend = "Varies by specialization"
-        evolving_skills = [
-            "Digital literacy", 
-            "Data analysis",
-            "Adaptability and continuous learning"
-        ]
+        year_1_risk += rule.delta1
+        year_5_risk += rule.delta5
     
     # Ensure risk values are within bounds
-    year_1_risk = max(5.0, min(95.0, year_1_risk))
-    year_5_risk = max(10.0, min(95.0, year_5_risk))
+    year_1_risk = 5.0 if year_1_risk < 5.0 else 95.0 if year_1_risk > 95.0 else year_1_risk
+    year_5_risk = 10.0 if year_5_risk < 10.0 else 95.0 if year_5_risk > 95.0 else year_5_risk
+    
+    # Make sure 5-year risk is at least 5 points above the 1-year risk
+    if year_5_risk < year_1_risk + 5.0:
+        year_5_risk = year_1_risk + 5.0
+    
+    return year_1_risk, year_5_risk, risk_category
+
+@functools.lru_cache(maxsize=2048)
+def _calculate_displacement_risk_cached(job_title: str, occ_code: str, percent_change: float) -> Dict[str, Any]:
+    """
+    Risk analysis for calculate_displacement_risk, memoized on its only inputs.
+    The result is shared between callers, so its factor and skill lists are tuples.
+    """
+    # Risk calculation would normally involve complex analysis of multiple factors
+    # This is a simplified implementation based on BLS projections and predefined risk factors
     
-    # Make sure 5-year risk is at least as high as 1-year risk
-    year_5_risk = max(year_5_risk, year_1_risk + 5.0)
+    # Base risk assessment on employment projections
+    _, _, _, growth_risk_factors, growth_protective_factors, growth_analysis = \
+        _GROWTH_BUCKETS[bisect.bisect_left(_GROWTH_THRESHOLDS, percent_change)]
+    year_1_risk, year_5_risk, risk_category = _risk_scores(occ_code, percent_change)
+    
+    # Add occupation-specific risk factors based on SOC code groups
+    rule = _SOC_GROUP_RULES.get(occ_code[:2], _DEFAULT_SOC_GROUP_RULE)
+    risk_factors = growth_risk_factors + rule.risk_factors
+    protective_factors = growth_protective_factors + rule.protective_factors
+    automation_probability = rule.automation_probability
+    wage_trend = rule.wage_trend
+    evolving_skills = rule.evolving_skills
     
     # Generate analysis text
     analysis = generate_analysis_text(job_title, risk_category, risk_factors, protective_factors)
@@ -1895,6 +876,70 @@ def calculate_displacement_risk(job_title: str, occ_code: str,
         "evolving_skills": evolving_skills
     }
 
+# Columnar copies of the growth buckets and SOC group rules for calculate_displacement_risks_batch
+_BUCKET_YEAR_1 = np.array([bucket[0] for bucket in _GROWTH_BUCKETS])
+_BUCKET_YEAR_5 = np.array([bucket[1] for bucket in _GROWTH_BUCKETS])
+_BUCKET_CATEGORY = np.array([bucket[2] for bucket in _GROWTH_BUCKETS], dtype=object)
+_GROUP_KEYS = np.array(sorted(_SOC_GROUP_RULES))
+_GROUP_RULE_ROWS = [_SOC_GROUP_RULES[key] for key in _GROUP_KEYS] + [_DEFAULT_SOC_GROUP_RULE]
+_GROUP_DELTA1 = np.array([rule.delta1 for rule in _GROUP_RULE_ROWS])
+_GROUP_DELTA5 = np.array([rule.delta5 for rule in _GROUP_RULE_ROWS])
+_GROUP_HAS_OVERRIDE = np.array([rule.risk_override is not None for rule in _GROUP_RULE_ROWS])
+_GROUP_OVERRIDE1 = np.array([(rule.risk_override or (0.0, 0.0))[0] for rule in _GROUP_RULE_ROWS])
+_GROUP_OVERRIDE5 = np.array([(rule.risk_override or (0.0, 0.0))[1] for rule in _GROUP_RULE_ROWS])
+_GROUP_AUTO_PROB = np.array([rule.automation_probability for rule in _GROUP_RULE_ROWS])
+for _column in (_BUCKET_YEAR_1, _BUCKET_YEAR_5, _BUCKET_CATEGORY, _GROUP_KEYS, _GROUP_DELTA1,
+                _GROUP_DELTA5, _GROUP_HAS_OVERRIDE, _GROUP_OVERRIDE1, _GROUP_OVERRIDE5, _GROUP_AUTO_PROB):
+    _column.flags.writeable = False
+del _column
+
+def calculate_displacement_risks_batch(occ_codes, percent_changes) -> Dict[str, np.ndarray]:
+    """
+    Score many occupations at once with the same rules as calculate_displacement_risk.
+    
+    Args:
+        occ_codes: Sequence of SOC occupation codes
+        percent_changes: Sequence of projected employment changes, aligned with occ_codes
+        
+    Returns:
+        Dictionary of aligned arrays: year_1_risk, year_5_risk, risk_category, automation_probability
+    """
+    percent_changes = np.asarray(percent_changes, dtype=float)
+    major_groups = np.array([code[:2] for code in occ_codes], dtype=_GROUP_KEYS.dtype)
+    
+    # Base risk from the employment projection bucket
+    buckets = np.searchsorted(_GROWTH_THRESHOLDS, percent_changes, side="left")
+    year_1_risk = _BUCKET_YEAR_1[buckets]
+    year_5_risk = _BUCKET_YEAR_5[buckets]
+    
+    # Row of each SOC major group; unknown groups use the trailing default row
+    rows = np.searchsorted(_GROUP_KEYS, major_groups)
+    found = _GROUP_KEYS[np.minimum(rows, len(_GROUP_KEYS) - 1)] == major_groups
+    rows = np.where(found, rows, len(_GROUP_KEYS))
+    
+    override = _GROUP_HAS_OVERRIDE[rows]
+    year_1_risk = np.where(override, _GROUP_OVERRIDE1[rows], year_1_risk + _GROUP_DELTA1[rows])
+    year_5_risk = np.where(override, _GROUP_OVERRIDE5[rows], year_5_risk + _GROUP_DELTA5[rows])
+    
+    # Same bounds as the single-job path
+    year_1_risk = np.clip(year_1_risk, 5.0, 95.0)
+    year_5_risk = np.maximum(np.clip(year_5_risk, 10.0, 95.0), year_1_risk + 5.0)
+    
+    return {
+        "year_1_risk": year_1_risk,
+        "year_5_risk": year_5_risk,
+        "risk_category": _BUCKET_CATEGORY[buckets],
+        "automation_probability": _GROUP_AUTO_PROB[rows]
+    }
+
+# Analysis sentence per risk category, appended to the job title; unknown categories read as "Low"
+_ANALYSIS_SUFFIXES = {
+    "Very High": "s face extremely high displacement risk as AI and automation technologies advance rapidly. Within 5 years, most routine aspects of this role may be automated.",
+    "High": "s face significant displacement risk, though roles requiring complex judgment and specialized skills will be more resilient to automation.",
+    "Moderate": "s face moderate automation risk. While some aspects of the role may be automated, human expertise will remain valuable, especially for complex tasks.",
+    "Low": "s have relatively low displacement risk due to the complexity, creativity, or human elements required in this role. Technology will likely augment rather than replace these positions."
+}
+
 def generate_analysis_text(job_title: str, risk_category: str, 
                           risk_factors: List[str], protective_factors: List[str]) -> str:
     """
@@ -1909,14 +954,20 @@ def generate_analysis_text(job_title: str, risk_category: str,
     Returns:
         Analysis text
     """
-    if risk_category == "Very High":
-        return f"{job_title}s face extremely high displacement risk as AI and automation technologies advance rapidly. Within 5 years, most routine aspects of this role may be automated."
-    elif risk_category == "High":
-        return f"{job_title}s face significant displacement risk, though roles requiring complex judgment and specialized skills will be more resilient to automation."
-    elif risk_category == "Moderate":
-        return f"{job_title}s face moderate automation risk. While some aspects of the role may be automated, human expertise will remain valuable, especially for complex tasks."
-    else:  # Low
-        return f"{job_title}s have relatively low displacement risk due to the complexity, creativity, or human elements required in this role. Technology will likely augment rather than replace these positions."
+    return _analysis_text(job_title, risk_category)
+
+@functools.lru_cache(maxsize=1024)
+def _analysis_text(job_title: str, risk_category: str) -> str:
+    """Analysis text for a (job title, risk category) pair; the factor lists do not affect it."""
+    return job_title + _ANALYSIS_SUFFIXES.get(risk_category, _ANALYSIS_SUFFIXES["Low"])
+
+@functools.lru_cache(maxsize=JOB_DATA_CACHE_SIZE)
+def get_similar_jobs_columns(job_title: str) -> Dict[str, Any]:
+    """
+    Get the similar jobs for a job title in columnar form (see similar_jobs_columns).
+    The list-of-dicts "similar_jobs" in get_job_data results is unchanged.
+    """
+    return similar_jobs_columns(get_job_data(job_title).get("similar_jobs", []))
 
 def search_similar_jobs(job_title: str, limit: int = 5) -> List[Dict[str, Any]]:
     """
@@ -1932,46 +983,41 @@ def search_similar_jobs(job_title: str, limit: int = 5) -> List[Dict[str, Any]]:
     # This would normally query the BLS API for related occupations
     # For now, return a simplified implementation
     
+    # Normalize once; the same key drives the search, its memo cache and the filter
+    title_key = job_title.strip().casefold()
+    
     # Get occupation matches
-    occupation_matches = bls_connector.search_occupations(job_title)
+    occupation_matches = bls_connector.search_occupations(title_key)
+    
+    if not occupation_matches:
+        return []
     
     # Get the SOC major group for finding related occupations
-    if occupation_matches:
-        occ_code = occupation_matches[0]["code"]
-        soc_major_group = occ_code.split('-')[0]
-        
-        # Find other occupations in the same major group
-        all_occupations = bls_connector.search_occupations(soc_major_group)
-        
-        # Filter out the original job
-        similar_jobs = [occ for occ in all_occupations 
-                       if occ["title"].lower() != job_title.lower()]
-        
-        # Limit results
-        similar_jobs = similar_jobs[:limit]
-        
-        # Get risk data for each job
-        results = []
-        for job in similar_jobs:
-            # Get basic risk data without full analysis
-            risk_data = calculate_displacement_risk(
-                job_title=job["title"],
-                occ_code=job["code"],
-                occupation_data={"status": "simplified"},
-                projection_data={"projections": {}}
-            )
-            
-            results.append({
-                "job_title": job["title"],
-                "occupation_code": job["code"],
-                "year_1_risk": risk_data["year_1_risk"],
-                "year_5_risk": risk_data["year_5_risk"],
-                "risk_category": risk_data["risk_category"]
-            })
-        
-        return results
+    occ_code = occupation_matches[0]["code"]
+    soc_major_group = occ_code[:2]  # SOC codes are fixed-width NN-NNNN
+    
+    # Find other occupations in the same major group
+    all_occupations = bls_connector.search_occupations(soc_major_group)
     
-    return []
+    # Filter out the original job, stopping once limit results are found
+    similar_jobs = list(itertools.islice(
+        (occ for occ in all_occupations if occ["title"].casefold() != title_key), limit))
+    
+    # Score all of them in one batch, without full analysis (no projections, so 0% change)
+    risks = calculate_displacement_risks_batch([job["code"] for job in similar_jobs],
+                                               [0] * len(similar_jobs))
+    return [
+        {
+            "job_title": job["title"],
+            "occupation_code": job["code"],
+            "year_1_risk": year_1_risk,
+            "year_5_risk": year_5_risk,
+            "risk_category": risk_category
+        }
+        for job, year_1_risk, year_5_risk, risk_category in zip(
+            similar_jobs, risks["year_1_risk"].tolist(), risks["year_5_risk"].tolist(),
+            risks["risk_category"].tolist())
+    ]
 
 def get_employment_trend(job_title: str, years: int = 5) -> Dict[str, Any]:
     """
@@ -2014,8 +1060,44 @@ def get_employment_trend(job_title: str, years: int = 5) -> Dict[str, Any]:
         "job_title": best_match["title"],
         "occupation_code": occ_code
     }
+
+# Async variants run the blocking lookups in worker threads, so callers can overlap
+# BLS round trips (e.g. a job's data, trend and similar jobs) with asyncio.gather.
+# Maximum number of get_job_data calls in flight at once for get_jobs_data_async
+MAX_CONCURRENT_LOOKUPS = 4
+
+async def get_job_data_async(job_title: str) -> Dict[str, Any]:
+    """get_job_data in a worker thread"""
+    return await asyncio.to_thread(get_job_data, job_title)
+
+async def get_employment_trend_async(job_title: str, years: int = 5) -> Dict[str, Any]:
+    """get_employment_trend in a worker thread"""
+    return await asyncio.to_thread(get_employment_trend, job_title, years)
+
+async def search_similar_jobs_async(job_title: str, limit: int = 5) -> List[Dict[str, Any]]:
+    """search_similar_jobs in a worker thread"""
+    return await asyncio.to_thread(search_similar_jobs, job_title, limit)
+
+async def get_jobs_data_async(job_titles: List[str]) -> List[Dict[str, Any]]:
+    """
+    Get job data for several titles concurrently.
+    
+    Args:
+        job_titles: The job titles to look up
+        
+    Returns:
+        One get_job_data result per title, in order
+    """
+    semaphore = asyncio.Semaphore(MAX_CONCURRENT_LOOKUPS)
+    
+    async def lookup(job_title: str) -> Dict[str, Any]:
+        async with semaphore:
+            return await get_job_data_async(job_title)
+    
+    return await asyncio.gather(*(lookup(job_title) for job_title in job_titles))
     
 # Add Web Developer function
+@_static_payload
 def get_web_developer_data():
     """
     Get comprehensive data for Web Developer role.
@@ -2098,8 +1180,7 @@ def get_web_developer_data():
     }
     
     # Historical employment trend
-    trend_years = list(range(2020, 2026))
-    trend_employment = [174300, 182100, 192500, 199400, 212600, 224800]
+    trend_employment = np.array([174300, 182100, 192500, 199400, 212600, 224800], dtype=_TREND_DTYPE)
     
     # Sample similar jobs data
     similar_jobs = [
@@ -2143,7 +1224,7 @@ def get_web_developer_data():
         "projections": projection_data["projections"],
         "risk_analysis": risk_data,
         "trend_data": {
-            "years": trend_years,
+            "years": _TREND_YEARS,
             "employment": trend_employment
         },
         "similar_jobs": similar_jobs
@@ -2152,6 +1233,7 @@ def get_web_developer_data():
     return result
     
 # Add dedicated functions for Business Analyst and UI Developer jobs
+@_static_payload
 def get_business_analyst_data():
     """
     Get comprehensive data for Business Analyst role.
@@ -2234,8 +1316,7 @@ def get_business_analyst_data():
     }
     
     # Historical employment trend
-    trend_years = list(range(2020, 2026))
-    trend_employment = [876200, 899400, 926700, 950600, 986800, 1032200]
+    trend_employment = np.array([876200, 899400, 926700, 950600, 986800, 1032200], dtype=_TREND_DTYPE)
     
     # Sample similar jobs data
     similar_jobs = [
@@ -2279,7 +1360,7 @@ def get_business_analyst_data():
         "projections": projection_data["projections"],
         "risk_analysis": risk_data,
         "trend_data": {
-            "years": trend_years,
+            "years": _TREND_YEARS,
             "employment": trend_employment
         },
         "similar_jobs": similar_jobs
@@ -2287,6 +1368,7 @@ def get_business_analyst_data():
     
     return result
     
+@_static_payload
 def get_diagnosician_data():
     """
     Get comprehensive data for Diagnosician role.
@@ -2326,8 +1408,8 @@ def get_diagnosician_data():
             }
         },
         "trend_data": {
-            "years": [2018, 2019, 2020, 2021, 2022, 2023],
-            "employment": [65200, 68400, 70800, 73600, 76100, 78300]
+            "years": np.arange(2018, 2024, dtype=_TREND_DTYPE),
+            "employment": np.array([65200, 68400, 70800, 73600, 76100, 78300], dtype=_TREND_DTYPE)
         },
         "similar_jobs": [
             {
@@ -2349,13 +1431,9 @@ def get_diagnosician_data():
         ]
     }
     
-    # Add to cache for future use
-    _job_cache["diagnosician"] = result
-    _job_cache["diagnoscian"] = result
-    _job_cache["medical diagnostician"] = result
-    
     return result
 
+@_static_payload
 def get_ui_developer_data():
     """
     Get comprehensive data for UI Developer role.
@@ -2438,8 +1516,7 @@ def get_ui_developer_data():
     }
     
     # Historical employment trend
-    trend_years = list(range(2020, 2026))
-    trend_employment = [166500, 174200, 182300, 192800, 208000, 222900]
+    trend_employment = np.array([166500, 174200, 182300, 192800, 208000, 222900], dtype=_TREND_DTYPE)
     
     # Sample similar jobs data
     similar_jobs = [
@@ -2483,10 +1560,84 @@ def get_ui_developer_data():
         "projections": projection_data["projections"],
         "risk_analysis": risk_data,
         "trend_data": {
-            "years": trend_years,
+            "years": _TREND_YEARS,
             "employment": trend_employment
         },
         "similar_jobs": similar_jobs
     }
     
-    return result
\ No newline at end of file
+    return result
+
+def _updated_nurse_data():
+    """new_nurse_data's payload with its trend series as int32 arrays, like the other static jobs."""
+    payload = get_updated_nurse_data()
+    trend = payload["trend_data"]
+    years = trend["years"]
+    payload["trend_data"] = {
+        **trend,
+        "years": _TREND_YEARS if list(years) == _TREND_YEARS.tolist() else np.array(years, dtype=_TREND_DTYPE),
+        "employment": np.array(trend["employment"], dtype=_TREND_DTYPE)
+    }
+    return payload
+
+# new_nurse_data rebuilds its payload on every call; build and freeze it once at import
+_get_updated_nurse_data = _static_payload(_updated_nurse_data)
+
+# JSON encodings of the hard-coded payloads, built once at import
+_WEB_DEVELOPER_JSON = _payload_json(get_web_developer_data())
+_BUSINESS_ANALYST_JSON = _payload_json(get_business_analyst_data())
+_UI_DEVELOPER_JSON = _payload_json(get_ui_developer_data())
+_DIAGNOSICIAN_JSON = _payload_json(get_diagnosician_data())
+
+def get_web_developer_json() -> bytes:
+    """Return get_web_developer_data() pre-serialized as JSON bytes."""
+    return _WEB_DEVELOPER_JSON
+
+def get_business_analyst_json() -> bytes:
+    """Return get_business_analyst_data() pre-serialized as JSON bytes."""
+    return _BUSINESS_ANALYST_JSON
+
+def get_ui_developer_json() -> bytes:
+    """Return get_ui_developer_data() pre-serialized as JSON bytes."""
+    return _UI_DEVELOPER_JSON
+
+def get_diagnosician_json() -> bytes:
+    """Return get_diagnosician_data() pre-serialized as JSON bytes."""
+    return _DIAGNOSICIAN_JSON
+
+# Job title aliases (casefolded) -> builder for jobs with enhanced data.
+# Defined last so every builder above is already bound.
+JOB_DATA_BUILDERS = {
+    "project manager": get_project_manager_data,
+    "nurse": _get_updated_nurse_data,
+    "registered nurse": _get_updated_nurse_data,
+    "retail sales": get_retail_sales_data,
+    "retail salesperson": get_retail_sales_data,
+    "sales associate": get_retail_sales_data,
+    "cook": get_cook_data,
+    "chef": get_cook_data,
+    "food preparation": get_cook_data,
+    "business analyst": get_business_analyst_data,
+    "business systems analyst": get_business_analyst_data,
+    "ba": get_business_analyst_data,
+    "diagnosician": get_diagnosician_data,
+    "diagnoscian": get_diagnosician_data,
+    "medical diagnostician": get_diagnosician_data,
+    "ui developer": get_ui_developer_data,
+    "ui designer": get_ui_developer_data,
+    "user interface developer": get_ui_developer_data,
+    "web developer": get_web_developer_data,
+    "web programmer": get_web_developer_data,
+    "website developer": get_web_developer_data,
+    "web dev": get_web_developer_data,
+    "teacher": functools.partial(get_teacher_data, "Elementary School Teachers"),
+    "educator": functools.partial(get_teacher_data, "Elementary School Teachers"),
+    "instructor": functools.partial(get_teacher_data, "Elementary School Teachers"),
+    "elementary school teachers": functools.partial(get_teacher_data, "Elementary School Teachers"),
+    "elementary teacher": functools.partial(get_teacher_data, "Elementary School Teachers"),
+    "middle school teachers": functools.partial(get_teacher_data, "Middle School Teachers"),
+    "middle school teacher": functools.partial(get_teacher_data, "Middle School Teachers"),
+    "court reporter": get_court_reporter_data,
+    "digital court reporter": get_court_reporter_data,
+    "stenographer": get_court_reporter_data
+}
@@ -4,12 +4,29 @@ This module combines BLS employment data with AI displacement risk analysis.
 """
 import bls_connector
 from typing import Dict, Any, List, Optional
+import sys
 import time
+import functools
+import itertools
+import threading
+from collections import OrderedDict
 import pandas as pd
+import numpy as np
 import bls_job_mapper
+from job_api_integration import _intern_strings
 
-# Cache for storing processed job data to minimize redundant processing
-_job_cache = {}
+# Bounded LRU cache for processed job data (least recently used entries first)
+JOB_CACHE_MAX_SIZE = 2048
+_job_cache = OrderedDict()
+_job_cache_lock = threading.Lock()
+
+def _cache_job_data(job_title: str, job_data: Dict[str, Any]) -> None:
+    """Store job data, evicting the least recently used entry past JOB_CACHE_MAX_SIZE"""
+    with _job_cache_lock:
+        _job_cache[job_title] = job_data
+        _job_cache.move_to_end(job_title)
+        if len(_job_cache) > JOB_CACHE_MAX_SIZE:
+            _job_cache.popitem(last=False)
 
 def get_job_data(job_title: str) -> Dict[str, Any]:
     """
@@ -22,8 +39,10 @@ def get_job_data(job_title: str) -> Dict[str, Any]:
         Dictionary with combined job data
     """
     # Check cache first for better performance
-    if job_title in _job_cache:
-        return _job_cache[job_title]
+    with _job_cache_lock:
+        if job_title in _job_cache:
+            _job_cache.move_to_end(job_title)
+            return _job_cache[job_title]
     
     # Special case handling for common jobs with custom data
     special_handlers = {
@@ -46,7 +65,7 @@ def get_job_data(job_title: str) -> Dict[str, Any]:
             job_data = handler()
             
             # Cache the result
-            _job_cache[job_title] = job_data
+            _cache_job_data(job_title, job_data)
             return job_data
     
     # For all other job titles, use the dynamic BLS data mapper
@@ -55,7 +74,7 @@ def get_job_data(job_title: str) -> Dict[str, Any]:
         job_data = bls_job_mapper.get_complete_job_data(job_title)
         
         # Cache the result
-        _job_cache[job_title] = job_data
+        _cache_job_data(job_title, job_data)
         return job_data
         
     except Exception as e:
@@ -66,7 +85,18 @@ def get_job_data(job_title: str) -> Dict[str, Any]:
 # Keep all your existing special job data functions as fallbacks
 # (get_project_manager_data, get_nurse_data, etc.)
 
+def _interned_payload(builder):
+    """
+    Memoize a zero-argument job data builder, interning and freezing its payload
+    with job_api_integration._intern_strings (the same helper its static payloads use)
+    """
+    @functools.wraps(builder)
+    def wrapper():
+        return _intern_strings(builder())
+    return functools.cache(wrapper)
 
+
+@_interned_payload
 def get_project_manager_data():
     """
     Get comprehensive data for Project Manager role.
@@ -206,6 +236,7 @@ def get_project_manager_data():
     return result
 
 
+@_interned_payload
 def get_nurse_data():
     """
     Get comprehensive data for Nurse role.
@@ -343,6 +374,7 @@ def get_nurse_data():
     return result
 
 
+@_interned_payload
 def get_retail_sales_data():
     """
     Get comprehensive data for Retail Sales role.
@@ -481,6 +513,7 @@ def get_retail_sales_data():
     return result
 
 
+@_interned_payload
 def get_cook_data():
     """
     Get comprehensive data for Cook role.
@@ -620,6 +653,7 @@ def get_cook_data():
     return result
 
 
+@_interned_payload
 def get_teacher_data():
     """
     Get comprehensive data for Teacher role.
@@ -755,6 +789,7 @@ def get_teacher_data():
     return result
 
 
+@_interned_payload
 def get_web_developer_data():
     """
     Get comprehensive data for Web Developer role.
@@ -892,6 +927,7 @@ def get_web_developer_data():
     
 # Add dedicated functions for Business Analyst and UI Developer jobs
 
+@_interned_payload
 def get_business_analyst_data():
     """
     Get comprehensive data for Business Analyst role.
@@ -1410,9 +1446,29 @@ def generate_analysis_text(job_title: str, risk_category: str,
         return f"{job_title}s have relatively low displacement risk due to the complexity, creativity, or human elements required in this role. Technology will likely augment rather than replace these positions."
 
 
+# Bound for the search_similar_jobs and get_employment_trend memo caches
+TREND_CACHE_SIZE = 4096
+
+# Sample trend (base employment, annual growth rate) by SOC major group
+_TREND_PARAMS_BY_SOC_GROUP = {
+    "15": (150000, 0.08),   # Computer occupations: 8% annual growth
+    "43": (200000, -0.05),  # Administrative support: 5% annual decline
+}
+_DEFAULT_TREND_PARAMS = (100000, 0.02)  # 2% annual growth
+
+@functools.lru_cache(maxsize=1)
+def _year_in_hour(hour: int) -> int:
+    """The calendar year, looked up once per hour bucket"""
+    return int(time.strftime("%Y"))
+
+def _current_year() -> int:
+    """Current year without formatting the clock on every call; may lag a new year by up to an hour"""
+    return _year_in_hour(int(time.time() // 3600))
+
 def search_similar_jobs(job_title: str, limit: int = 5) -> List[Dict[str, Any]]:
     """
     Find similar jobs based on a job title with their respective risk levels.
+    Results are memoized per (normalized title, limit); each call gets fresh dicts.
     
     Args:
         job_title: The job title to use as a basis for searching
@@ -1421,54 +1477,69 @@ def search_similar_jobs(job_title: str, limit: int = 5) -> List[Dict[str, Any]]:
     Returns:
         List of similar jobs with risk data
     """
+    return [
+        {
+            "job_title": title,
+            "occupation_code": code,
+            "year_1_risk": year_1_risk,
+            "year_5_risk": year_5_risk,
+            "risk_category": risk_category
+        }
+        for title, code, year_1_risk, year_5_risk, risk_category in _similar_job_rows(job_title.strip().casefold(), limit)
+    ]
+
+@functools.lru_cache(maxsize=TREND_CACHE_SIZE)
+def _similar_job_rows(job_title: str, limit: int) -> tuple:
+    """search_similar_jobs as frozen (title, code, year_1, year_5, category) rows; job_title is stripped and casefolded"""
     # This would normally query the BLS API for related occupations
     # For now, return a simplified implementation
     
     # Get occupation matches
     occupation_matches = bls_connector.search_occupations(job_title)
     
+    if not occupation_matches:
+        return ()
+    
     # Get the SOC major group for finding related occupations
-    if occupation_matches:
-        occ_code = occupation_matches[0]["code"]
-        soc_major_group = occ_code.split('-')[0]
-        
-        # Find other occupations in the same major group
-        all_occupations = bls_connector.search_occupations(soc_major_group)
-        
-        # Filter out the original job
-        similar_jobs = [occ for occ in all_occupations 
-                       if occ["title"].lower() != job_title.lower()]
-        
-        # Limit results
-        similar_jobs = similar_jobs[:limit]
-        
-        # Get risk data for each job
-        results = []
-        for job in similar_jobs:
-            # Get basic risk data without full analysis
-            risk_data = calculate_displacement_risk(
-                job_title=job["title"],
-                occ_code=job["code"],
-                occupation_data={"status": "simplified"},
-                projection_data={"projections": {}}
-            )
-            
-            results.append({
-                "job_title": job["title"],
-                "occupation_code": job["code"],
-                "year_1_risk": risk_data["year_1_risk"],
-                "year_5_risk": risk_data["year_5_risk"],
-                "risk_category": risk_data["risk_category"]
-            })
-        
-        return results
+    occ_code = occupation_matches[0]["code"]
+    soc_major_group = occ_code.split('-')[0]
     
-    return []
+    # Find other occupations in the same major group
+    all_occupations = bls_connector.search_occupations(soc_major_group)
+    
+    # Filter out the original job, stopping once limit results are found
+    similar_jobs = list(itertools.islice(
+        (occ for occ in all_occupations if occ["title"].casefold() != job_title), limit))
+    
+    # Get risk data for each job
+    results = []
+    for job in similar_jobs:
+        # Get basic risk data without full analysis
+        risk_data = calculate_displacement_risk(
+            job_title=job["title"],
+            occ_code=job["code"],
+            occupation_data={"status": "simplified"},
+            projection_data={"projections": {}}
+        )
+        
+        results.append((
+            sys.intern(job["title"]),
+            sys.intern(job["code"]),
+            risk_data["year_1_risk"],
+            risk_data["year_5_risk"],
+            sys.intern(risk_data["risk_category"])
+        ))
+    
+    return tuple(results)
+
+search_similar_jobs.cache_clear = _similar_job_rows.cache_clear
+search_similar_jobs.cache_info = _similar_job_rows.cache_info
 
 
 def get_employment_trend(job_title: str, years: int = 5) -> Dict[str, Any]:
     """
     Get historical employment trend for a job.
+    Results are memoized per (lowercased title, years, current year); each call gets a fresh dict.
     
     Args:
         job_title: The job title to analyze
@@ -1477,6 +1548,21 @@ def get_employment_trend(job_title: str, years: int = 5) -> Dict[str, Any]:
     Returns:
         Dictionary with employment trend data
     """
+    trend = _employment_trend(job_title.lower(), years, _current_year())
+    if trend is None:
+        return {"status": "error", "message": "No matching occupation found"}
+    
+    title, occ_code, years_list, employment_values = trend
+    return {
+        "job_title": title,
+        "occupation_code": occ_code,
+        "years": list(years_list),
+        "employment": list(employment_values)
+    }
+
+@functools.lru_cache(maxsize=TREND_CACHE_SIZE)
+def _employment_trend(job_title: str, years: int, current_year: int) -> Optional[tuple]:
+    """get_employment_trend as a frozen (title, code, years, employment) tuple, or None if no occupation matches"""
     # This would normally retrieve historical data from the BLS API
     # For now, return a simplified implementation
     
@@ -1484,7 +1570,7 @@ def get_employment_trend(job_title: str, years: int = 5) -> Dict[str, Any]:
     occupation_matches = bls_connector.search_occupations(job_title)
     
     if not occupation_matches:
-        return {"status": "error", "message": "No matching occupation found"}
+        return None
     
     # Use the best match
     best_match = occupation_matches[0]
@@ -1492,33 +1578,17 @@ def get_employment_trend(job_title: str, years: int = 5) -> Dict[str, Any]:
     
     # In a real implementation, this would query the BLS API for historical data
     # Generate sample data for now
-    current_year = int(time.strftime("%Y"))
     years_list = list(range(current_year - years, current_year + 1))
     
     # Sample employment values with a trend
-    base_employment = 100000
-    growth_rate = 0.02  # 2% annual growth
-    
-    if occ_code.startswith("15"):  # Computer occupations
-        base_employment = 150000
-        growth_rate = 0.08  # 8% annual growth
-    elif occ_code.startswith("43"):  # Administrative support
-        base_employment = 200000
-        growth_rate = -0.05  # 5% annual decline
-    
-    employment_values = []
-    for i, year in enumerate(years_list):
-        employment = int(base_employment * (1 + growth_rate) ** i)
-        employment_values.append(employment)
-    
-    # Create trend data
-    trend_data = {
-        "job_title": best_match["title"],
-        "occupation_code": occ_code,
-        "years": years_list,
-        "employment": employment_values
-    }
+    base_employment, growth_rate = _TREND_PARAMS_BY_SOC_GROUP.get(occ_code[:2], _DEFAULT_TREND_PARAMS)
     
-    return trend_data
+    # Compound growth for every year in one pass; the int64 cast truncates like int()
+    employment_values = (base_employment * np.power(1 + growth_rate, np.arange(len(years_list)))).astype(np.int64)
+    
+    return best_match["title"], occ_code, tuple(years_list), tuple(employment_values.tolist())
+
+get_employment_trend.cache_clear = _employment_trend.cache_clear
+get_employment_trend.cache_info = _employment_trend.cache_info
     
 # Add Web Developer function
@@ -9,7 +9,7 @@ import os
 import json
 import streamlit as st
 from sqlalchemy import create_engine, text
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional
 
 # Cache for storing job titles to minimize database queries
 @st.cache_data(ttl=60)
@@ -131,7 +131,8 @@ def search_job_titles(query: str, limit: int = 10) -> List[Dict[str, Any]]:
     # Return limited results
     return results[:limit]
 
-def job_title_autocomplete(label: str, key: str = "", placeholder: str = "Search for a job title...", help: str = ""):
+def job_title_autocomplete(label: str, key: str = "", placeholder: str = "Search for a job title...", help: str = "",
+                           max_chars: Optional[int] = None):
     """
     Create a job title autocomplete input field - simplified version.
     
@@ -140,6 +141,7 @@ def job_title_autocomplete(label: str, key: str = "", placeholder: str = "Search
         key: Unique key for Streamlit session state
         placeholder: Placeholder text
         help: Help text
+        max_chars: Longest title the input accepts (None for no limit)
         
     Returns:
         Selected job title
@@ -153,7 +155,8 @@ def job_title_autocomplete(label: str, key: str = "", placeholder: str = "Search
         label=label,
         placeholder=placeholder,
         help=help,
-        key=key
+        key=key,
+        max_chars=max_chars
     )
     
     # Search for matching job titles
@@ -3,6 +3,7 @@ Database-only job comparison module.
 Uses ONLY real BLS data from Neon database - no hardcoded job data.
 """
 
+import numpy as np
 import pandas as pd
 import plotly.graph_objects as go
 import plotly.express as px
@@ -22,27 +23,14 @@ def create_comparison_chart(comparison_data):
     """
     Create a comparison chart using real BLS data only.
     """
-    if not comparison_data:
+    df = build_comparison_frame(comparison_data)
+    if df is None:
         return None
     
-    # Handle both dictionary and list formats
-    if isinstance(comparison_data, list):
-        # Convert list to dictionary format
-        valid_jobs = {}
-        for item in comparison_data:
-            if isinstance(item, dict) and "job_title" in item:
-                valid_jobs[item["job_title"]] = item
-    else:
-        # Filter out jobs with errors
-        valid_jobs = {k: v for k, v in comparison_data.items() if "error" not in v}
-    
-    if not valid_jobs:
-        return None
-    
-    # Prepare data for plotting
-    jobs = list(valid_jobs.keys())
-    year_1_risks = [valid_jobs[job].get('year_1_risk', 0) for job in jobs]
-    year_5_risks = [valid_jobs[job].get('year_5_risk', 0) for job in jobs]
+    # Prepare data for plotting (float32 risk columns halve the serialized payload)
+    jobs = df.index.tolist()
+    year_1_risks = df["year_1_risk"].to_numpy()
+    year_5_risks = df["year_5_risk"].to_numpy()
     
     # Create the comparison chart
     fig = go.Figure()
@@ -126,6 +114,44 @@ def create_employment_comparison(comparison_data):
     
     return fig
 
+def build_comparison_frame(comparison_data):
+    """
+    Build a column-major DataFrame (one list per column) indexed by job title.
+    Columns are collected in a single pass instead of handing pandas one dict per row.
+    """
+    if not comparison_data:
+        return None
+    
+    # Handle both dictionary and list formats
+    if isinstance(comparison_data, list):
+        items = ((item["job_title"], item) for item in comparison_data
+                 if isinstance(item, dict) and "job_title" in item)
+    else:
+        items = ((k, v) for k, v in comparison_data.items() if "error" not in v)
+    
+    job_titles, year_1, year_5, employment, growth, wages, categories = [], [], [], [], [], [], []
+    for job, data in items:
+        job_titles.append(job)
+        year_1.append(data.get("year_1_risk") or 0)
+        year_5.append(data.get("year_5_risk") or 0)
+        employment.append(data.get("current_employment") or 0)
+        growth.append(data.get("projected_growth") or data.get("percent_change") or 0)
+        wages.append(data.get("median_wage") or 0)
+        categories.append(data.get("risk_category"))
+    
+    if not job_titles:
+        return None
+    
+    return pd.DataFrame({
+        "job_title": job_titles,
+        "year_1_risk": np.asarray(year_1, dtype=np.float32),
+        "year_5_risk": np.asarray(year_5, dtype=np.float32),
+        "current_employment": employment,
+        "projected_growth": growth,
+        "median_wage": wages,
+        "risk_category": categories
+    }, index=job_titles)
+
 def get_job_data(job_title):
     """Get job data using database-only approach."""
     try:
@@ -135,62 +161,32 @@ def get_job_data(job_title):
         return {"error": f"Data unavailable for {job_title}"}
 
 def create_comparison_table(comparison_data):
-    """Create a comparison table from job data."""
-    if not comparison_data:
-        return None
-    
-    # Handle both dictionary and list formats
-    if isinstance(comparison_data, list):
-        # Convert list to dictionary format
-        valid_jobs = {}
-        for item in comparison_data:
-            if isinstance(item, dict) and "job_title" in item:
-                valid_jobs[item["job_title"]] = item
-    else:
-        valid_jobs = {k: v for k, v in comparison_data.items() if "error" not in v}
-    if not valid_jobs:
+    """
+    Create a comparison table from job data.
+    Values stay numeric so formatting can be left to st.dataframe's column_config.
+    """
+    df = build_comparison_frame(comparison_data)
+    if df is None:
         return None
     
-    df_data = []
-    for job, data in valid_jobs.items():
-        # Handle None values safely
-        current_emp = data.get('current_employment') or 0
-        growth_rate = data.get('projected_growth') or data.get('percent_change') or 0
-        wage = data.get('median_wage') or 0
-        
-        df_data.append({
-            "Job Title": job,
-            "1-Year Risk (%)": data.get("year_1_risk", 0),
-            "5-Year Risk (%)": data.get("year_5_risk", 0),
-            "Current Employment": f"{current_emp:,}" if current_emp else "Data unavailable",
-            "Growth Rate (%)": f"{growth_rate:.1f}%" if growth_rate else "Data unavailable",
-            "Median Wage": f"${wage:,}" if wage else "Data unavailable"
-        })
-    
-    return pd.DataFrame(df_data)
+    table = df[["job_title", "year_1_risk", "year_5_risk",
+                "current_employment", "projected_growth", "median_wage"]].reset_index(drop=True)
+    # Zero means "not reported" in the BLS rows; show those cells as empty
+    for col in ("current_employment", "projected_growth", "median_wage"):
+        table[col] = table[col].where(table[col] != 0)
+    return table
 
 def create_risk_heatmap(comparison_data):
     """Create a risk heatmap from comparison data."""
-    if not comparison_data:
+    df = build_comparison_frame(comparison_data)
+    if df is None:
         return None
     
-    # Handle both dictionary and list formats
-    if isinstance(comparison_data, list):
-        # Convert list to dictionary format
-        valid_jobs = {}
-        for item in comparison_data:
-            if isinstance(item, dict) and "job_title" in item:
-                valid_jobs[item["job_title"]] = item
-    else:
-        valid_jobs = {k: v for k, v in comparison_data.items() if "error" not in v}
-    if not valid_jobs:
-        return None
+    jobs = df.index.tolist()
+    year_1_risks = df["year_1_risk"].to_numpy()
+    year_5_risks = df["year_5_risk"].to_numpy()
     
-    jobs = list(valid_jobs.keys())
-    year_1_risks = [valid_jobs[job].get("year_1_risk", 0) for job in jobs]
-    year_5_risks = [valid_jobs[job].get("year_5_risk", 0) for job in jobs]
-    
-    heatmap_data = [year_1_risks, year_5_risks]
+    heatmap_data = np.vstack([year_1_risks, year_5_risks])
     
     fig = go.Figure(data=go.Heatmap(
         z=heatmap_data,
@@ -206,42 +202,45 @@ def create_risk_heatmap(comparison_data):
     
     return fig
 
+# Beyond this many jobs the radar chart is replaced by a factor heatmap
+RADAR_MAX_JOBS = 3
+
 def create_radar_chart(comparison_data):
-    """Create a radar chart for job comparison."""
-    if not comparison_data:
-        return None
-    
-    # Handle both dictionary and list formats
-    if isinstance(comparison_data, list):
-        # Convert list to dictionary format
-        valid_jobs = {}
-        for item in comparison_data:
-            if isinstance(item, dict) and "job_title" in item:
-                valid_jobs[item["job_title"]] = item
-    else:
-        valid_jobs = {k: v for k, v in comparison_data.items() if "error" not in v}
-    if not valid_jobs:
+    """Create a radar chart for job comparison (a factor heatmap for 4+ jobs)."""
+    df = build_comparison_frame(comparison_data)
+    if df is None:
         return None
     
     fig = go.Figure()
     
-    for job, data in valid_jobs.items():
-        categories = ["AI Risk (1Y)", "AI Risk (5Y)", "Job Growth", "Wage Level"]
-        growth_val = data.get("projected_growth") or data.get("percent_change") or 0
-        wage_val = data.get("median_wage") or 0
-        
-        values = [
-            data.get("year_1_risk", 0),
-            data.get("year_5_risk", 0),
-            min(growth_val * 10, 100),
-            min(wage_val / 1000, 100)
-        ]
-        
+    # Materialize each column once and index by position inside the loop
+    categories = ["AI Risk (1Y)", "AI Risk (5Y)", "Job Growth", "Wage Level"]
+    names = df.index.to_numpy()
+    year_1 = df["year_1_risk"].to_numpy()
+    year_5 = df["year_5_risk"].to_numpy()
+    growth = np.minimum(df["projected_growth"].to_numpy(dtype=np.float32) * 10, 100)
+    wage = np.minimum(df["median_wage"].to_numpy(dtype=np.float32) / 1000, 100)
+    values = np.column_stack([year_1, year_5, growth, wage]).astype(np.float32)
+    
+    # K overlapping filled polygons get expensive to redraw; draw one heatmap trace instead
+    if len(names) > RADAR_MAX_JOBS:
+        fig = px.imshow(
+            values,
+            x=categories,
+            y=list(names),
+            color_continuous_scale="RdYlGn_r",
+            aspect="auto",
+            text_auto=".1f",
+            title="Job Comparison Factor Matrix"
+        )
+        return fig
+    
+    for i in range(len(names)):
         fig.add_trace(go.Scatterpolar(
-            r=values,
+            r=values[i],
             theta=categories,
             fill="toself",
-            name=job
+            name=names[i]
         ))
     
     fig.update_layout(